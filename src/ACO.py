@@ -1,40 +1,30 @@
 # Ant colony optimization
 # Reference: Liu X, Yi H, Ni Z. Application of ant colony optimization algorithm in process planning optimization[J]. Journal of Intelligent Manufacturing, 2013, 24: 1-13.
+import time
 import numpy as np
 from tqdm import tqdm
+import FPP_checkpoint
+import FPP_warmstart
 
 
 def cal_objective(sol, specifications):
     # calculate the objective value
-    objective = specifications['type']['objective']
-    indices = specifications['indices']
+    states = specifications['states']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
+
     obj = 0
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-        for i in range(len(sol) - 1):
-            o1, m1, t1, d1 = sol[i].split('&')
-            _, m2, t2, d2 = sol[i + 1].split('&')
-            if m1 != m2:
-                obj += mcc
-            if m1 != m2 or t1 != t2:
-                obj += tcc
-            if m1 != m2 or d1 != d2:
-                obj += scc
-            obj += indices[o1][sol[i]]
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
-        for i in range(len(sol) - 1):
-            o1, m1, t1, d1 = sol[i].split('&')
-            _, m2, t2, d2 = sol[i + 1].split('&')
-            if m1 != m2:
-                obj += mct[m1][m2]
-            if m1 != m2 or t1 != t2:
-                obj += tct
-            if m1 != m2 or d1 != d2:
-                obj += sct
-            obj += indices[o1][sol[i]]
-    o2 = sol[-1].split('&')[0]
-    obj += indices[o2][sol[-1]]
+    for i in range(len(sol) - 1):
+        _, m1, t1, d1, usage = states[sol[i]]
+        _, m2, t2, d2, _ = states[sol[i + 1]]
+        if m1 != m2:
+            obj += mc[m1][m2]
+        if m1 != m2 or t1 != t2:
+            obj += tc
+        if m1 != m2 or d1 != d2:
+            obj += sc
+        obj += usage
+    obj += states[sol[-1]][4]
     return obj
 
 
@@ -50,7 +40,8 @@ def cal_precedence(precedence):
     return p
 
 
-def main(npop, maxFE, rho, W, alpha, beta, tau0, specifications):
+def main(npop, maxFE, rho, W, alpha, beta, tau0, specifications, checkpoint=None, checkpoint_interval=60, resume=False,
+         callback=None, init=None):
     """
     The main function.
     :param npop: population size (default = 100)
@@ -61,19 +52,25 @@ def main(npop, maxFE, rho, W, alpha, beta, tau0, specifications):
     :param beta: heuristic importance (default = 2)
     :param tau0: initial pheromone value (default = 100)
     :param specifications: the specifications of FPP
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param callback: called as callback(objective, plan, FE, elapsed time) with each new incumbent, and with
+        objective = plan = None at the start of each iteration; the search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case), which set the incumbent
+        and lay pheromone along their transitions after repair (None: a uniform pheromone)
     :return:
     """
-    objective = specifications['type']['objective']
+    start = time.perf_counter()  # the start time of the solve
     operations = specifications['operations']
     alternatives = specifications['alternatives']
     alternative_operations = specifications['alternative_operations']
     indices = specifications['indices']
     op2ind = specifications['op2ind']
     ind2op = specifications['ind2op']
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
+    states = specifications['states']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
 
     # Step 1. Initialization
     nops_all = len(operations)  # the number of operations
@@ -99,10 +96,32 @@ def main(npop, maxFE, rho, W, alpha, beta, tau0, specifications):
     gbest = float('inf')  # the global best
     gbest_sol = None  # the global best solution
     conFE = 0  # convergence function evaluation
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'ACO', specifications, checkpoint_interval)
+    state = checkpointer.load('tau', 'FE', 'gbest', 'gbest_sol', 'conFE') if resume else None
+    if state is not None:
+        tau, FE, gbest, gbest_sol, conFE = state
+    else:
+        for temp_sol in FPP_warmstart.initial_plans(init, specifications, npop):
+            temp_obj = cal_objective(temp_sol, specifications)
+            FE += 1
+            for j in range(nops - 1):
+                tau[CO2ind[temp_sol[j]], CO2ind[temp_sol[j + 1]]] += W / temp_obj
+            if temp_obj < gbest:
+                gbest = temp_obj
+                gbest_sol = temp_sol.copy()
+                conFE = FE
+    stopped = False  # whether the callback has stopped the search
+    if callback is not None and gbest_sol is not None:
+        stopped = callback(gbest, gbest_sol, FE, time.perf_counter() - start)
 
     # Step 2. Optimization
-    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval") as pbar:
-        while FE <= maxFE:
+    lower_bound = specifications.get('lower_bound', -float('inf'))  # the search stops once the lower bound is reached
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE and gbest > lower_bound and not stopped:
+            if checkpointer.due():
+                checkpointer.save(tau=tau, FE=FE, gbest=gbest, gbest_sol=gbest_sol, conFE=conFE)
+            if callback is not None and callback(None, None, FE, time.perf_counter() - start):
+                break
 
             # Step 2.1. Generate new solutions
             sols = []  # solutions
@@ -123,24 +142,15 @@ def main(npop, maxFE, rho, W, alpha, beta, tau0, specifications):
                         temp_sol.append(np.random.choice(VN))
                     else:
                         probability = np.zeros(len(VN))
-                        o1, m1, t1, d1 = co.split('&')
+                        _, m1, t1, d1, _ = states[co]
                         for i in range(len(VN)):
-                            o2, m2, t2, d2 = VN[i].split('&')
-                            cost = indices[o2][VN[i]]
-                            if objective == 'cost':
-                                if m1 != m2:
-                                    cost += mcc
-                                if m1 != m2 or t1 != t2:
-                                    cost += tcc
-                                if m1 != m2 or d1 != d2:
-                                    cost += scc
-                            else:
-                                if m1 != m2:
-                                    cost += mct[m1][m2]
-                                if m1 != m2 or t1 != t2:
-                                    cost += tct
-                                if m1 != m2 or d1 != d2:
-                                    cost += sct
+                            _, m2, t2, d2, cost = states[VN[i]]
+                            if m1 != m2:
+                                cost += mc[m1][m2]
+                            if m1 != m2 or t1 != t2:
+                                cost += tc
+                            if m1 != m2 or d1 != d2:
+                                cost += sc
                             heuristic = 1 / cost
                             pheromone = tau[CO2ind[co], CO2ind[VN[i]]]
                             probability[i] = pheromone ** alpha * heuristic ** beta
@@ -169,6 +179,11 @@ def main(npop, maxFE, rho, W, alpha, beta, tau0, specifications):
                     gbest = temp_obj
                     gbest_sol = temp_sol.copy()
                     conFE = FE
+                    if callback is not None and callback(gbest, gbest_sol, FE, time.perf_counter() - start):
+                        stopped = True
+                        break
+            if stopped:
+                break
 
             # Step 2.2. Update pheromone
             tau *= (1 - rho)
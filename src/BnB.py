@@ -0,0 +1,169 @@
+# The branch-and-bound (BnB) for medium flexible process planning problems
+# A node is a feasible prefix of performed operations (one per slot: a mandatory operation or an alternative group),
+# resolved as in the DP (an alternative prior not yet performed is excluded from its group). The cheapest resource
+# assignment of the prefix ending on each (machine, tool, direction) triple is propagated operation by operation as in
+# the layered DP, and a node is pruned when its cheapest prefix plus the minimum usages and the minimum changeovers of
+# the unscheduled slots (FPP_bounds) cannot beat the incumbent, or when the explored prefixes with the same resolved
+# operations are no more expensive on every triple, or to enter every next triple (dominance).
+import time
+import numpy as np
+from tqdm import tqdm
+import FPP_bounds
+import FPP_warmstart
+from DP import construct_units, advance, changeover_costs, changeover_matrix, cal_enter
+
+
+def reconstruct_plan(path, op_states, matrix):
+    # recover the process plan from the operations of a complete prefix and the costs after each of them
+    col = int(np.argmin(path[-1][1]))
+    plan = []
+    for k in range(len(path) - 1, -1, -1):
+        i, _ = path[k]
+        plan.append(op_states[i][col][1])
+        if k:
+            col = int(np.argmin(path[k - 1][1] + matrix[:, col]))
+    plan.reverse()
+    return plan
+
+
+def main(specifications, incumbent_FE=0, max_nodes=None, time_limit=None, max_dominance=1000000, callback=None,
+         init=None):
+    """
+    The main function.
+    :param specifications: the specifications of FPP
+    :param incumbent_FE: the function evaluations of a TS-VNS run whose result is the initial upper bound (0: none)
+    :param max_nodes: the maximum number of nodes (None: unlimited)
+    :param time_limit: the maximum runtime in seconds (None: unlimited)
+    :param max_dominance: the maximum number of prefixes stored for the dominance check
+    :param callback: called as callback(objective, plan, nodes, elapsed time) with each new incumbent, and with
+        objective = plan = None every 1000 nodes; the search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case), which start the TS-VNS
+        run, or else whose best repaired plan is the initial upper bound (None: none)
+    :return: the best objective, the best process plan, the number of explored nodes, and whether the best objective is
+        optimal (the search was complete)
+    """
+    # Step 1. Initialization
+    solve_start = time.perf_counter()  # the start time of the solve
+    units, triples, op_states = construct_units(specifications)
+    slots = units['slots']
+    nslots = len(slots)
+    grid, shape, mc, tc, sc = changeover_costs(triples, specifications)
+    matrix = changeover_matrix(triples, specifications)
+    op_usages = np.full((len(op_states), len(triples)), np.inf)  # the usage of each operation on each triple
+    for i, states in enumerate(op_states):
+        op_usages[i, list(states)] = [usage for usage, _ in states.values()]
+    min_usages = [FPP_bounds.min_usage(slot, specifications) for slot in slots]  # the minimum usage of each slot
+    slot_candidates = [FPP_bounds.run_candidates(slot, specifications) for slot in slots]
+    changeover_bounds = {}  # the minimum changeovers of each set of unscheduled slots (a bitmask of the slots)
+
+    def remaining_changeover(unscheduled):
+        if unscheduled not in changeover_bounds:
+            changeover_bounds[unscheduled] = FPP_bounds.changeover_bound(
+                [candidates for j, candidates in enumerate(slot_candidates) if unscheduled >> j & 1], specifications)
+        return changeover_bounds[unscheduled]
+
+    lower_bound = specifications.get('lower_bound', -float('inf'))
+    search = {
+        'best_obj': float('inf'),  # the incumbent
+        'best_plan': None,
+        'best_path': None,  # the (operation, costs) of the incumbent prefix found by the search
+        'nodes': 0,  # the number of explored nodes
+        'complete': True,  # whether the search has not been stopped by a limit
+        'dominance': {},  # the elementwise minimum costs of the explored prefixes of each set of resolved operations
+        'entered': {},  # the elementwise minimum costs of entering each triple after them
+    }
+
+    # Step 2. The initial upper bound
+    import ACO
+    if incumbent_FE:
+        import TS_VNS
+        # the plan of TS-VNS (which orders an alternative group by the priors of one of its operations) is repaired to
+        # the priors of its performed operations before it bounds the search
+        _, plan, _ = TS_VNS.main(incumbent_FE, specifications, init=init)
+        search['best_plan'] = FPP_warmstart.repair_plan(plan, specifications)
+        search['best_obj'] = ACO.cal_objective(search['best_plan'], specifications)
+    elif init:
+        for plan in FPP_warmstart.initial_plans(init, specifications, len(init)):
+            obj = ACO.cal_objective(plan, specifications)  # the objective of a process plan
+            if obj < search['best_obj']:
+                search['best_obj'], search['best_plan'] = obj, plan
+    if search['best_plan'] is not None and callback is not None and \
+            callback(search['best_obj'], search['best_plan'], 0, time.perf_counter() - solve_start):
+        search['complete'] = False
+    start = time.perf_counter()
+
+    # Step 3. Depth-first search
+    def branch(mask, unscheduled, values, path, remaining, pbar):
+        search['nodes'] += 1
+        if search['nodes'] % 1000 == 0:
+            pbar.update(1000)
+            pbar.set_postfix(best=search['best_obj'])
+            if (max_nodes and search['nodes'] >= max_nodes) or (time_limit and time.perf_counter() - start >= time_limit):
+                search['complete'] = False
+            if callback is not None and callback(None, None, search['nodes'], time.perf_counter() - solve_start):
+                search['complete'] = False
+        if len(path) == nslots:
+            obj = values.min()
+            if obj < search['best_obj']:
+                search['best_obj'] = obj
+                search['best_path'] = list(path)
+                if callback is not None:
+                    plan = reconstruct_plan(path, op_states, matrix)
+                    if callback(float(obj), plan, search['nodes'], time.perf_counter() - solve_start):
+                        search['complete'] = False
+            return
+        enter = np.zeros(len(triples)) if not path else cal_enter(values[None], grid, shape, mc, tc, sc)[0]
+        # the completions of a prefix depend on its resolved operations and the costs of entering the next triple only,
+        # so a prefix is dominated once the explored prefixes of the same operations are no more expensive to leave
+        entered = search['entered'].get(mask)
+        if entered is not None:
+            if np.all(entered <= enter):
+                return
+            search['entered'][mask] = np.minimum(entered, enter)
+        elif len(search['entered']) < max_dominance:
+            search['entered'][mask] = enter
+        all_values = enter + op_usages  # the costs after each operation on each triple
+        all_mins = all_values.min(axis=1).tolist()
+        # the changeovers after the next operation are bounded by the runs of the unscheduled slots, with or without it
+        changeover = remaining_changeover(unscheduled)
+        children = []
+        for i in range(len(units['ops'])):
+            valid, child_mask = advance(mask, i, units)
+            if not valid:
+                continue
+            child_unscheduled = unscheduled & ~(1 << units['slot'][i])
+            bound = all_mins[i] + remaining - min_usages[units['slot'][i]] + \
+                max(changeover, remaining_changeover(child_unscheduled))
+            if bound >= search['best_obj']:
+                continue
+            child_values = all_values[i]
+            dominated = search['dominance'].get(child_mask)
+            if dominated is not None:
+                if np.all(dominated <= child_values):
+                    continue
+                search['dominance'][child_mask] = np.minimum(dominated, child_values)
+            elif len(search['dominance']) < max_dominance:
+                search['dominance'][child_mask] = child_values
+            children.append((bound, i, child_mask, child_unscheduled, child_values))
+        children.sort(key=lambda child: child[0])
+        for bound, i, child_mask, child_unscheduled, child_values in children:
+            if not search['complete'] or search['best_obj'] <= lower_bound:
+                return
+            if bound >= search['best_obj']:
+                continue
+            path.append((i, child_values))
+            branch(child_mask, child_unscheduled, child_values, path, remaining - min_usages[units['slot'][i]], pbar)
+            path.pop()
+
+    with tqdm(desc="BnB Progress", unit="node") as pbar:
+        if search['complete']:
+            branch(0, (1 << nslots) - 1, np.zeros(len(triples)), [], sum(min_usages), pbar)
+
+    # Step 4. The result
+    best_obj, best_plan = search['best_obj'], search['best_plan']
+    if search['best_path'] is not None:
+        best_plan = reconstruct_plan(search['best_path'], op_states, matrix)
+        best_obj = float(best_obj)
+        if specifications['type']['objective'] == 'cost' and best_obj.is_integer():
+            best_obj = int(best_obj)
+    return best_obj, best_plan, search['nodes'], search['complete']
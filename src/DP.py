@@ -0,0 +1,203 @@
+# The exact dynamic programming (DP) for small flexible process planning problems
+# The operations are performed slot by slot (a slot is a mandatory operation or an alternative group). The precedence
+# constraints bind the performed operations only: an operation follows its performed priors, and a prior that is an
+# alternative operation not yet performed is excluded from its group (it can no longer be chosen). The DP state is the
+# set of resolved operations (a bitmask: performed, excluded, or in the group of a performed operation) and the
+# (machine, tool, direction) triple of the last state, and each layer of states with the same number of performed slots
+# is stored as a NumPy array (one row per bitmask, one column per triple).
+import numpy as np
+from tqdm import tqdm
+import FPP_bounds
+
+
+def construct_units(specifications):
+    # the bitmasks of each operation (the bit of the i-th operation is 1 << i): its mandatory priors, its alternative
+    # priors outside its group, its group (resolved once it is performed), and the groups of its alternative priors;
+    # the slot of each operation, the resource triples, and the cheapest state of each operation on each triple
+    operations = specifications['operations']
+    indices = specifications['indices']
+    states_info = specifications['states']
+    op2ind = specifications['op2ind']
+    ops = list(operations)
+    slots = FPP_bounds.slots(specifications)
+    op2slot = {op: idx for idx, slot in enumerate(slots) for op in slot}
+    group = {op: sum(1 << op2ind[alt_op] for alt_op in slot) for slot in slots for op in slot}
+    units = {'ops': ops, 'slots': slots, 'slot': [op2slot[op] for op in ops], 'required': [], 'optional': [],
+             'group': [group[op] for op in ops], 'guards': []}
+    for op in ops:
+        required = optional = 0
+        guards = set()
+        for prior_op in operations[op].prior:
+            if op2slot[prior_op] == op2slot[op]:
+                continue  # an alternative of the operation itself is never performed with it
+            if len(slots[op2slot[prior_op]]) == 1:
+                required |= 1 << op2ind[prior_op]
+            else:
+                optional |= 1 << op2ind[prior_op]
+                guards.add(group[prior_op])
+        units['required'].append(required)
+        units['optional'].append(optional)
+        units['guards'].append(sorted(guards))
+    triples = {}  # the column of each (machine, tool, direction) triple of resource indices
+    op_states = []  # the (usage, state) of the cheapest state of each operation on each column
+    for op in ops:
+        states = {}
+        for state, usage in indices[op].items():
+            _, m, t, d, _ = states_info[state]
+            col = triples.setdefault((m, t, d), len(triples))
+            if col not in states or usage < states[col][0]:
+                states[col] = (usage, state)
+        op_states.append(states)
+    return units, list(triples), op_states
+
+
+def advance(masks, i, units):
+    # the bitmasks after performing the i-th operation (masks: a bitmask or an array of them), and whether it can be
+    # performed: it is unresolved, its mandatory priors are performed, and the exclusion of its alternative priors that
+    # are not yet resolved leaves an operation in each of their groups
+    new_masks = masks | units['group'][i] | units['optional'][i]
+    valid = (masks >> i & 1 == 0) & (masks & units['required'][i] == units['required'][i])
+    for group in units['guards'][i]:
+        valid &= (masks & group == group) | (new_masks & group != group)
+    return valid, new_masks
+
+
+def changeover_costs(triples, specifications):
+    # the grid of the triples, the machine change costs, the tool change cost, and the setup change cost
+    machines = sorted({triple[0] for triple in triples})
+    tools = sorted({triple[1] for triple in triples})
+    directions = sorted({triple[2] for triple in triples})
+    shape = (len(machines), len(tools), len(directions))
+    grid = np.array([np.ravel_multi_index((machines.index(m), tools.index(t), directions.index(d)), shape)
+                     for (m, t, d) in triples])
+    changeover = specifications['changeover']
+    mc = np.array(changeover['machine'], dtype=float)[np.ix_(machines, machines)]  # mc[i, j]: machine i -> machine j
+    np.fill_diagonal(mc, np.inf)  # no machine change
+    return grid, shape, mc, changeover['tool'], changeover['setup']
+
+
+def changeover_matrix(triples, specifications):
+    # the changeover cost between every two triples
+    grid, shape, mc, tc, sc = changeover_costs(triples, specifications)
+    m, t, d = np.unravel_index(grid, shape)
+    matrix = np.where(m[:, None] != m[None, :], mc[m[:, None], m[None, :]] + tc + sc, 0.0)
+    matrix += np.where((m[:, None] == m[None, :]) & (t[:, None] != t[None, :]), tc, 0)
+    matrix += np.where((m[:, None] == m[None, :]) & (d[:, None] != d[None, :]), sc, 0)
+    return matrix
+
+
+def cal_enter(values, grid, shape, mc, tc, sc, chunk=1000000):
+    # the minimum cost (the last cost plus the changeover) of entering each triple after each row of values
+    n = len(values)
+    enter = np.empty_like(values)
+    rows = max(1, chunk // int(np.prod(shape)))
+    for start in range(0, n, rows):
+        block = values[start: start + rows]
+        dense = np.full((len(block),) + shape, np.inf)
+        dense.reshape(len(block), -1)[:, grid] = block
+        same = np.minimum(dense, dense.min(axis=3, keepdims=True) + sc)  # the same machine and tool
+        same = np.minimum(same, dense.min(axis=2, keepdims=True) + tc)  # the same machine and direction
+        vm = dense.min(axis=(2, 3))  # the minimum cost on each machine
+        same = np.minimum(same, (vm + tc + sc)[:, :, None, None])  # the same machine
+        cross = (vm[:, :, None] + mc[None]).min(axis=1) + tc + sc  # a different machine
+        enter[start: start + rows] = np.minimum(same, cross[:, :, None, None]).reshape(len(block), -1)[:, grid]
+    return enter
+
+
+def backtrack(layers, units, op_states, matrix):
+    # recover the process plan of the best final state from the stored layers
+    masks, values = layers[-1]
+    row, col = 0, int(np.argmin(values[0]))
+    value = values[row, col]
+    plan = []
+    for k in range(len(layers) - 1, 0, -1):
+        prev_masks, prev_values = layers[k - 1]
+        mask = layers[k][0][row]
+        for i in range(len(units['ops'])):
+            if not mask >> i & 1 or col not in op_states[i]:
+                continue
+            valid, new_masks = advance(prev_masks, i, units)
+            usage, state = op_states[i][col]
+            for prev_row in np.flatnonzero(valid & (new_masks == mask)).tolist():
+                costs = np.zeros(matrix.shape[0]) if k == 1 else prev_values[prev_row] + matrix[:, col]
+                prev_col = int(np.argmin(costs))
+                if np.isclose(costs[prev_col] + usage, value):
+                    break
+            else:
+                continue
+            plan.append(state)
+            row, col, value = prev_row, prev_col, prev_values[prev_row, prev_col]
+            break
+    plan.reverse()
+    return plan
+
+
+def main(specifications, memory_limit=1024):
+    """
+    The main function.
+    :param specifications: the specifications of FPP
+    :param memory_limit: the memory budget of the stored layers (MB); once a layer exceeds its share, only the bitmasks
+        with the smallest costs are kept (a beam), and the result is no longer guaranteed to be optimal (an optimal
+        result is recorded as the lower bound of the specifications)
+    :return: the best objective, the best process plan, the number of expanded bitmasks, and whether the best objective
+        is optimal (the layers were not pruned)
+    """
+    # Step 1. Initialization
+    units, triples, op_states = construct_units(specifications)
+    nops = len(units['ops'])
+    nslots = len(units['slots'])
+    if nops > 62:
+        raise ValueError('The DP supports at most 62 operations.')
+    grid, shape, mc, tc, sc = changeover_costs(triples, specifications)
+    op_cols = [np.array(list(states), dtype=np.int64) for states in op_states]
+    op_usages = [np.array([usage for usage, _ in states.values()], dtype=float) for states in op_states]
+    budget = memory_limit * 1024 * 1024
+    used = 0  # the memory of the stored layers
+    exact = True  # whether no layer has been pruned
+    layers = [(np.zeros(1, dtype=np.int64), np.zeros((1, len(triples))))]
+    nmasks = 1  # the number of expanded bitmasks
+
+    # Step 2. Forward DP layer by layer
+    with tqdm(total=nslots, desc="DP Progress", unit="layer") as pbar:
+        for k in range(nslots):
+            masks, values = layers[-1]
+            enter = np.zeros_like(values) if k == 0 else cal_enter(values, grid, shape, mc, tc, sc)
+            new_masks, new_values, new_cols = [], [], []
+            for i in range(nops):
+                valid, next_masks = advance(masks, i, units)
+                idx = np.flatnonzero(valid)
+                if len(idx):
+                    new_masks.append(next_masks[idx])
+                    new_values.append(enter[idx][:, op_cols[i]] + op_usages[i])
+                    new_cols.append(op_cols[i])
+            if not new_masks:
+                raise ValueError('The precedence constraints of the operations are cyclic.')
+            uniq, inverse = np.unique(np.concatenate(new_masks), return_inverse=True)
+            layer_values = np.full((len(uniq), len(triples)), np.inf)
+            offset = 0
+            for op_masks, op_values, cols in zip(new_masks, new_values, new_cols):
+                # the bitmasks reached by one operation may coincide (they differ only in the excluded priors)
+                rows = inverse[offset: offset + len(op_masks)]
+                np.minimum.at(layer_values, (rows[:, None], cols[None, :]), op_values)
+                offset += len(op_masks)
+
+            # prune the layer to its share of the remaining memory budget
+            capacity = max(1, (budget - used) // ((nslots - k) * layer_values.shape[1] * 8))
+            if len(uniq) > capacity:
+                keep = np.sort(np.argpartition(layer_values.min(axis=1), capacity - 1)[: capacity])
+                uniq, layer_values = uniq[keep], layer_values[keep]
+                exact = False
+            layers.append((uniq, layer_values))
+            used += uniq.nbytes + layer_values.nbytes
+            nmasks += len(uniq)
+            pbar.update(1)
+            pbar.set_postfix(bitmasks=len(uniq), memory=format(used / 1024 / 1024, '.1f') + 'MB')
+
+    # Step 3. Backtracking
+    best_obj = float(layers[-1][1][0].min())
+    best_plan = backtrack(layers, units, op_states, changeover_matrix(triples, specifications))
+    if specifications['type']['objective'] == 'cost' and best_obj.is_integer():
+        best_obj = int(best_obj)
+    if not exact:
+        tqdm.write('The memory budget was exceeded: the layers were pruned and the result may not be optimal.')
+    return best_obj, best_plan, nmasks, exact
@@ -1,46 +1,66 @@
 # Edge selection genetic algorithm (ESGA)
 # Reference: Su Y, Chu X, Chen D, et al. A genetic algorithm for operation sequencing in CAPP using edge selection based encoding strategy[J]. Journal of Intelligent Manufacturing, 2018, 29: 313-332.
-import copy
+import time
 import numpy as np
 from tqdm import tqdm
+import FPP_checkpoint
+import FPP_warmstart
 
 
 def cal_objective(sol, specifications):
     # calculate the objective value
-    objective = specifications['type']['objective']
-    indices = specifications['indices']
+    states = specifications['states']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
 
     obj = 0
     n = len(sol['operation'])
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-        for i in range(n - 1):
-            o1, m1, t1, d1 = sol['operation'][i], sol['machine'][i], sol['tool'][i], sol['direction'][i]
-            m2, t2, d2 = sol['machine'][i + 1], sol['tool'][i + 1], sol['direction'][i + 1]
-            if m1 != m2:
-                obj += mcc
-            if m1 != m2 or t1 != t2:
-                obj += tcc
-            if m1 != m2 or d1 != d2:
-                obj += scc
-            obj += indices[o1][o1 + '&' + m1 + '&' + t1 + '&' + d1]
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
-        for i in range(n - 1):
-            o1, m1, t1, d1 = sol['operation'][i], sol['machine'][i], sol['tool'][i], sol['direction'][i]
-            m2, t2, d2 = sol['machine'][i + 1], sol['tool'][i + 1], sol['direction'][i + 1]
-            if m1 != m2:
-                obj += mct[m1][m2]
-            if m1 != m2 or t1 != t2:
-                obj += tct
-            if m1 != m2 or d1 != d2:
-                obj += sct
-            obj += indices[o1][o1 + '&' + m1 + '&' + t1 + '&' + d1]
-    o2, m2, t2, d2 = sol['operation'][-1], sol['machine'][-1], sol['tool'][-1], sol['direction'][-1]
-    obj += indices[o2][o2 + '&' + m2 + '&' + t2 + '&' + d2]
+    resources = [states[sol['operation'][i] + '&' + sol['machine'][i] + '&' + sol['tool'][i] + '&' + sol['direction'][i]] for i in range(n)]
+    for i in range(n - 1):
+        _, m1, t1, d1, usage = resources[i]
+        _, m2, t2, d2, _ = resources[i + 1]
+        if m1 != m2:
+            obj += mc[m1][m2]
+        if m1 != m2 or t1 != t2:
+            obj += tc
+        if m1 != m2 or d1 != d2:
+            obj += sc
+        obj += usage
+    obj += resources[-1][4]
     return obj
 
 
+def cal_partial_cost(sol, positions, specifications):
+    # calculate the usages at the given positions and the changeovers of the adjacent pairs involving them
+    states = specifications['states']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
+    n = len(sol['operation'])
+    resources = {}
+    for i in {j for p in positions for j in (p - 1, p, p + 1) if 0 <= j < n}:
+        resources[i] = states[sol['operation'][i] + '&' + sol['machine'][i] + '&' + sol['tool'][i] + '&' + sol['direction'][i]]
+    cost = 0
+    for i in {j for p in positions for j in (p - 1, p) if 0 <= j < n - 1}:
+        _, m1, t1, d1, _ = resources[i]
+        _, m2, t2, d2, _ = resources[i + 1]
+        if m1 != m2:
+            cost += mc[m1][m2]
+        if m1 != m2 or t1 != t2:
+            cost += tc
+        if m1 != m2 or d1 != d2:
+            cost += sc
+    for p in positions:
+        cost += resources[p][4]
+    return cost
+
+
+def cal_delta_objective(parent, parent_obj, child, positions, specifications):
+    # calculate the objective value of child from that of parent, which differ only at the given positions (delta evaluation)
+    if 4 * len(positions) > len(child['operation']):
+        return cal_objective(child, specifications)
+    return parent_obj - cal_partial_cost(parent, positions, specifications) + cal_partial_cost(child, positions, specifications)
+
+
 def cal_precedence(precedence):
     # calculate the precedence constraint satisfaction status
     nops_all = len(precedence)
@@ -53,6 +73,28 @@ def cal_precedence(precedence):
     return p
 
 
+def copy_solution(sol):
+    # copy the chromosomes of a solution (the genes are immutable, so a deep copy is not needed)
+    return {key: chromosome.copy() for key, chromosome in sol.items()}
+
+
+def decode_solution(sol):
+    # the process plan of a solution
+    plan = []
+    for i in range(len(sol['operation'])):
+        plan.append(sol['operation'][i] + '&' + sol['machine'][i] + '&' + sol['tool'][i] + '&' + sol['direction'][i])
+    return plan
+
+
+def encode_plan(plan):
+    # the solution of a process plan
+    sol = {'operation': [], 'machine': [], 'tool': [], 'direction': []}
+    for state in plan:
+        for key, name in zip(('operation', 'machine', 'tool', 'direction'), state.split('&')):
+            sol[key].append(name)
+    return sol
+
+
 def tournament_selection(sols, objs, tournament_size=2):
     # tournament selection
     tournament_contestants = np.random.choice(range(len(sols)), tournament_size, replace=False)
@@ -63,7 +105,7 @@ def tournament_selection(sols, objs, tournament_size=2):
 def crossover(sol1, sol2):
     # crossover
     op1, op2 = sol1['operation'], sol2['operation']
-    new_sol1, new_sol2 = copy.deepcopy(sol1), copy.deepcopy(sol2)
+    new_sol1, new_sol2 = copy_solution(sol1), copy_solution(sol2)
     length = len(op1)
     i1 = np.random.randint(0, length - 1)
     j1 = np.random.randint(i1 + 1, length)
@@ -85,15 +127,16 @@ def crossover(sol1, sol2):
             new_sol2['tool'][idx2] = sol1['tool'][i]
             new_sol2['direction'][idx2] = sol1['direction'][i]
             idx2 += 1
-    return new_sol1, new_sol2
+    return new_sol1, new_sol2, set(range(i1, j1)), set(range(i2, j2))
 
 
 def mutation(sol, specifications):
     operations = specifications['operations']
 
-    # mutation
+    # mutation (the changed positions are returned for delta evaluation)
     n = len(sol['operation'])
-    new_sol = copy.deepcopy(sol)
+    new_sol = copy_solution(sol)
+    positions = set()
     for i in range(n - 1):
         op1, op2 = sol['operation'][i], sol['operation'][i + 1]
         if sol['machine'][i] in operations[op2].machine:
@@ -103,10 +146,14 @@ def mutation(sol, specifications):
                 new_sol['tool'][i + 1] = sol['tool'][i]
             if sol['direction'][i] in operations[op2].direction:
                 new_sol['direction'][i + 1] = sol['direction'][i]
-    return new_sol
+        if (new_sol['machine'][i + 1] != sol['machine'][i + 1] or new_sol['tool'][i + 1] != sol['tool'][i + 1] or
+                new_sol['direction'][i + 1] != sol['direction'][i + 1]):
+            positions.add(i + 1)
+    return new_sol, positions
 
 
-def main(npop, maxFE, pc, pm, specifications):
+def main(npop, maxFE, pc, pm, specifications, checkpoint=None, checkpoint_interval=60, resume=False,
+         callback=None, init=None):
     """
     The main function.
     :param npop: population size (default = 150)
@@ -114,8 +161,16 @@ def main(npop, maxFE, pc, pm, specifications):
     :param pc: crossover probability (default = 0.8)
     :param pm: mutation probability (default = 0.2)
     :param specifications: the specifications of FPP
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param callback: called as callback(objective, plan, FE, elapsed time) with each new incumbent, and with
+        objective = plan = None at the start of each iteration; the search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case), which seed the population
+        after repair (None: a random population)
     :return:
     """
+    start = time.perf_counter()  # the start time of the solve
     operations = specifications['operations']
     alternatives = specifications['alternatives']
     alternative_operations = specifications['alternative_operations']
@@ -144,70 +199,88 @@ def main(npop, maxFE, pc, pm, specifications):
     q = u * v  # the qualification status
 
     # Step 2. Initial solutions
-    for _ in range(npop):
-        operation_chromosome = []
-        machine_chromosome = []
-        tool_chromosome = []
-        direction_chromosome = []
-        temp_p = precedence.copy()
-        temp_v = v.copy()
-        temp_q = q.copy()
-        for k in range(nops):
-            cs = np.where(temp_q == 1)[0]  # the candidate set
-            temp_op_ind = np.random.choice(cs)
-            temp_op = ind2op[temp_op_ind]  # the selected operation
-            temp_m = np.random.choice(operations[temp_op].machine)  # the selected machine
-            temp_t = np.random.choice(operations[temp_op].tool)  # the selected tool
-            temp_d = np.random.choice(operations[temp_op].direction)  # the selected direction
-            temp_p[temp_op_ind] = 0
-            temp_v[temp_op_ind] = 0
-            if temp_op in alternative_operations:
-                for alt in alternative_operations[temp_op]:
-                    alt_ind = op2ind[alt]
-                    temp_p[alt_ind] = 0
-                    temp_v[alt_ind] = 0
-            temp_u = cal_precedence(temp_p)
-            temp_q = temp_u * temp_v
-            operation_chromosome.append(temp_op)
-            machine_chromosome.append(temp_m)
-            tool_chromosome.append(temp_t)
-            direction_chromosome.append(temp_d)
-        temp_sol = {
-            'operation': operation_chromosome,
-            'machine': machine_chromosome,
-            'tool': tool_chromosome,
-            'direction': direction_chromosome,
-        }
-        sols.append(temp_sol.copy())
-        objs.append(cal_objective(temp_sol, specifications))
-    FE += npop
-    gbest = min(objs)  # the global best
-    gbest_sol = sols[objs.index(gbest)].copy()  # the global best solution
-    conFE = FE  # the convergence function evaluation
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'ESGA', specifications, checkpoint_interval)
+    state = checkpointer.load('sols', 'objs', 'gbest', 'gbest_sol', 'FE', 'conFE') if resume else None
+    if state is None:
+        sols = [encode_plan(plan) for plan in FPP_warmstart.initial_plans(init, specifications, npop)]
+        for _ in range(npop - len(sols)):
+            operation_chromosome = []
+            machine_chromosome = []
+            tool_chromosome = []
+            direction_chromosome = []
+            temp_p = precedence.copy()
+            temp_v = v.copy()
+            temp_q = q.copy()
+            for k in range(nops):
+                cs = np.where(temp_q == 1)[0]  # the candidate set
+                temp_op_ind = np.random.choice(cs)
+                temp_op = ind2op[temp_op_ind]  # the selected operation
+                temp_m = np.random.choice(operations[temp_op].machine)  # the selected machine
+                temp_t = np.random.choice(operations[temp_op].tool)  # the selected tool
+                temp_d = np.random.choice(operations[temp_op].direction)  # the selected direction
+                temp_p[temp_op_ind] = 0
+                temp_v[temp_op_ind] = 0
+                if temp_op in alternative_operations:
+                    for alt in alternative_operations[temp_op]:
+                        alt_ind = op2ind[alt]
+                        temp_p[alt_ind] = 0
+                        temp_v[alt_ind] = 0
+                temp_u = cal_precedence(temp_p)
+                temp_q = temp_u * temp_v
+                operation_chromosome.append(temp_op)
+                machine_chromosome.append(temp_m)
+                tool_chromosome.append(temp_t)
+                direction_chromosome.append(temp_d)
+            temp_sol = {
+                'operation': operation_chromosome,
+                'machine': machine_chromosome,
+                'tool': tool_chromosome,
+                'direction': direction_chromosome,
+            }
+            sols.append(temp_sol.copy())
+        objs = [cal_objective(sol, specifications) for sol in sols]
+        FE += npop
+        gbest = min(objs)  # the global best
+        gbest_sol = sols[objs.index(gbest)].copy()  # the global best solution
+        conFE = FE  # the convergence function evaluation
+    else:
+        sols, objs, gbest, gbest_sol, FE, conFE = state
+    stopped = False  # whether the callback has stopped the search
+    if callback is not None:
+        stopped = callback(gbest, decode_solution(gbest_sol), FE, time.perf_counter() - start)
 
     # Step 3. Optimization
-    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=npop) as pbar:
-        while FE <= maxFE:
+    lower_bound = specifications.get('lower_bound', -float('inf'))  # the search stops once the lower bound is reached
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE and gbest > lower_bound and not stopped:
+            if checkpointer.due():
+                checkpointer.save(sols=sols, objs=objs, gbest=gbest, gbest_sol=gbest_sol, FE=FE, conFE=conFE)
+            if callback is not None and callback(None, None, FE, time.perf_counter() - start):
+                break
 
             # Step 3.1. Generate new solutions
             flag1 = flag2 = False
             idx1, idx2 = tournament_selection(sols, objs), tournament_selection(sols, objs)
-            sol1, sol2 = copy.deepcopy(sols[idx1]), copy.deepcopy(sols[idx2])
+            parent1, parent2, parent_obj1, parent_obj2 = sols[idx1], sols[idx2], objs[idx1], objs[idx2]
+            sol1, sol2 = copy_solution(parent1), copy_solution(parent2)
+            positions1, positions2 = set(), set()  # the positions changed from the parents
             if np.random.random() < pc:
                 flag1 = flag2 = True
-                sol1, sol2 = crossover(sols[idx1], sols[idx2])
+                sol1, sol2, positions1, positions2 = crossover(parent1, parent2)
 
             if np.random.random() < pm:
                 flag1 = True
-                sol1 = mutation(sol1, specifications)
+                sol1, positions = mutation(sol1, specifications)
+                positions1 |= positions
 
             if np.random.random() < pm:
                 flag2 = True
-                sol2 = mutation(sol2, specifications)
+                sol2, positions = mutation(sol2, specifications)
+                positions2 |= positions
 
             # Step 3.2. Update the global best
             if flag1:
-                new_obj = cal_objective(sol1, specifications)
+                new_obj = cal_delta_objective(parent1, parent_obj1, sol1, positions1, specifications)
                 FE += 1
                 pbar.update(1)
                 if new_obj < objs[idx1]:
@@ -215,11 +288,13 @@ def main(npop, maxFE, pc, pm, specifications):
                     objs[idx1] = new_obj
                     if new_obj < gbest:
                         gbest = new_obj
-                        gbest_sol = copy.deepcopy(sol1)
+                        gbest_sol = copy_solution(sol1)
                         conFE = FE
+                        if callback is not None and callback(gbest, decode_solution(gbest_sol), FE, time.perf_counter() - start):
+                            stopped = True
 
             if flag2:
-                new_obj = cal_objective(sol2, specifications)
+                new_obj = cal_delta_objective(parent2, parent_obj2, sol2, positions2, specifications)
                 FE += 1
                 pbar.update(1)
                 if new_obj < objs[idx2]:
@@ -227,13 +302,11 @@ def main(npop, maxFE, pc, pm, specifications):
                     objs[idx2] = new_obj
                     if new_obj < gbest:
                         gbest = new_obj
-                        gbest_sol = copy.deepcopy(sol2)
+                        gbest_sol = copy_solution(sol2)
                         conFE = FE
+                        if callback is not None and callback(gbest, decode_solution(gbest_sol), FE, time.perf_counter() - start):
+                            stopped = True
 
     # Step 4. Output
-    best_sol = []
-    for i in range(len(gbest_sol['operation'])):
-        best_sol.append(gbest_sol['operation'][i] + '&' + gbest_sol['machine'][i] + '&' + gbest_sol['tool'][i] + '&' +
-                        gbest_sol['direction'][i])
-    return gbest, best_sol, conFE
+    return gbest, decode_solution(gbest_sol), conFE
 
@@ -0,0 +1,47 @@
+# The anytime interface of the solvers
+# The solver runs in a background thread and reports each new incumbent through its callback. The generator yields the
+# incumbents as they are found, and closing it (e.g., leaving a for loop over it) cancels the solve, which stops at its
+# next poll of the callback: the start of its next iteration, or within TS_VNS.POLL_MOVES moves of the TS-VNS local
+# search.
+import queue
+import threading
+
+
+def solve_anytime(module, **kwargs):
+    """
+    Run a solver and yield its incumbents as they are found.
+    :param module: the module of the solver (see main.load_algorithm)
+    :param kwargs: the arguments of the main function of the solver (except callback)
+    :return: a generator of (objective, plan, FE, elapsed time) tuples, whose return value is the result of the solver
+    """
+    incumbents = queue.Queue()
+    cancelled = threading.Event()
+    result = {}
+
+    def callback(obj, plan, FE, elapsed):
+        if obj is not None:
+            incumbents.put((obj, plan, FE, elapsed))
+        return cancelled.is_set()
+
+    def run():
+        try:
+            result['value'] = module.main(callback=callback, **kwargs)
+        except BaseException as error:
+            result['error'] = error
+        finally:
+            incumbents.put(None)  # the end of the solve
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    try:
+        while True:
+            incumbent = incumbents.get()
+            if incumbent is None:
+                break
+            yield incumbent
+    finally:
+        cancelled.set()
+        thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
@@ -0,0 +1,79 @@
+# The lower bounds of flexible process planning problems
+# A plan performs every mandatory operation and one operation of each alternative group (a slot each). Its objective is
+# the sum of the usages of the chosen states and the changeovers between consecutive states, so it is bounded below by
+# the minimum usage of every slot plus the changeovers that any order of the slots must incur. Slots whose candidate
+# machines are pairwise disjoint must be processed on distinct machines, so a packing of such slots bounds the number of
+# machine runs (and likewise for (machine, tool) and (machine, direction) runs).
+
+
+def slots(specifications):
+    # the slots of a plan: the candidate operations of each mandatory operation or alternative group
+    alternative_operations = specifications['alternative_operations']
+    result = [[op] for op in specifications['operations'] if op not in alternative_operations]
+    # an alternative group listed more than once (e.g., in case 24) is still one choice of one operation
+    result += [list(alt) for alt in sorted({tuple(sorted(alt)) for alt in specifications['alternatives']})]
+    return result
+
+
+def min_usage(slot, specifications):
+    # the minimum usage of a slot over the states of its candidate operations
+    indices = specifications['indices']
+    return min(min(indices[op].values()) for op in slot)
+
+
+def candidates(slot, specifications, key, with_machine=False):
+    # the candidate resources of a slot ('machine', 'tool', or 'direction'), optionally paired with the machines
+    operations = specifications['operations']
+    result = set()
+    for op in slot:
+        resources = getattr(operations[op], key)
+        if with_machine:
+            result.update((m, r) for m in operations[op].machine for r in resources)
+        else:
+            result.update(resources)
+    return result
+
+
+def run_candidates(slot, specifications):
+    # the candidate sets of a slot whose packings bound the number of runs: the machines, the tools, the (machine, tool)
+    # pairs, the directions, and the (machine, direction) pairs
+    return [candidates(slot, specifications, key, with_machine) for key, with_machine in
+            (('machine', False), ('tool', False), ('tool', True), ('direction', False), ('direction', True))]
+
+
+def packing_number(sets):
+    # the size of a greedy packing of pairwise disjoint sets (the smallest sets are packed first)
+    used = set()
+    num = 0
+    for s in sorted(sets, key=len):
+        if used.isdisjoint(s):
+            used.update(s)
+            num += 1
+    return num
+
+
+def cal_lower_bound(specifications):
+    """
+    Calculate a valid lower bound of the objective of an FPP case.
+    :param specifications: the specifications of FPP
+    :return: the lower bound
+    """
+    all_slots = slots(specifications)
+    return sum(min_usage(slot, specifications) for slot in all_slots) + \
+        changeover_bound([run_candidates(slot, specifications) for slot in all_slots], specifications)
+
+
+def changeover_bound(slot_candidates, specifications):
+    # a lower bound of the changeovers of any order of some slots (e.g., the unscheduled slots of a partial plan), given
+    # their run candidates: machine changes, tool change events (the machine or the tool changes), and setup events (the
+    # machine or the direction changes) between the runs of consecutive slots sharing the resources
+    if not slot_candidates:
+        return 0
+    machine, tool, machine_tool, direction, machine_direction = (packing_number(sets) for sets in zip(*slot_candidates))
+    num_machine = machine
+    num_tool = max(machine, tool, machine_tool)
+    num_direction = max(machine, direction, machine_direction)
+    changeover = specifications['changeover']
+    mc = min([row[j] for i, row in enumerate(changeover['machine']) for j in range(len(row)) if i != j], default=0)
+    tc, sc = changeover['tool'], changeover['setup']
+    return mc * max(num_machine - 1, 0) + tc * max(num_tool - 1, 0) + sc * max(num_direction - 1, 0)
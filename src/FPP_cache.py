@@ -0,0 +1,116 @@
+# The persistent evaluation cache of operation sequences
+# An operation sequence is mapped deterministically to its optimal objective and process plan by the graph-based
+# evaluators (TS-VNS, IFSDPSO, IESGA, ISLHS), so the results are stored in SQLite keyed by (case hash, sequence) and
+# reused across runs. The least recently used entries are evicted once the cache exceeds its size.
+# The final results of solved parts are stored likewise, keyed by their canonical fingerprints (FPP_fingerprint), so
+# re-submitted or isomorphic parts are answered without solving them again.
+import json
+import sqlite3
+
+
+class EvaluationCache:
+    def __init__(self, path, max_entries=1000000, commit_interval=1000):
+        """
+        :param path: the path of the SQLite database
+        :param max_entries: the maximum number of cached sequences
+        :param commit_interval: the number of writes between two commits
+        """
+        self.max_entries = max_entries
+        self.commit_interval = commit_interval
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS evaluations ('
+            'case_hash TEXT, sequence TEXT, result TEXT, last_used INTEGER, PRIMARY KEY (case_hash, sequence)'
+            ') WITHOUT ROWID'
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS evaluations_last_used ON evaluations (last_used)')
+        self.clock = self.connection.execute('SELECT COALESCE(MAX(last_used), 0) FROM evaluations').fetchone()[0]
+        self.size = self.connection.execute('SELECT COUNT(*) FROM evaluations').fetchone()[0]
+        self.writes = 0  # the number of writes since the last commit
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, case_hash, sol):
+        # the cached (objective, plan) of an operation sequence, or None
+        sequence = '|'.join(sol)
+        row = self.connection.execute('SELECT result FROM evaluations WHERE case_hash = ? AND sequence = ?',
+                                      (case_hash, sequence)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.clock += 1
+        self.connection.execute('UPDATE evaluations SET last_used = ? WHERE case_hash = ? AND sequence = ?',
+                                (self.clock, case_hash, sequence))
+        self._written()
+        obj, plan = json.loads(row[0])
+        return obj, plan
+
+    def put(self, case_hash, sol, obj, plan):
+        # cache the (objective, plan) of an operation sequence
+        self.clock += 1
+        cursor = self.connection.execute('INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?)',
+                                         (case_hash, '|'.join(sol), json.dumps([obj, plan]), self.clock))
+        self.size += cursor.rowcount
+        if self.size > self.max_entries:
+            self.evict()
+        self._written()
+
+    def evict(self):
+        # evict the least recently used tenth of the cache
+        num = self.size - self.max_entries + self.max_entries // 10
+        self.connection.execute('DELETE FROM evaluations WHERE last_used IN '
+                                '(SELECT last_used FROM evaluations ORDER BY last_used LIMIT ?)', (num,))
+        self.size = self.connection.execute('SELECT COUNT(*) FROM evaluations').fetchone()[0]
+
+    def _written(self):
+        self.writes += 1
+        if self.writes >= self.commit_interval:
+            self.connection.commit()
+            self.writes = 0
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+
+class ResultStore:
+    def __init__(self, path):
+        """
+        :param path: the path of the SQLite database
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'fingerprint TEXT, algo TEXT, objective REAL, plan TEXT, lower_bound REAL, optimal INTEGER, '
+            'PRIMARY KEY (fingerprint, algo)) WITHOUT ROWID'
+        )
+
+    def get(self, fingerprint, algo):
+        # the stored (objective, plan, lower bound, optimal) of a part: an optimal result of any algorithm, or else the
+        # result of the algorithm, or None
+        row = self.connection.execute(
+            'SELECT objective, plan, lower_bound, optimal FROM results WHERE fingerprint = ? AND (optimal OR algo = ?) '
+            'ORDER BY optimal DESC, objective LIMIT 1', (fingerprint, algo)).fetchone()
+        if row is None:
+            return None
+        obj, plan, lower_bound, optimal = row
+        if obj.is_integer():
+            obj = int(obj)
+        return obj, json.loads(plan), lower_bound, bool(optimal)
+
+    def put(self, fingerprint, algo, obj, plan, lower_bound=None, optimal=False):
+        # store the result of an algorithm on a part (a worse result does not replace the stored one)
+        self.connection.execute(
+            'INSERT INTO results VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (fingerprint, algo) DO UPDATE SET '
+            'objective = excluded.objective, plan = excluded.plan, lower_bound = excluded.lower_bound, '
+            'optimal = excluded.optimal '
+            'WHERE excluded.objective < results.objective OR excluded.optimal > results.optimal',
+            (fingerprint, algo, obj, json.dumps(plan), lower_bound, int(optimal)))
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
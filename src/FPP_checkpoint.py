@@ -0,0 +1,50 @@
+# The checkpoints of long-running solves
+# The state of a solver at the start of an iteration (its population, incumbent, and counters) and the NumPy random state
+# are pickled to a file, so a preempted run resumed from its last checkpoint continues exactly as the uninterrupted run
+# would. The file is replaced atomically, so a preemption during a write keeps the previous checkpoint.
+import os
+import pickle
+import time
+import numpy as np
+
+
+class Checkpointer:
+    def __init__(self, path, algo, specifications, interval=60):
+        """
+        :param path: the path of the checkpoint file (None: no checkpoints)
+        :param algo: the algorithm whose state is saved
+        :param specifications: the specifications of FPP
+        :param interval: the minimum time between two checkpoints (seconds)
+        """
+        self.path = path
+        self.algo = algo
+        self.case_hash = specifications.get('hash')
+        self.interval = interval
+        self.last = time.perf_counter()  # the time of the last checkpoint
+
+    def due(self):
+        # whether a checkpoint should be saved now
+        return self.path is not None and time.perf_counter() - self.last >= self.interval
+
+    def save(self, **state):
+        # save the state of the solver and the random state
+        checkpoint = {'algo': self.algo, 'hash': self.case_hash, 'random_state': np.random.get_state(), 'state': state}
+        temp_path = self.path + '.' + str(os.getpid()) + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self.last = time.perf_counter()
+
+    def load(self, *keys):
+        # the saved values of the keys (the random state is restored), or None if there is no checkpoint
+        if self.path is None or not os.path.isfile(self.path):
+            return None
+        with open(self.path, 'rb') as f:
+            checkpoint = pickle.load(f)
+        if checkpoint['algo'] != self.algo or checkpoint['hash'] != self.case_hash:
+            raise ValueError('The checkpoint belongs to another algorithm or case.')
+        np.random.set_state(checkpoint['random_state'])
+        self.last = time.perf_counter()
+        return tuple(checkpoint['state'][key] for key in keys)
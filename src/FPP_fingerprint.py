@@ -0,0 +1,191 @@
+# The canonical fingerprints of flexible process planning problems
+# Parts re-submitted unchanged or with renamed operations have the same canonical form: the operations are relabelled
+# by their structure (resources, usages, alternative groups, and their neighbourhoods in the precedence DAG, refined as
+# in the Weisfeiler-Lehman test, with the remaining ties broken by the individualization that gives the smallest
+# canonical form), and the resources of each operation are sorted. The fingerprint is the content hash of the canonical
+# form, so equal fingerprints imply isomorphic parts, whose plans are translated to each other by renaming the
+# operations.
+import hashlib
+import json
+
+OBJECTIVE_KEYS = {'cost': ('muc', 'tuc', 'mcc', 'tcc', 'scc'), 'time': ('mct', 'tct', 'sct')}
+
+
+def operation_usages(data, op):
+    # the (machine, tool, usage) of each machine-tool pair of an operation (sorted)
+    operation = data['operations'][op]
+    machines, tools = operation['machine'], operation['tool']
+    process_time = operation.get('time')
+    usages = []
+    for ind_m, m in enumerate(machines):
+        for ind_t, t in enumerate(tools):
+            if data['type']['objective'] == 'cost':
+                usage = data['muc'][m] + data['tuc'][t]
+            elif len(tools) * len(machines) > len(process_time):
+                usage = process_time[ind_m]
+            else:
+                usage = process_time[ind_m * len(tools) + ind_t]
+            usages.append((m, t, usage))
+    return sorted(usages)
+
+
+def relabel(signatures):
+    # the ranks of the signatures (equal signatures share a rank)
+    ranks = {signature: rank for rank, signature in enumerate(sorted(set(signatures.values())))}
+    return {op: ranks[signature] for op, signature in signatures.items()}
+
+
+def refine(labels, priors, successors, mates):
+    # refine the labels by the labels of the neighbours until the partition is stable
+    while True:
+        signatures = {op: (labels[op], tuple(sorted(labels[p] for p in priors[op])),
+                           tuple(sorted(labels[s] for s in successors[op])),
+                           tuple(sorted(labels[a] for a in mates[op]))) for op in labels}
+        new_labels = relabel(signatures)
+        if len(set(new_labels.values())) == len(set(labels.values())):
+            return new_labels
+        labels = new_labels
+
+
+def orbit_roots(ops, automorphisms):
+    # the representative of the orbit of each operation under the group generated by the automorphisms
+    roots = {op: op for op in ops}
+
+    def find(op):
+        while roots[op] != op:
+            roots[op] = roots[roots[op]]
+            op = roots[op]
+        return op
+
+    for automorphism in automorphisms:
+        for op1, op2 in automorphism.items():
+            roots[find(op1)] = find(op2)
+    return {op: find(op) for op in ops}
+
+
+def canonical_order(data):
+    # the operations in canonical order: the ties left by the refinement are broken by individualizing each operation of
+    # the smallest tied label in turn (recursively), and the order of the smallest canonical form is kept; the branches
+    # that are images of explored branches under the automorphisms found (swapped twin operations, or two orders with
+    # the same canonical form) are pruned, as in nauty
+    operations = data['operations']
+    mates = {op: [] for op in operations}  # the other operations of the alternative group of each operation
+    for alt in data['alternatives']:
+        for op in alt:
+            mates[op] = [a for a in alt if a != op]
+    priors = {op: list(operations[op]['prior']) for op in operations}
+    successors = {op: [] for op in operations}
+    for op in operations:
+        for prior_op in priors[op]:
+            successors[prior_op].append(op)
+    labels = relabel({op: (tuple(sorted(operations[op]['direction'])), tuple(operation_usages(data, op)),
+                           len(mates[op])) for op in operations})
+    labels = refine(labels, priors, successors, mates)
+
+    automorphisms = []  # each automorphism maps the operations of a leaf order to those of an equivalent leaf order
+    twins = {}  # the operations with the same label and neighbours are swapped by an automorphism
+    for op in operations:
+        group = frozenset(mates[op] + [op]) if mates[op] else frozenset()
+        key = (labels[op], frozenset(priors[op]), frozenset(successors[op]), group)
+        if key in twins:
+            automorphisms.append({op: twins[key], twins[key]: op})
+        else:
+            twins[key] = op
+    leaves = {}  # the (form, order, path) of the first leaf and of the smallest leaf
+
+    def search(labels, path):
+        # explore the individualizations below a refined labelling (path: the individualized operations), returning the
+        # depth to backtrack to once the subtree is found to be an image of an explored subtree (None: continue)
+        counts = {}
+        for label in labels.values():
+            counts[label] = counts.get(label, 0) + 1
+        tied = [label for label, count in counts.items() if count > 1]
+        if not tied:
+            order = sorted(operations, key=labels.get)
+            form = json.dumps(canonical_form(data, order)[0], sort_keys=True, separators=(',', ':'))
+            for leaf_form, leaf_order, leaf_path in leaves.values():
+                if form == leaf_form:
+                    automorphisms.append(dict(zip(leaf_order, order)))
+                    depth = 0  # the depth where the paths of the two leaves diverge
+                    while path[depth] == leaf_path[depth]:
+                        depth += 1
+                    return depth
+            leaves.setdefault('first', (form, order, path))
+            if form < leaves.setdefault('best', (form, order, path))[0]:
+                leaves['best'] = (form, order, path)
+            return None
+        cell = min(tied)
+        explored = []
+        for op in operations:
+            if labels[op] != cell:
+                continue
+            # the automorphisms fixing the path map the subtree of an operation to those of its orbit
+            roots = orbit_roots(operations, [automorphism for automorphism in automorphisms
+                                             if all(automorphism.get(p, p) == p for p in path)])
+            if any(roots[op] == roots[explored_op] for explored_op in explored):
+                continue
+            explored.append(op)
+            new_labels = refine(relabel({o: (label, o != op) for o, label in labels.items()}), priors, successors,
+                                mates)
+            depth = search(new_labels, path + [op])
+            if depth is not None and depth < len(path):
+                return depth
+        return None
+
+    search(labels, [])
+    return leaves['best'][1]
+
+
+def canonical_form(data, order):
+    # the case description with the operations renamed by an order, and the new name of each operation
+    names = {op: 'o' + str(idx + 1) for idx, op in enumerate(order)}
+    operations = {}
+    for op in order:
+        operation = data['operations'][op]
+        canonical = {'machine': sorted(operation['machine']), 'tool': sorted(operation['tool']),
+                     'direction': sorted(operation['direction']),
+                     'prior': sorted((names[p] for p in operation['prior']), key=lambda p: int(p[1:]))}
+        if data['type']['objective'] == 'time':
+            usages = operation_usages(data, op)
+            if len(operation['tool']) * len(operation['machine']) > len(operation['time']):
+                canonical['time'] = [usage for m, t, usage in usages if t == usages[0][1]]  # one per machine
+            else:
+                canonical['time'] = [usage for _, _, usage in usages]
+        operations[names[op]] = canonical
+    alternatives = sorted((sorted((names[op] for op in alt), key=lambda p: int(p[1:])) for alt in data['alternatives']),
+                          key=lambda alt: int(alt[0][1:]))
+    result = {'type': dict(data['type'])}
+    for key in OBJECTIVE_KEYS[data['type']['objective']]:
+        result[key] = data[key]
+    result['operations'] = operations
+    result['alternatives'] = alternatives
+    return result, names
+
+
+def canonical_case(data):
+    """
+    Calculate the canonical form of a case description.
+    :param data: the case description (the content of a case file)
+    :return: the canonical case description, and the canonical name of each operation
+    """
+    return canonical_form(data, canonical_order(data))
+
+
+def cal_fingerprint(data):
+    """
+    Calculate the canonical fingerprint of a case description.
+    :param data: the case description (the content of a case file)
+    :return: the fingerprint, and the canonical name of each operation
+    """
+    canonical, names = canonical_case(data)
+    content = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest(), names
+
+
+def translate_plan(plan, names):
+    # rename the operations of a process plan (a list of "operation&machine&tool&direction" states)
+    result = []
+    for state in plan:
+        op, resources = state.split('&', 1)
+        result.append(names[op] + '&' + resources)
+    return result
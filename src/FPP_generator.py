@@ -0,0 +1,104 @@
+# The generator of synthetic flexible process planning cases for scaling studies
+# The generated case descriptions have the same format as the case files and are loaded by FPP_cases.load_specifications.
+import numpy as np
+
+
+def generate_case(nops, nmachines, ntools, ndirections, density=0.05, nalternatives=0, objective='cost', seed=None,
+                  max_machines=3, max_tools=3, max_directions=2):
+    """
+    Generate a synthetic FPP case.
+    :param nops: the number of performed operations
+    :param nmachines: the number of machines
+    :param ntools: the number of tools
+    :param ndirections: the number of directions (at most 12)
+    :param density: the probability that an operation is prior to a later operation in a random topological order
+    :param nalternatives: the number of operations that have an alternative operation (each adds one operation)
+    :param objective: 'cost' or 'time'
+    :param seed: the random seed
+    :param max_machines: the maximum number of candidate machines of an operation
+    :param max_tools: the maximum number of candidate tools of an operation
+    :param max_directions: the maximum number of candidate directions of an operation
+    :return: the case description
+    """
+    directions = ['+x', '-x', '+y', '-y', '+z', '-z', '+a', '-a', '+b', '-b', '+c', '-c']
+    if ndirections > len(directions):
+        raise ValueError('The number of directions cannot exceed ' + str(len(directions)) + '.')
+    if nalternatives > nops:
+        raise ValueError('The number of alternative operations cannot exceed the number of operations.')
+    rng = np.random.default_rng(seed)
+    machines = ['m' + str(i + 1) for i in range(nmachines)]
+    tools = ['t' + str(i + 1) for i in range(ntools)]
+    directions = directions[: ndirections]
+
+    def sample(items, max_num):
+        num = rng.integers(1, min(max_num, len(items)) + 1)
+        return [items[i] for i in sorted(rng.choice(len(items), num, replace=False))]
+
+    # Step 1. The precedence DAG over the performed operations (i is prior to j only if i < j)
+    priors = []
+    for j in range(nops):
+        priors.append(np.where(rng.random(j) < density)[0].tolist())
+
+    # Step 2. The operation names (an operation with an alternative is split into 'a' and 'b' operations)
+    with_alternative = set(rng.choice(nops, nalternatives, replace=False).tolist())
+    names = []
+    for i in range(nops):
+        if i in with_alternative:
+            names.append(['o' + str(i + 1) + 'a', 'o' + str(i + 1) + 'b'])
+        else:
+            names.append(['o' + str(i + 1)])
+
+    # Step 3. The operations
+    operations = {}
+    for i in range(nops):
+        prior = [op for k in priors[i] for op in names[k]]
+        for op in names[i]:
+            operation = {
+                'machine': sample(machines, max_machines),
+                'tool': sample(tools, max_tools),
+                'direction': sample(directions, max_directions),
+                'prior': prior,
+            }
+            if objective == 'time':
+                operation['time'] = [round(float(rng.uniform(5, 40)) * 4) / 4 for _ in operation['machine']]
+            operations[op] = operation
+
+    # Step 4. The case description
+    data = {
+        'description': 'Synthetic case: ' + objective + ' minimization',
+        'type': {'objective': objective, 'alternative': nalternatives > 0},
+    }
+    if objective == 'cost':
+        data['muc'] = {m: int(rng.integers(5, 100)) for m in machines}
+        data['tuc'] = {t: int(rng.integers(2, 30)) for t in tools}
+        data['mcc'] = 160
+        data['tcc'] = 20
+        data['scc'] = 100
+    else:
+        data['tct'] = 20
+        data['sct'] = 120
+        data['mct'] = {m1: {m2: int(rng.integers(100, 200)) for m2 in machines if m2 != m1} for m1 in machines}
+    data['operations'] = operations
+    data['alternatives'] = [names[i] for i in range(nops) if i in with_alternative]
+    return data
+
+
+if __name__ == '__main__':
+    import argparse
+    import FPP_cases
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic flexible process planning case")
+    parser.add_argument('--nops', type=int, default=100, help='Number of performed operations')
+    parser.add_argument('--nmachines', type=int, default=8, help='Number of machines')
+    parser.add_argument('--ntools', type=int, default=15, help='Number of tools')
+    parser.add_argument('--ndirections', type=int, default=6, help='Number of directions')
+    parser.add_argument('--density', type=float, default=0.05, help='Precedence density')
+    parser.add_argument('--nalternatives', type=int, default=0, help='Number of operations with an alternative')
+    parser.add_argument('--objective', type=str, default='cost', choices=['cost', 'time'], help='Objective')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed')
+    parser.add_argument('--output', type=str, required=True, help='Path of the generated case file')
+
+    args = parser.parse_args()
+    case = generate_case(args.nops, args.nmachines, args.ntools, args.ndirections, args.density, args.nalternatives,
+                         args.objective, args.seed)
+    FPP_cases.save_case(case, args.output)
@@ -0,0 +1,123 @@
+# The bi-objective (cost and time) flexible process planning problem
+# A part with a cost case and a time case (e.g., cases 9/10 and 11/12) is solved for both objectives at once: each
+# state and changeover carries the (cost, time) vector of the two cases, so the evaluators of HEA add both objectives in
+# one pass. The population is ranked by a vectorized non-dominated sorting and crowding distance (as in NSGA-II), and
+# the non-dominated plans found so far are kept in an archive sorted by cost, whose updates take logarithmic time plus
+# the number of removed plans.
+import bisect
+import numpy as np
+
+
+def combine_specifications(cost_specifications, time_specifications):
+    """
+    Combine the specifications of the cost and time cases of a part into the specifications of the bi-objective case.
+    :param cost_specifications: the specifications of the cost case
+    :param time_specifications: the specifications of the time case (the same operations and alternatives)
+    :return: the specifications whose state usages and changeovers are the (cost, time) vectors of the two cases
+    """
+    if cost_specifications['type']['objective'] != 'cost' or time_specifications['type']['objective'] != 'time':
+        raise ValueError('The cases must be a cost case and a time case.')
+    cost_operations, time_operations = cost_specifications['operations'], time_specifications['operations']
+    if list(cost_operations) != list(time_operations) or any(
+            vars(cost_operations[op]) != dict(vars(time_operations[op]), time=cost_operations[op].time)
+            for op in cost_operations) or \
+            sorted(map(sorted, cost_specifications['alternatives'])) != \
+            sorted(map(sorted, time_specifications['alternatives'])):
+        raise ValueError('The cost and time cases describe different parts.')
+
+    # the resource indices of the cost case are kept (the time case orders its machines differently)
+    cost_machines = cost_specifications['compiled']['machines'].tolist()
+    time_machines = time_specifications['compiled']['machines'].tolist()
+    m2time = [time_machines.index(m) for m in cost_machines]
+    states = {}
+    for state, (op, m, t, d, usage) in cost_specifications['states'].items():
+        states[state] = (op, m, t, d, np.array([usage, time_specifications['states'][state][4]], dtype=float))
+    cost_changeover, time_changeover = cost_specifications['changeover'], time_specifications['changeover']
+    machine = [[np.array([cost_changeover['machine'][m1][m2], time_changeover['machine'][m2time[m1]][m2time[m2]]],
+                         dtype=float) for m2 in range(len(cost_machines))] for m1 in range(len(cost_machines))]
+
+    specifications = dict(cost_specifications)
+    specifications['type'] = dict(cost_specifications['type'], objective='pareto')
+    specifications['alternatives'] = list(cost_specifications['alternatives'])
+    specifications['states'] = states
+    specifications['changeover'] = {
+        'machine': machine,
+        'tool': np.array([cost_changeover['tool'], time_changeover['tool']], dtype=float),
+        'setup': np.array([cost_changeover['setup'], time_changeover['setup']], dtype=float),
+    }
+    specifications['hash'] = cost_specifications['hash'] + time_specifications['hash']
+    specifications['objectives'] = (cost_specifications, time_specifications)  # e.g., for repairing initial plans
+    for key in ('cache', 'lower_bound'):
+        specifications.pop(key, None)
+    return specifications
+
+
+def non_dominated_sort(objs):
+    # the front of each objective vector (0: non-dominated), peeling all the vectors of a front at once
+    objs = np.asarray(objs)
+    no_worse = (objs[:, None, :] <= objs[None, :, :]).all(axis=2)
+    dominates = no_worse & ~no_worse.T  # dominates[i, j]: the i-th vector dominates the j-th vector
+    counts = dominates.sum(axis=0)  # the number of vectors dominating each vector
+    ranks = np.empty(len(objs), dtype=np.int64)
+    front = np.flatnonzero(counts == 0)
+    rank = 0
+    while front.size:
+        ranks[front] = rank
+        counts[front] = -1
+        counts -= dominates[front].sum(axis=0)
+        front = np.flatnonzero(counts == 0)
+        rank += 1
+    return ranks
+
+
+def crowding_distance(objs, ranks):
+    # the crowding distance of each objective vector within its front (infinite at the extremes of the front)
+    objs = np.asarray(objs, dtype=float)
+    n = len(objs)
+    distance = np.zeros(n)
+    positions = np.arange(n)
+    for k in range(objs.shape[1]):
+        order = np.lexsort((objs[:, k], ranks))  # by front, then by the k-th objective
+        values = objs[order, k]
+        fronts = ranks[order]
+        first = np.r_[True, fronts[1:] != fronts[:-1]]  # the first vector of each front
+        last = np.r_[fronts[1:] != fronts[:-1], True]  # the last vector of each front
+        start = np.maximum.accumulate(np.where(first, positions, 0))
+        end = np.minimum.accumulate(np.where(last, positions, n - 1)[::-1])[::-1]
+        span = values[end] - values[start]
+        gap = np.full(n, np.inf)
+        interior = np.flatnonzero(~(first | last))
+        gap[interior] = np.divide(values[interior + 1] - values[interior - 1], span[interior],
+                                  out=np.zeros(len(interior)), where=span[interior] > 0)
+        distance[order] += gap
+    return distance
+
+
+class ParetoArchive:
+    def __init__(self):
+        """
+        The non-dominated (cost, time) vectors found so far, sorted by ascending cost (and thus descending time).
+        """
+        self.costs = []
+        self.times = []
+        self.items = []  # the solution of each vector
+
+    def add(self, cost, time, item):
+        # add a vector unless it is dominated by (or equal to) an archived vector, removing the vectors it dominates
+        idx = bisect.bisect_right(self.costs, cost)
+        if idx and self.times[idx - 1] <= time:
+            return False
+        start = end = bisect.bisect_left(self.costs, cost)
+        while end < len(self.costs) and self.times[end] >= time:
+            end += 1
+        self.costs[start: end] = [cost]
+        self.times[start: end] = [time]
+        self.items[start: end] = [item]
+        return True
+
+    def front(self):
+        # the archived (cost, time, solution) tuples
+        return list(zip(self.costs, self.times, self.items))
+
+    def __len__(self):
+        return len(self.costs)
@@ -0,0 +1,108 @@
+# The warm start of the solvers from earlier process plans
+# After a change of the case (FPP_cases.apply_delta), an earlier plan may perform removed operations or use removed
+# resources. The plan is repaired by keeping its remaining operations in their order (a stable topological sort), adding
+# the cheapest operation of each missing mandatory operation or alternative group, and reassigning the cheapest states
+# of the resulting sequence under the changed resources and costs, so the solvers continue from the nearest feasible
+# plan.
+import numpy as np
+import FPP_bounds
+
+
+def order_sequence(sequence, operations):
+    # reorder a sequence of operations to satisfy the precedence constraints, keeping the given order where possible
+    # (the priors outside the sequence, e.g., unselected alternative operations, are ignored)
+    remaining = list(sequence)
+    selected = set(remaining)
+    result = []
+    done = set()
+    while remaining:
+        for idx, op in enumerate(remaining):
+            if all(prior_op in done or prior_op not in selected for prior_op in operations[op].prior):
+                break
+        else:
+            raise ValueError('The precedence constraints of the operations are cyclic.')
+        result.append(op)
+        done.add(op)
+        del remaining[idx]
+    return result
+
+
+def assign_states(sequence, specifications):
+    # the cheapest states of a sequence of operations (a shortest path through the states of consecutive operations)
+    indices = specifications['indices']
+    changeover = specifications['changeover']
+    mc, tc, sc = np.array(changeover['machine']), changeover['tool'], changeover['setup']
+    layers = []  # the states, the (machine, tool, direction) arrays, and the back pointers of each operation
+    costs = None
+    for op in sequence:
+        states = list(indices[op])
+        m, t, d, usage = (np.array(values)
+                          for values in zip(*(specifications['states'][state][1:] for state in states)))
+        if costs is None:
+            costs, pointers = usage.astype(float), None
+        else:
+            pm, pt, pd = layers[-1][1][:3]
+            m_change = pm[:, None] != m[None, :]
+            transition = mc[pm[:, None], m[None, :]] + tc * (m_change | (pt[:, None] != t[None, :])) + \
+                sc * (m_change | (pd[:, None] != d[None, :]))
+            total = costs[:, None] + transition
+            pointers = total.argmin(axis=0)
+            costs = total[pointers, np.arange(len(states))] + usage
+        layers.append((states, (m, t, d), pointers))
+    plan = []
+    idx = int(costs.argmin())
+    for states, _, pointers in reversed(layers):
+        plan.append(states[idx])
+        if pointers is not None:
+            idx = int(pointers[idx])
+    plan.reverse()
+    return plan
+
+
+def cheapest_state(slot, specifications):
+    # the cheapest state of the operations of a slot (a mandatory operation or an alternative group)
+    indices = specifications['indices']
+    return min((state for op in slot for state in indices[op]), key=lambda state: specifications['states'][state][4])
+
+
+def repair_plan(plan, specifications):
+    """
+    Repair a process plan (e.g., the best plan before a change of the case) into a feasible plan of the case.
+    :param plan: the process plan (a list of "operation&machine&tool&direction" states)
+    :param specifications: the specifications of FPP
+    :return: the repaired plan
+    """
+    operations = specifications['operations']
+    slots = FPP_bounds.slots(specifications)  # a repeated alternative group is one slot
+    op2slot = {op: idx for idx, slot in enumerate(slots) for op in slot}
+    chosen = {}  # the (position, operation) of each slot
+    for pos, state in enumerate(plan):
+        op = state.split('&')[0]
+        if op in op2slot and op2slot[op] not in chosen:
+            chosen[op2slot[op]] = (pos, op)
+    for idx, slot in enumerate(slots):
+        if idx not in chosen:
+            chosen[idx] = (len(plan), specifications['states'][cheapest_state(slot, specifications)][0])
+    sequence = order_sequence([op for _, op in sorted(chosen.values())], operations)
+    return assign_states(sequence, specifications)
+
+
+def initial_plans(init, specifications, num):
+    # the repaired plans of at most num initial plans
+    return [repair_plan(plan, specifications) for plan in (init or [])[:num]]
+
+
+def initial_sequences(init, specifications, new_operations, num):
+    # the operation sequences of the graph-based evaluators ('s', one kept operation per alternative group, 'd') of at
+    # most num initial plans
+    alternative_operations = specifications['alternative_operations']
+    kept = {}  # the kept operation of the alternative group of each operation
+    for op in new_operations:
+        kept[op] = op
+        for alt in alternative_operations.get(op, ()):
+            kept[alt] = op
+    sequences = []
+    for plan in initial_plans(init, specifications, num):
+        sequence = [kept[state.split('&')[0]] for state in plan]
+        sequences.append(['s'] + order_sequence(sequence, new_operations) + ['d'])
+    return sequences
@@ -1,8 +1,10 @@
 # Feasible sequence oriented discrete particle swarm optimization (FSDPSO)
 # Reference: Dou J, Li J, Su C. A discrete particle swarm optimisation for operation sequencing in CAPP[J]. International Journal of Production Research, 2018, 56(11): 3795-3814.
-import copy
+import time
 import numpy as np
 from tqdm import tqdm
+import FPP_checkpoint
+import FPP_warmstart
 
 
 def transitive_closure(ops):
@@ -38,45 +40,89 @@ def transitive_closure(ops):
 
 def cal_objective(sol, specifications):
     # calculate the objective value
-    objective = specifications['type']['objective']
-    indices = specifications['indices']
+    states = specifications['states']
     op2ind = specifications['op2ind']
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
     obj = 0
     ops = sol['operation']
-    machines = []
-    tools = []
-    directions = []
+    m1 = t1 = d1 = None
     for op in ops:
         idx = op2ind[op]
-        machines.append(sol['machine'][idx])
-        tools.append(sol['tool'][idx])
-        directions.append(sol['direction'][idx])
-    for i in range(len(ops)):
-        string = ops[i] + '&' + machines[i] + '&' + tools[i] + '&' + directions[i]
-        obj += indices[ops[i]][string]
-        if objective == 'cost':
-            if i != 0:
-                if machines[i] != machines[i - 1]:
-                    obj += mcc
-                if machines[i] != machines[i - 1] or tools[i] != tools[i - 1]:
-                    obj += tcc
-                if machines[i] != machines[i - 1] or directions[i] != directions[i - 1]:
-                    obj += scc
-        else:
-            if i != 0:
-                if machines[i] != machines[i - 1]:
-                    obj += mct[machines[i - 1]][machines[i]]
-                if machines[i] != machines[i - 1] or tools[i] != tools[i - 1]:
-                    obj += tct
-                if machines[i] != machines[i - 1] or directions[i] != directions[i - 1]:
-                    obj += sct
+        _, m2, t2, d2, usage = states[op + '&' + sol['machine'][idx] + '&' + sol['tool'][idx] + '&' + sol['direction'][idx]]
+        obj += usage
+        if m1 is not None:
+            if m1 != m2:
+                obj += mc[m1][m2]
+            if m1 != m2 or t1 != t2:
+                obj += tc
+            if m1 != m2 or d1 != d2:
+                obj += sc
+        m1, t1, d1 = m2, t2, d2
     return obj
 
 
+def encode_resources(specifications):
+    # the integer encoding of the swarm: the resource names, the candidate resource indices of each operation (in the
+    # order of the case), the cheapest candidates, the usage of each (operation, machine, tool, direction), and the
+    # machine change costs
+    operations = specifications['operations']
+    compiled = specifications['compiled']
+    encoding = {'names': {}, 'candidates': {}, 'candidate_sets': {}, 'cheapest': {}}
+    for key, names in (('machine', 'machines'), ('tool', 'tools'), ('direction', 'directions')):
+        encoding['names'][key] = compiled[names].tolist()
+        name2ind = {name: idx for idx, name in enumerate(encoding['names'][key])}
+        encoding['candidates'][key] = [[name2ind[name] for name in getattr(operations[op], key)] for op in operations]
+        encoding['candidate_sets'][key] = [set(candidates) for candidates in encoding['candidates'][key]]
+    if specifications['type']['objective'] == 'cost':
+        for key, unit_cost in (('machine', specifications['muc']), ('tool', specifications['tuc'])):
+            names = encoding['names'][key]
+            encoding['cheapest'][key] = [min(candidates, key=lambda idx: unit_cost[names[idx]])
+                                         for candidates in encoding['candidates'][key]]
+    shape = (len(operations), len(encoding['names']['machine']), len(encoding['names']['tool']),
+             len(encoding['names']['direction']))
+    usage = np.zeros(shape, dtype=compiled['state_usage'].dtype)
+    usage[compiled['state_op'], compiled['state_machine'], compiled['state_tool'], compiled['state_direction']] = \
+        compiled['state_usage']
+    encoding['usage'] = usage
+    encoding['mc'] = np.array(specifications['changeover']['machine'])
+    return encoding
+
+
+def cal_encoded_objective(sol, encoding, specifications):
+    # calculate the objective value of an encoded particle (rows: operations, machines, tools, directions)
+    changeover = specifications['changeover']
+    ops = sol[0]
+    m, t, d = sol[1:, ops]  # the resources in the order of the operations
+    m_change = m[1:] != m[:-1]
+    obj = encoding['usage'][ops, m, t, d].sum() + encoding['mc'][m[:-1], m[1:]].sum()
+    obj += changeover['tool'] * np.count_nonzero(m_change | (t[1:] != t[:-1]))
+    obj += changeover['setup'] * np.count_nonzero(m_change | (d[1:] != d[:-1]))
+    return obj.item()
+
+
+def decode_solution(sol, encoding, specifications):
+    # the process plan of an encoded particle
+    ind2op = specifications['ind2op']
+    names = encoding['names']
+    plan = []
+    for i in range(sol.shape[1]):
+        plan.append(ind2op[sol[0, i]] + '&' + names['machine'][sol[1, i]] + '&' + names['tool'][sol[2, i]] + '&' + names['direction'][sol[3, i]])
+    return plan
+
+
+def encode_plan(plan, encoding, specifications):
+    # the encoded particle of a process plan
+    op2ind = specifications['op2ind']
+    name2ind = {key: {name: idx for idx, name in enumerate(names)} for key, names in encoding['names'].items()}
+    sol = np.empty((4, len(plan)), dtype=np.int64)
+    for i, state in enumerate(plan):
+        op, m, t, d = state.split('&')
+        sol[0, i] = op2ind[op]
+        sol[1:, op2ind[op]] = name2ind['machine'][m], name2ind['tool'][t], name2ind['direction'][d]
+    return sol
+
+
 def cal_precedence(precedence):
     # calculate the precedence constraint satisfaction status
     nops_all = len(precedence)
@@ -89,64 +135,37 @@ def cal_precedence(precedence):
     return p
 
 
-def initialize_population(npop, nops, precedence, specifications):
-    # the initialization of operation, tool, machine, and TAD chromosomes
-    operations = specifications['operations']
-    ind2op = specifications['ind2op']
-
-    pops = []
-    for _ in range(npop):
-        p = copy.deepcopy(precedence)
+def initialize_population(npop, nops, precedence, encoding):
+    # the initialization of operation, tool, machine, and TAD chromosomes (one row each per particle)
+    candidates = encoding['candidates']
+    pops = np.empty((npop, 4, nops), dtype=np.int64)
+    for k in range(npop):
+        p = precedence.copy()
         selected_idx = []
-        operation_chromosome = []
-        machine_chromosome = []
-        tool_chromosome = []
-        direction_chromosome = []
         for i in range(nops):
             available = np.where(cal_precedence(p) == 1)[0]
             available = list(set(available) - set(selected_idx))
             op_ind = np.random.choice(available)
             p[op_ind] = 0
-            op = ind2op[i]
             selected_idx.append(op_ind)
-            operation_chromosome.append(ind2op[op_ind])
-            machine_chromosome.append(np.random.choice(operations[op].machine))
-            tool_chromosome.append(np.random.choice(operations[op].tool))
-            direction_chromosome.append(np.random.choice(operations[op].direction))
-        pops.append({
-            'operation': operation_chromosome,
-            'machine': machine_chromosome,
-            'tool': tool_chromosome,
-            'direction': direction_chromosome,
-        })
+            pops[k, 0, i] = op_ind
+            pops[k, 1, i] = np.random.choice(candidates['machine'][i])
+            pops[k, 2, i] = np.random.choice(candidates['tool'][i])
+            pops[k, 3, i] = np.random.choice(candidates['direction'][i])
     return pops
 
 
 def fragment_crossover(sol1, sol2):
-    # fragment crossover
-    op1, op2 = sol1['operation'], sol2['operation']
+    # fragment crossover (sol1 is updated in place)
+    op1, op2 = sol1[0], sol2[0]
     point1, point2 = sorted(np.random.choice(range(1, len(op1) - 1), 2, replace=False))
-    temp_op = op1[point1: point2]
-    idx = point1
-    new_op = op1.copy()
-    for i in range(len(op1)):
-        if op2[i] in temp_op:
-            new_op[idx] = op2[i]
-            idx += 1
-    new_sol = copy.deepcopy(sol1)
-    new_sol['operation'] = new_op
-    return new_sol
+    op1[point1: point2] = op2[np.isin(op2, op1[point1: point2])]
 
 
 def uniform_crossover(sol1, sol2):
-    # resource updating
-    n = len(sol1['operation'])
-    new_sol = copy.deepcopy(sol1)
-    for i in range(n):
-        new_sol['machine'][i] = sol2['machine'][i] if np.random.random() < 0.5 else sol1['machine'][i]
-        new_sol['tool'][i] = sol2['tool'][i] if np.random.random() < 0.5 else sol1['tool'][i]
-        new_sol['direction'][i] = sol2['direction'][i] if np.random.random() < 0.5 else sol1['direction'][i]
-    return new_sol
+    # resource updating (sol1 is updated in place)
+    n = sol1.shape[1]
+    np.copyto(sol1[1:], sol2[1:], where=np.random.random((n, 3)).T < 0.5)
 
 
 def find_mutation_range(sol, closure_pairs, idx):
@@ -173,75 +192,66 @@ def find_mutation_range(sol, closure_pairs, idx):
     return [i for i in range(idx1, idx2 + 1) if i != idx]
 
 
-def fragment_mutation(parent, closure_pairs):
-    # fragment mutation
-    new_sol = copy.deepcopy(parent)
-    chromosome = new_sol['operation']
+def fragment_mutation(sol, closure_pairs):
+    # fragment mutation (in place)
+    chromosome = sol[0].tolist()
     point1 = np.random.randint(0, len(chromosome))
     mutation_range = find_mutation_range(chromosome, closure_pairs, point1)
     while not mutation_range:
         point1 = np.random.randint(0, len(chromosome))
         mutation_range = find_mutation_range(chromosome, closure_pairs, point1)
     point2 = np.random.choice(mutation_range)
-    new_sol['operation'][point1], new_sol['operation'][point2] = new_sol['operation'][point2], new_sol['operation'][point1]
-    return new_sol
-
+    sol[0, point1], sol[0, point2] = chromosome[point2], chromosome[point1]
 
-def uniform_mutation(sol, specifications):
-    # uniform mutation
-    operations = specifications['operations']
-    ind2op = specifications['ind2op']
 
-    n = len(sol['operation'])
-    new_sol = copy.deepcopy(sol)
+def uniform_mutation(sol, encoding):
+    # uniform mutation (in place)
+    candidates = encoding['candidates']
+    n = sol.shape[1]
     point1, point2 = sorted(np.random.choice(range(n + 1), 2, replace=False))
     for k in range(point1, point2):
-        op = ind2op[k]
-        new_sol['machine'][k] = np.random.choice(operations[op].machine)
-        new_sol['tool'][k] = np.random.choice(operations[op].tool)
-        new_sol['direction'][k] = np.random.choice(operations[op].direction)
-    return new_sol
+        sol[1, k] = np.random.choice(candidates['machine'][k])
+        sol[2, k] = np.random.choice(candidates['tool'][k])
+        sol[3, k] = np.random.choice(candidates['direction'][k])
 
 
-def greedy_mutation(sol, specifications):
-    # greedy mutation
+def greedy_mutation(sol, encoding, specifications):
+    # greedy mutation (in place)
     objective = specifications['type']['objective']
-    operations = specifications['operations']
-    op2ind = specifications['op2ind']
-    if objective == 'cost':
-        muc, tuc = specifications['muc'], specifications['tuc']
+    candidates = encoding['candidates']
+    candidate_sets = encoding['candidate_sets']
+    cheapest = encoding['cheapest']
 
-    n = len(sol['operation'])
-    new_sol = copy.deepcopy(sol)
+    n = sol.shape[1]
     point1, point2 = sorted(np.random.choice(range(n + 1), 2, replace=False))
+    ops, machine, tool, direction = sol.tolist()
+    new_machine, new_tool, new_direction = machine.copy(), tool.copy(), direction.copy()
     for k in range(point1, point2 - 1):
-        op1, op2 = sol['operation'][k], sol['operation'][k + 1]
-        op1_ind, op2_ind = op2ind[op1], op2ind[op2]
-        if sol['machine'][op1_ind] in operations[op2].machine:
-            new_sol['machine'][op2_ind] = sol['machine'][op1_ind]
+        op1_ind, op2_ind = ops[k], ops[k + 1]
+        if machine[op1_ind] in candidate_sets['machine'][op2_ind]:
+            new_machine[op2_ind] = machine[op1_ind]
         elif objective == 'cost':
-            filtered_items = {index: muc[index] for index in operations[op2].machine}
-            new_sol['machine'][op2_ind] = min(filtered_items, key=filtered_items.get)
+            new_machine[op2_ind] = cheapest['machine'][op2_ind]
         else:
-            new_sol['machine'][op2_ind] = np.random.choice(operations[op2].machine)
+            new_machine[op2_ind] = np.random.choice(candidates['machine'][op2_ind])
 
-        if new_sol['machine'][op1_ind] == new_sol['machine'][op2_ind]:
-            if sol['tool'][op1_ind] in operations[op2].tool:
-                new_sol['tool'][op2_ind] = sol['tool'][op1_ind]
+        if new_machine[op1_ind] == new_machine[op2_ind]:
+            if tool[op1_ind] in candidate_sets['tool'][op2_ind]:
+                new_tool[op2_ind] = tool[op1_ind]
             elif objective == 'cost':
-                filtered_items = {index: tuc[index] for index in operations[op2].tool}
-                new_sol['tool'][op2_ind] = min(filtered_items, key=filtered_items.get)
+                new_tool[op2_ind] = cheapest['tool'][op2_ind]
             else:
-                new_sol['tool'][op2_ind] = np.random.choice(operations[op2].tool)
+                new_tool[op2_ind] = np.random.choice(candidates['tool'][op2_ind])
 
-            if sol['direction'][op1_ind] in operations[op2].direction:
-                new_sol['direction'][op2_ind] = sol['direction'][op1_ind]
+            if direction[op1_ind] in candidate_sets['direction'][op2_ind]:
+                new_direction[op2_ind] = direction[op1_ind]
             else:
-                new_sol['direction'][op2_ind] = np.random.choice(operations[op2].direction)
-    return new_sol
+                new_direction[op2_ind] = np.random.choice(candidates['direction'][op2_ind])
+    sol[1:] = new_machine, new_tool, new_direction
 
 
-def main(npop, maxFE, c1, c2, w, k1, k2, specifications):
+def main(npop, maxFE, c1, c2, w, k1, k2, specifications, checkpoint=None, checkpoint_interval=60, resume=False,
+         callback=None, init=None):
     """
     The main function.
     :param npop: population size (default = 500)
@@ -252,8 +262,16 @@ def main(npop, maxFE, c1, c2, w, k1, k2, specifications):
     :param k1: the first parameter in adaptive mutation probability (default = 0.5)
     :param k2: the second parameter in adaptive mutation probability (default = 0.005)
     :param specifications: the specifications of FPP
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param callback: called as callback(objective, plan, FE, elapsed time) with each new incumbent, and with
+        objective = plan = None at the start of each iteration; the search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case), which seed the swarm
+        after repair (None: a random swarm)
     :return:
     """
+    start = time.perf_counter()  # the start time of the solve
     operations = specifications['operations']
     op2ind = specifications['op2ind']
     if specifications['type']['alternative']:
@@ -269,50 +287,77 @@ def main(npop, maxFE, c1, c2, w, k1, k2, specifications):
             if op1 in operations[op2].prior:
                 op2_ind = op2ind[op2]
                 precedence[op1_ind, op2_ind] = 1
-    closure_pairs = transitive_closure(operations)  # transitive closure pairs
-    sols = initialize_population(npop, nops, precedence, specifications)  # solutions
-    objs = [cal_objective(sol, specifications) for sol in sols]  # objectives
-    pbest = objs.copy()  # the personal best
-    pbest_sol = copy.deepcopy(sols)  # the personal best solutions
-    FE += npop
-    gbest = min(objs)  # the global best
-    gbest_sol = copy.deepcopy(sols[objs.index(gbest)])  # the global best solution
-    conFE = FE  # convergence function iteration
+    closure_pairs = {(op2ind[op1], op2ind[op2]) for op1, op2 in transitive_closure(operations)}  # transitive closure pairs
+    encoding = encode_resources(specifications)
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'FSDPSO', specifications, checkpoint_interval)
+    keys = ('sols', 'objs', 'objs_sum', 'objs_max', 'pbest', 'pbest_sol', 'gbest', 'gbest_sol', 'FE', 'conFE')
+    state = checkpointer.load(*keys) if resume else None
+    if state is None:
+        seeds = [encode_plan(plan, encoding, specifications)
+                 for plan in FPP_warmstart.initial_plans(init, specifications, npop)]
+        sols = np.concatenate([np.array(seeds, dtype=np.int64).reshape(-1, 4, nops),
+                               initialize_population(npop - len(seeds), nops, precedence, encoding)])  # solutions
+        objs = [cal_encoded_objective(sol, encoding, specifications) for sol in sols]  # objectives
+        objs_sum, objs_max = sum(objs), max(objs)  # the statistics of the adaptive mutation probability
+        pbest = objs.copy()  # the personal best
+        pbest_sol = sols.copy()  # the personal best solutions
+        FE += npop
+        gbest = min(objs)  # the global best
+        gbest_sol = sols[objs.index(gbest)].copy()  # the global best solution
+        conFE = FE  # convergence function iteration
+    else:
+        sols, objs, objs_sum, objs_max, pbest, pbest_sol, gbest, gbest_sol, FE, conFE = state
+    stopped = False  # whether the callback has stopped the search
+    if callback is not None:
+        stopped = callback(gbest, decode_solution(gbest_sol, encoding, specifications), FE, time.perf_counter() - start)
 
     # Step 2. Optimization
-    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=npop) as pbar:
-        while FE <= maxFE:
+    lower_bound = specifications.get('lower_bound', -float('inf'))  # the search stops once the lower bound is reached
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE and gbest > lower_bound and not stopped:
+            if checkpointer.due():
+                checkpointer.save(sols=sols, objs=objs, objs_sum=objs_sum, objs_max=objs_max, pbest=pbest,
+                                  pbest_sol=pbest_sol, gbest=gbest, gbest_sol=gbest_sol, FE=FE, conFE=conFE)
+            if callback is not None and callback(None, None, FE, time.perf_counter() - start):
+                break
 
             for k in range(npop):
+                new_sol = sols[k]  # the particle is updated in place
                 r, r1, r2 = np.random.random(), np.random.random(), np.random.random()
                 if r < w / (c1 * r1 + c2 * r2 + w):
-                    new_sol = copy.deepcopy(sols[k])
+                    pass
                 elif r < (w + c1 * r1) / (c1 * r1 + c2 * r2 + w):
-                    new_sol = fragment_crossover(sols[k], pbest_sol[k])
-                    new_sol = uniform_crossover(new_sol, pbest_sol[k])
+                    fragment_crossover(new_sol, pbest_sol[k])
+                    uniform_crossover(new_sol, pbest_sol[k])
                 else:
-                    new_sol = fragment_crossover(sols[k], gbest_sol)
-                    new_sol = uniform_crossover(new_sol, gbest_sol)
-                pm = k1 * (max(objs) - objs[k]) / (max(objs) - sum(objs) / len(objs)) + k2
+                    fragment_crossover(new_sol, gbest_sol)
+                    uniform_crossover(new_sol, gbest_sol)
+                pm = k1 * (objs_max - objs[k]) / (objs_max - objs_sum / npop) + k2
                 if np.random.random() < pm:
-                    new_sol = fragment_mutation(new_sol, closure_pairs)
+                    fragment_mutation(new_sol, closure_pairs)
                 if np.random.random() < pm:
-                    new_sol = greedy_mutation(new_sol, specifications) if np.random.random() < 0.5 else greedy_mutation(new_sol, specifications)
-                sols[k] = copy.deepcopy(new_sol)
-                new_obj = cal_objective(new_sol, specifications)
+                    greedy_mutation(new_sol, encoding, specifications) if np.random.random() < 0.5 else greedy_mutation(new_sol, encoding, specifications)
+                new_obj = cal_encoded_objective(new_sol, encoding, specifications)
+                old_obj = objs[k]
                 objs[k] = new_obj
+                objs_sum += new_obj - old_obj
+                if new_obj >= objs_max:
+                    objs_max = new_obj
+                elif old_obj == objs_max:
+                    objs_max = max(objs)  # the worst particle has improved
                 FE += 1
                 pbar.update(1)
                 if new_obj < pbest[k]:
                     pbest[k] = new_obj
-                    pbest_sol[k] = copy.deepcopy(new_sol)
+                    pbest_sol[k] = new_sol
                     if new_obj < gbest:
                         gbest = new_obj
-                        gbest_sol = copy.deepcopy(new_sol)
+                        gbest_sol[:] = new_sol
                         conFE = FE
+                        if callback is not None and callback(gbest, decode_solution(gbest_sol, encoding, specifications),
+                                                             FE, time.perf_counter() - start):
+                            stopped = True
+                            break
 
     # Step 3. Output
-    best_sol = []
-    for i in range(len(gbest_sol['operation'])):
-        best_sol.append(gbest_sol['operation'][i] + '&' + gbest_sol['machine'][i] + '&' + gbest_sol['tool'][i] + '&' + gbest_sol['direction'][i])
-    return gbest, best_sol, conFE
+    return gbest, decode_solution(gbest_sol, encoding, specifications), conFE
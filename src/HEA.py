@@ -1,8 +1,11 @@
 # Hybrid evolutionary algorithm (HEA)
 # Reference: Liu Q, Li X, Gao L. Mathematical modeling and a hybrid evolutionary algorithm for process planning[J]. Journal of Intelligent Manufacturing, 2021, 32: 781-797.
 import copy
+import time
 import numpy as np
 from tqdm import tqdm
+import FPP_checkpoint
+import FPP_warmstart
 
 
 def transitive_closure(ops):
@@ -86,12 +89,57 @@ def initialization_population(npop, nops, precedence, specifications):
     return pops
 
 
+def copy_solution(sol):
+    # copy the chromosomes of a solution (the genes are immutable, so a deep copy is not needed)
+    return {key: chromosome.copy() for key, chromosome in sol.items()}
+
+
+def decode_solution(sol, specifications):
+    # the process plan of a solution (the performed operations in order, with the resources of their genes)
+    alternatives = specifications['alternatives']
+    op2ind = specifications['op2ind']
+    not_performed_operations = {alternatives[i][j] for i in range(len(sol['or'])) for j in range(len(alternatives[i]))
+                                if sol['or'][i] != j}
+    plan = []
+    for op in sol['operation']:
+        if op not in not_performed_operations:
+            idx = op2ind[op]
+            plan.append(op + '&' + sol['machine'][idx] + '&' + sol['tool'][idx] + '&' + sol['direction'][idx])
+    return plan
+
+
+def encode_plan(plan, specifications):
+    # the solution of a process plan (the unperformed alternative operations are placed as early as possible, on their
+    # cheapest resources)
+    operations = specifications['operations']
+    alternatives = specifications['alternatives']
+    ind2op = specifications['ind2op']
+    performed = [state.split('&')[0] for state in plan]
+    resources = {op: tuple(state.split('&')[1:]) for op, state in zip(performed, plan)}
+    unperformed = [op for op in operations if op not in resources]
+    for op in unperformed:
+        resources[op] = tuple(FPP_warmstart.cheapest_state([op], specifications).split('&')[1:])
+    return {
+        'operation': FPP_warmstart.order_sequence(unperformed + performed, operations),
+        'machine': [resources[ind2op[i]][0] for i in range(len(operations))],
+        'tool': [resources[ind2op[i]][1] for i in range(len(operations))],
+        'direction': [resources[ind2op[i]][2] for i in range(len(operations))],
+        'or': [next(j for j, op in enumerate(alt) if op not in unperformed) for alt in alternatives],
+    }
+
+
+def solution_key(sol):
+    # the hashable chromosomes of a solution (identical solutions have equal keys)
+    return tuple(sol['operation']), tuple(sol['machine']), tuple(sol['tool']), tuple(sol['direction']), tuple(sol['or'])
+
+
 def cal_objective(sol, specifications):
     # calculate the objective value
-    objective = specifications['type']['objective']
     alternatives = specifications['alternatives']
-    indices = specifications['indices']
+    states = specifications['states']
     op2ind = specifications['op2ind']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
 
     obj = 0
     not_performed_operations = []
@@ -100,42 +148,99 @@ def cal_objective(sol, specifications):
             if sol['or'][i] != j:
                 not_performed_operations.append(alternatives[i][j])
     ops = [op for op in sol['operation'] if op not in not_performed_operations]
-    machine = []
-    tool = []
-    direction = []
+    m1 = t1 = d1 = None
     for op in ops:
         idx = op2ind[op]
-        machine.append(sol['machine'][idx])
-        tool.append(sol['tool'][idx])
-        direction.append(sol['direction'][idx])
-
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-        for i in range(len(ops)):
-            string = ops[i] + '&' + machine[i] + '&' + tool[i] + '&' + direction[i]
-            obj += indices[ops[i]][string]
-            if i != 0:
-                if machine[i] != machine[i - 1]:
-                    obj += mcc
-                if machine[i] != machine[i - 1] or tool[i] != tool[i - 1]:
-                    obj += tcc
-                if machine[i] != machine[i - 1] or direction[i] != direction[i - 1]:
-                    obj += scc
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
-        for i in range(len(ops)):
-            string = ops[i] + '&' + machine[i] + '&' + tool[i] + '&' + direction[i]
-            obj += indices[ops[i]][string]
-            if i != 0:
-                if machine[i] != machine[i - 1]:
-                    obj += mct[machine[i - 1]][machine[i]]
-                if machine[i] != machine[i - 1] or tool[i] != tool[i - 1]:
-                    obj += tct
-                if machine[i] != machine[i - 1] or direction[i] != direction[i - 1]:
-                    obj += sct
+        _, m2, t2, d2, usage = states[op + '&' + sol['machine'][idx] + '&' + sol['tool'][idx] + '&' + sol['direction'][idx]]
+        obj += usage
+        if m1 is not None:
+            if m1 != m2:
+                obj += mc[m1][m2]
+            if m1 != m2 or t1 != t2:
+                obj += tc
+            if m1 != m2 or d1 != d2:
+                obj += sc
+        m1, t1, d1 = m2, t2, d2
     return obj
 
 
+def cal_partial_cost(sol, positions, specifications):
+    # calculate the usages of the performed operations at the given positions of the operation chromosome and the
+    # changeovers of the consecutive performed operations spanning any of the positions
+    alternatives = specifications['alternatives']
+    states = specifications['states']
+    op2ind = specifications['op2ind']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
+    ops = sol['operation']
+    n = len(ops)
+    not_performed_operations = {alternatives[i][j] for i in range(len(sol['or'])) for j in range(len(alternatives[i]))
+                                if sol['or'][i] != j}
+    resources = {}
+
+    def resource(i):
+        if i not in resources:
+            op = ops[i]
+            idx = op2ind[op]
+            resources[i] = states[op + '&' + sol['machine'][idx] + '&' + sol['tool'][idx] + '&' + sol['direction'][idx]]
+        return resources[i]
+
+    cost = 0
+    edges = set()
+    for p in positions:
+        prev_p = p - 1
+        while prev_p >= 0 and ops[prev_p] in not_performed_operations:
+            prev_p -= 1
+        next_p = p + 1
+        while next_p < n and ops[next_p] in not_performed_operations:
+            next_p += 1
+        if ops[p] in not_performed_operations:
+            if prev_p >= 0 and next_p < n:
+                edges.add((prev_p, next_p))
+            continue
+        cost += resource(p)[4]
+        if prev_p >= 0:
+            edges.add((prev_p, p))
+        if next_p < n:
+            edges.add((p, next_p))
+    for i, j in edges:
+        _, m1, t1, d1, _ = resource(i)
+        _, m2, t2, d2, _ = resource(j)
+        if m1 != m2:
+            cost += mc[m1][m2]
+        if m1 != m2 or t1 != t2:
+            cost += tc
+        if m1 != m2 or d1 != d2:
+            cost += sc
+    return cost
+
+
+def cal_delta_objective(parent, parent_obj, child, positions, specifications):
+    # calculate the objective value of child from that of parent, which differ only at the given positions of the operation
+    # chromosome (delta evaluation); a full evaluation is used when the positions are unknown (None) or many
+    if positions is None or 4 * len(positions) > len(child['operation']):
+        return cal_objective(child, specifications)
+    return parent_obj - cal_partial_cost(parent, positions, specifications) + cal_partial_cost(child, positions, specifications)
+
+
+def crossover_positions(parent, child, operation_range, resource_ranges, or_point, specifications):
+    # the positions of the operation chromosome of a crossover child that may differ from its parent (None if many)
+    alternatives = specifications['alternatives']
+    ind2op = specifications['ind2op']
+    ops = child['operation']
+    genes = [k for key, (start, end) in zip(('machine', 'tool', 'direction'), resource_ranges) for k in range(start, end)
+             if child[key][k] != parent[key][k]]
+    groups = [r for r in range(or_point, len(child['or'])) if child['or'][r] != parent['or'][r]]
+    if 4 * (operation_range[1] - operation_range[0] + len(genes) + sum(len(alternatives[r]) for r in groups)) > len(ops):
+        return None
+    positions = set(range(operation_range[0], operation_range[1]))
+    changed_ops = [ind2op[k] for k in genes] + [op for r in groups for op in alternatives[r]]
+    if changed_ops:
+        position = {op: i for i, op in enumerate(ops)}
+        positions.update(position[op] for op in changed_ops)
+    return positions
+
+
 def tournament_selection(sols, objs, tournament_size=8):
     # tournament selection
     tournament_contestants = np.random.choice(range(len(sols)), tournament_size, replace=False)
@@ -147,11 +252,11 @@ def single_point_crossover(parent1, parent2):
     # the single-point crossover for OR chromosomes
     length = len(parent1)
     if length < 2:
-        return parent1, parent2
+        return parent1, parent2, length
     point = np.random.randint(1, length - 1)
     child1 = parent1[:point] + parent2[point:]
     child2 = parent2[:point] + parent1[point:]
-    return child1, child2
+    return child1, child2, point
 
 
 def two_point_crossover(parent1, parent2):
@@ -161,7 +266,7 @@ def two_point_crossover(parent1, parent2):
     point2 = np.random.randint(point1 + 1, length)
     child1 = parent1[:point1] + parent2[point1: point2] + parent1[point2:]
     child2 = parent2[:point1] + parent1[point1: point2] + parent2[point2:]
-    return child1, child2
+    return child1, child2, (point1, point2)
 
 
 def operation_crossover(parent1, parent2):
@@ -180,18 +285,19 @@ def operation_crossover(parent1, parent2):
         if parent1[i] in temp_parent2:
             child2[idx2] = parent1[i]
             idx2 += 1
-    return child1, child2
+    return child1, child2, (point1, point2)
 
 
 def single_point_mutation(parent, specifications):
-    # the single-point mutation for resource and OR chromosomes
+    # the single-point mutation for resource and OR chromosomes (the changed positions of the operation chromosome are returned for delta evaluation)
     operations = specifications['operations']
     alternatives = specifications['alternatives']
     ind2op = specifications['ind2op']
 
     case = np.random.randint(1, len(parent))
-    child = copy.deepcopy(parent)
+    child = copy_solution(parent)
     length = len(parent['operation'])
+    changed_ops = []
     # machine chromosome mutation
     if case == 1:
         chromosome = parent['machine']
@@ -200,6 +306,7 @@ def single_point_mutation(parent, specifications):
         filtered_elements = [e for e in op.machine if e != chromosome[point]]
         if filtered_elements:
             child['machine'][point] = np.random.choice(filtered_elements)
+            changed_ops = [ind2op[point]]
     # tool chromosome mutation
     elif case == 2:
         chromosome = parent['tool']
@@ -208,6 +315,7 @@ def single_point_mutation(parent, specifications):
         filtered_elements = [e for e in op.tool if e != chromosome[point]]
         if filtered_elements:
             child['tool'][point] = np.random.choice(filtered_elements)
+            changed_ops = [ind2op[point]]
     # direction chromosome mutation
     elif case == 3:
         chromosome = parent['direction']
@@ -216,6 +324,7 @@ def single_point_mutation(parent, specifications):
         filtered_elements = [e for e in op.direction if e != chromosome[point]]
         if filtered_elements:
             child['direction'][point] = np.random.choice(filtered_elements)
+            changed_ops = [ind2op[point]]
     # OR chromosome mutation
     else:
         chromosome = parent['or']
@@ -223,7 +332,8 @@ def single_point_mutation(parent, specifications):
             point = np.random.randint(0, len(alternatives))
             filtered_elements = [e for e in range(len(alternatives[point])) if e != chromosome[point]]
             child['or'][point] = np.random.choice(filtered_elements)
-    return child
+            changed_ops = alternatives[point]
+    return child, [child['operation'].index(op) for op in changed_ops]
 
 
 def find_mutation_range(sol, closure_pairs, idx):
@@ -252,7 +362,7 @@ def find_mutation_range(sol, closure_pairs, idx):
 
 def two_point_mutation(parent, closure_pairs):
     # the two-point mutation for operation chromosome (Table 8 may generate infeasible solutions!)
-    child = copy.deepcopy(parent)
+    child = copy_solution(parent)
     chromosome = parent['operation']
     idx1 = np.random.randint(0, len(chromosome))
     mutation_range = find_mutation_range(chromosome, closure_pairs, idx1)
@@ -261,47 +371,70 @@ def two_point_mutation(parent, closure_pairs):
         mutation_range = find_mutation_range(chromosome, closure_pairs, idx1)
     idx2 = np.random.choice(mutation_range)
     child['operation'][idx1], child['operation'][idx2] = parent['operation'][idx2], parent['operation'][idx1]
-    return child
+    return child, [idx1, idx2]
 
 
-def SA_operator(pops, objs, temperature, closure_pairs, specifications):
-    # the simulated annealing operator
+def SA_operator(pops, objs, keys, members, temperature, closure_pairs, specifications, scalarize=None):
+    # the simulated annealing operator (members: the objectives of the current solutions, which are not re-evaluated;
+    # scalarize: the function of the index and objective of a solution whose value is compared by the acceptance, the
+    # objective by default)
     npop = len(pops)
+    nevals = 0  # the number of function evaluations
     for i in range(npop):
-        parent1 = copy.deepcopy(pops[i])
-        parent2 = copy.deepcopy(np.random.choice(pops))
+        parent1 = copy_solution(pops[i])
+        parent2 = copy_solution(np.random.choice(pops))
+        operation, _, operation_range = operation_crossover(parent1['operation'], parent2['operation'])
+        machine, _, machine_range = two_point_crossover(parent1['machine'], parent2['machine'])
+        tool, _, tool_range = two_point_crossover(parent1['tool'], parent2['tool'])
+        direction, _, direction_range = two_point_crossover(parent1['direction'], parent2['direction'])
+        or_chromosome, _, or_point = single_point_crossover(parent1['or'], parent2['or'])
         new_sol = {
-            'operation': operation_crossover(parent1['operation'], parent2['operation'])[0],
-            'machine': two_point_crossover(parent1['machine'], parent2['machine'])[0],
-            'tool': two_point_crossover(parent1['tool'], parent2['tool'])[0],
-            'direction': two_point_crossover(parent1['direction'], parent2['direction'])[0],
-            'or': single_point_crossover(parent1['or'], parent2['or'])[0],
+            'operation': operation,
+            'machine': machine,
+            'tool': tool,
+            'direction': direction,
+            'or': or_chromosome,
         }
-        new_sol = two_point_mutation(new_sol, closure_pairs)
-        new_sol = single_point_mutation(new_sol, specifications)
-        new_obj = cal_objective(new_sol, specifications)
-        if new_obj <= objs[i] or np.random.random() < np.exp(-(new_obj - objs[i]) / temperature):
+        positions = crossover_positions(parent1, new_sol, operation_range, (machine_range, tool_range, direction_range),
+                                        or_point, specifications)
+        new_sol, positions1 = two_point_mutation(new_sol, closure_pairs)
+        new_sol, positions2 = single_point_mutation(new_sol, specifications)
+        if positions is not None:
+            positions.update(positions1, positions2)
+        new_key = solution_key(new_sol)
+        new_obj = members.get(new_key)
+        if new_obj is None:
+            new_obj = cal_delta_objective(parent1, objs[i], new_sol, positions, specifications)
+            members[new_key] = new_obj
+            nevals += 1
+        value, new_value = (objs[i], new_obj) if scalarize is None else (scalarize(i, objs[i]), scalarize(i, new_obj))
+        if new_value <= value or np.random.random() < np.exp(-(new_value - value) / temperature):
             pops[i] = new_sol
             objs[i] = new_obj
-    return pops, objs
+            keys[i] = new_key
+    return pops, objs, keys, nevals
 
 
-def GA_operator(pops, objs, pc, pm, closure_pairs, specifications):
-    # the genetic algorithm operator
+def GA_operator(pops, objs, members, pc, pm, closure_pairs, specifications, fitness=None):
+    # the genetic algorithm operator (members: the objectives of the current solutions, which are not re-evaluated;
+    # fitness: the values minimized by the tournament selection, the objectives by default)
     mating_pool = []  # mating pool
+    mating_objs = []  # the objectives of the mating pool
     new_pops = []
+    new_positions = []  # the positions of the offspring that may differ from their parents in the mating pool
     nm = int(len(pops) * pc)  # mating pool size
     nm = nm if nm % 2 == 0 else nm + 1
     for _ in range(nm):
-        temp_sol = copy.deepcopy(pops[tournament_selection(pops, objs)])
-        mating_pool.append(temp_sol)
+        idx = tournament_selection(pops, objs if fitness is None else fitness)
+        mating_pool.append(copy_solution(pops[idx]))
+        mating_objs.append(objs[idx])
     for i in range(0, nm, 2):
         parent1, parent2 = mating_pool[i], mating_pool[i + 1]
-        operation1, operation2 = operation_crossover(parent1['operation'], parent2['operation'])
-        machine1, machine2 = two_point_crossover(parent1['machine'], parent2['machine'])
-        tool1, tool2 = two_point_crossover(parent1['tool'], parent2['tool'])
-        direction1, direction2 = two_point_crossover(parent1['direction'], parent2['direction'])
-        or1, or2 = single_point_crossover(parent1['or'], parent2['or'])
+        operation1, operation2, operation_range = operation_crossover(parent1['operation'], parent2['operation'])
+        machine1, machine2, machine_range = two_point_crossover(parent1['machine'], parent2['machine'])
+        tool1, tool2, tool_range = two_point_crossover(parent1['tool'], parent2['tool'])
+        direction1, direction2, direction_range = two_point_crossover(parent1['direction'], parent2['direction'])
+        or1, or2, or_point = single_point_crossover(parent1['or'], parent2['or'])
         new_pops.append({
             'operation': operation1,
             'machine': machine1,
@@ -316,22 +449,46 @@ def GA_operator(pops, objs, pc, pm, closure_pairs, specifications):
             'direction': direction2,
             'or': or2,
         })
+        resource_ranges = (machine_range, tool_range, direction_range)
+        new_positions.append(crossover_positions(parent1, new_pops[-2], operation_range, resource_ranges, or_point, specifications))
+        new_positions.append(crossover_positions(parent2, new_pops[-1], operation_range, resource_ranges, or_point, specifications))
     for i in range(nm):
         if np.random.random() < pm:
             parent = mating_pool[i]
-            child = two_point_mutation(parent, closure_pairs)
-            child = single_point_mutation(child, specifications)
+            child, positions1 = two_point_mutation(parent, closure_pairs)
+            child, positions2 = single_point_mutation(child, specifications)
             new_pops[i] = child
-    return new_pops, [cal_objective(sol, specifications) for sol in new_pops]
-
-
-def environmental_selection(pops, objs, npop):
-    # environmental selection
-    paired = list(zip(pops, objs))
-    sorted_paired = sorted(paired, key=lambda x: x[1])
-    selected = sorted_paired[: npop]
-    selected_pops, selected_objs = zip(*selected)
-    return list(selected_pops), list(selected_objs)
+            new_positions[i] = set(positions1) | set(positions2)
+    new_objs = []
+    new_keys = []
+    nevals = 0  # the number of function evaluations
+    for i in range(nm):
+        new_key = solution_key(new_pops[i])
+        new_obj = members.get(new_key)
+        if new_obj is None:
+            new_obj = cal_delta_objective(mating_pool[i], mating_objs[i], new_pops[i], new_positions[i], specifications)
+            members[new_key] = new_obj
+            nevals += 1
+        new_objs.append(new_obj)
+        new_keys.append(new_key)
+    return new_pops, new_objs, new_keys, nevals
+
+
+def environmental_selection(pops, objs, keys, npop):
+    # environmental selection: the best npop distinct solutions (duplicates only fill a population with too few of them)
+    first = {}
+    for i, key in enumerate(keys):
+        first.setdefault(key, i)
+    unique = np.fromiter(first.values(), dtype=np.int64, count=len(first))
+    objs_array = np.array(objs)
+    if len(unique) >= npop:
+        selected = unique[np.argpartition(objs_array[unique], npop - 1)[: npop]]
+    else:
+        duplicates = np.setdiff1d(np.arange(len(keys)), unique)
+        nfill = npop - len(unique)
+        selected = np.concatenate((unique, duplicates[np.argpartition(objs_array[duplicates], nfill - 1)[: nfill]]))
+    selected = selected.tolist()
+    return [pops[i] for i in selected], [objs[i] for i in selected], [keys[i] for i in selected]
 
 
 def check_feasibility(ops, closure_pairs):
@@ -342,7 +499,8 @@ def check_feasibility(ops, closure_pairs):
     return True
 
 
-def main(npop, maxFE, pc, pm, T0, alpha, specifications):
+def main(npop, maxFE, pc, pm, T0, alpha, specifications, checkpoint=None, checkpoint_interval=60, resume=False,
+         callback=None, init=None):
     """
     The main function.
     :param npop: population size (default = 400)
@@ -352,8 +510,16 @@ def main(npop, maxFE, pc, pm, T0, alpha, specifications):
     :param T0: the initial temperature for simulated annealing (default = 1000)
     :param alpha: cooling rate (default = 0.99)
     :param specifications: the specifications of FPP
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param callback: called as callback(objective, plan, FE, elapsed time) with each new incumbent, and with
+        objective = plan = None at the start of each iteration; the search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case), which seed the population
+        after repair (None: a random population)
     :return:
     """
+    start = time.perf_counter()  # the start time of the solve
     operations = specifications['operations']
     alternatives = specifications['alternatives']
     op2ind = specifications['op2ind']
@@ -371,34 +537,49 @@ def main(npop, maxFE, pc, pm, T0, alpha, specifications):
             if op1 in operations[op2].prior:
                 op2_ind = op2ind[op2]
                 precedence[op1_ind, op2_ind] = 1
-    sols = initialization_population(npop, nops, precedence, specifications)  # solutions
-    objs = [cal_objective(sol, specifications) for sol in sols]  # objectives
-    FE += npop
-    gbest = min(objs)  # the global best
-    gbest_sol = copy.deepcopy(sols[objs.index(gbest)])  # the global best solution
-    conFE = FE  # the convergence function evaluation
-    temperature = T0  # temperature
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'HEA', specifications, checkpoint_interval)
+    state = checkpointer.load('sols', 'objs', 'keys', 'gbest', 'gbest_sol', 'FE', 'conFE', 'temperature') if resume else None
+    if state is None:
+        sols = [encode_plan(plan, specifications) for plan in FPP_warmstart.initial_plans(init, specifications, npop)]
+        sols += initialization_population(npop - len(sols), nops, precedence, specifications)  # solutions
+        objs = [cal_objective(sol, specifications) for sol in sols]  # objectives
+        keys = [solution_key(sol) for sol in sols]  # the chromosome keys
+        FE += npop
+        gbest = min(objs)  # the global best
+        gbest_sol = copy.deepcopy(sols[objs.index(gbest)])  # the global best solution
+        conFE = FE  # the convergence function evaluation
+        temperature = T0  # temperature
+    else:
+        sols, objs, keys, gbest, gbest_sol, FE, conFE, temperature = state
+    stopped = False  # whether the callback has stopped the search
+    if callback is not None:
+        stopped = callback(gbest, decode_solution(gbest_sol, specifications), FE, time.perf_counter() - start)
 
     # Step 2. Optimization
-    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=npop) as pbar:
-        while FE <= maxFE:
-            new_sols, new_objs = SA_operator(sols, objs, temperature, closure_pairs, specifications)
-            new_sols, new_objs = GA_operator(new_sols, new_objs, pc, pm, closure_pairs, specifications)
-            temp_sols = sols + new_sols
-            temp_objs = objs + new_objs
-            sols, objs = environmental_selection(temp_sols, temp_objs, npop)
-            FE += (npop + len(new_objs))
-            pbar.update(int(npop + len(new_objs)))
+    lower_bound = specifications.get('lower_bound', -float('inf'))  # the search stops once the lower bound is reached
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE and gbest > lower_bound and not stopped:
+            if checkpointer.due():
+                checkpointer.save(sols=sols, objs=objs, keys=keys, gbest=gbest, gbest_sol=gbest_sol, FE=FE, conFE=conFE,
+                                  temperature=temperature)
+            if callback is not None and callback(None, None, FE, time.perf_counter() - start):
+                break
+            members = dict(zip(keys, objs))  # the offspring identical to a current solution are not re-evaluated
+            sols, objs, keys, SA_evals = SA_operator(sols, objs, keys, members, temperature, closure_pairs, specifications)
+            new_sols, new_objs, new_keys, GA_evals = GA_operator(sols, objs, members, pc, pm, closure_pairs, specifications)
+            sols, objs, keys = environmental_selection(sols + new_sols, objs + new_objs, keys + new_keys, npop)
+            FE += SA_evals + GA_evals
+            pbar.update(SA_evals + GA_evals)
             temperature *= alpha
+            if not SA_evals + GA_evals:
+                break  # the offspring only revisit the current solutions
 
             if min(objs) < gbest:
                 gbest = min(objs)
                 gbest_sol = copy.deepcopy(sols[objs.index(gbest)])
                 conFE = FE
+                if callback is not None and callback(gbest, decode_solution(gbest_sol, specifications), FE, time.perf_counter() - start):
+                    stopped = True
 
     # Step 3. Output
-    best_sol = []
-    for i in range(len(gbest_sol['operation'])):
-        best_sol.append(gbest_sol['operation'][i] + '&' + gbest_sol['machine'][i] + '&' + gbest_sol['tool'][i] + '&' +
-                        gbest_sol['direction'][i])
-    return gbest, best_sol, conFE
+    return gbest, decode_solution(gbest_sol, specifications), conFE
@@ -1,8 +1,11 @@
 # Improved sequence learning harmony search (ISLHS)
 import copy
 import heapq
+import time
 import numpy as np
 from tqdm import tqdm
+import FPP_checkpoint
+import FPP_warmstart
 
 
 def dijkstra(graph, source, target):
@@ -38,77 +41,42 @@ def dijkstra(graph, source, target):
 def construct_graph(sol, specifications):
     # construct graph based on the solution to transform the selection of alternative operations and the allocation of manufacturing resources into the shortest path problem (cost)
     graph = {'s': {}, 'd': {}}
-    objective = specifications['type']['objective']
-    indices = specifications['indices']
-    alternative_operations = specifications['alternative_operations']
+    group_states = specifications['group_states']  # the non-dominated states of each operation and its alternatives
 
-    for state in indices[sol[1]]:
-        graph['s'][state] = indices[sol[1]][state]
-    if sol[1] in alternative_operations:
-        for op1 in alternative_operations[sol[1]]:
-            for state in indices[op1]:
-                graph['s'][state] = indices[op1][state]
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-        for i in range(1, len(sol) - 2):
-            op1, op2 = sol[i], sol[i + 1]
-            ops1, ops2 = [op1], [op2]
-            if op1 in alternative_operations:
-                ops1 += list(alternative_operations[op1])
-            if op2 in alternative_operations:
-                ops2 += list(alternative_operations[op2])
-            for op1 in ops1:
-                for state1 in indices[op1]:
-                    [_, m1, t1, d1] = state1.split('&')
-                    graph[state1] = {}
-                    for op2 in ops2:
-                        for state2 in indices[op2]:
-                            [_, m2, t2, d2] = state2.split('&')
-                            weight = indices[op2][state2]
-                            if m1 != m2:
-                                weight += mcc
-                            if m1 != m2 or t1 != t2:
-                                weight += tcc
-                            if m1 != m2 or d1 != d2:
-                                weight += scc
-                            graph[state1][state2] = weight
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
-        for i in range(1, len(sol) - 2):
-            op1, op2 = sol[i], sol[i + 1]
-            ops1, ops2 = [op1], [op2]
-            if op1 in alternative_operations:
-                ops1 += list(alternative_operations[op1])
-            if op2 in alternative_operations:
-                ops2 += list(alternative_operations[op2])
-            for op1 in ops1:
-                for state1 in indices[op1]:
-                    [_, m1, t1, d1] = state1.split('&')
-                    graph[state1] = {}
-                    for op2 in ops2:
-                        for state2 in indices[op2]:
-                            [_, m2, t2, d2] = state2.split('&')
-                            weight = indices[op2][state2]
-                            if m1 != m2:
-                                weight += mct[m1][m2]
-                            if m1 != m2 or t1 != t2:
-                                weight += tct
-                            if m1 != m2 or d1 != d2:
-                                weight += sct
-                            graph[state1][state2] = weight
-    for state in indices[sol[-2]]:
-        graph[state] = {'d': 0}
-    if sol[-2] in alternative_operations:
-        for op1 in alternative_operations[sol[-2]]:
-            for state in indices[op1]:
-                graph[state] = {'d': 0}
+    for state, _, _, _, usage in group_states[sol[1]]:
+        graph['s'][state] = usage
+    changeover = specifications['changeover']  # the dense changeover of both objectives
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
+    for i in range(1, len(sol) - 2):
+        states2 = group_states[sol[i + 1]]
+        for state1, m1, t1, d1, _ in group_states[sol[i]]:
+            graph[state1] = {}
+            mc1 = mc[m1]
+            for state2, m2, t2, d2, weight in states2:
+                if m1 != m2:
+                    weight += mc1[m2]
+                if m1 != m2 or t1 != t2:
+                    weight += tc
+                if m1 != m2 or d1 != d2:
+                    weight += sc
+                graph[state1][state2] = weight
+    for state in group_states[sol[-2]]:
+        graph[state[0]] = {'d': 0}
     return graph
 
 
 def cal_objective(sol, specifications):
     # calculate the objective value of a given sequence of operations
+    cache = specifications.get('cache')  # the persistent evaluation cache (optional)
+    if cache is not None:
+        result = cache.get(specifications['hash'], sol)
+        if result is not None:
+            return result
     graph = construct_graph(sol, specifications)
-    return dijkstra(graph, 's', 'd')
+    obj, plan = dijkstra(graph, 's', 'd')
+    if cache is not None:
+        cache.put(specifications['hash'], sol, obj, plan)
+    return obj, plan
 
 
 def cal_precedence(precedence):
@@ -123,14 +91,22 @@ def cal_precedence(precedence):
     return p
 
 
-def main(hms, maxFE, specifications):
+def main(hms, maxFE, specifications, checkpoint=None, checkpoint_interval=60, resume=False, callback=None, init=None):
     """
     The main function.
     :param hms: harmony memory size (default = 10)
     :param maxFE: the maximum function evaluations (default = 1000 * the number of operations)
     :param specifications: the specifications of FPP
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param callback: called as callback(objective, plan, FE, elapsed time) with each new incumbent, and with
+        objective = plan = None at the start of each iteration; the search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case), which seed the harmony
+        memory after repair (None: a random harmony memory)
     :return:
     """
+    start = time.perf_counter()  # the start time of the solve
     operations = specifications['operations']
     alternatives = specifications['alternatives']
     alternative_operations = specifications['alternative_operations']
@@ -168,34 +144,51 @@ def main(hms, maxFE, specifications):
     q = u * v  # the qualification status
 
     # Step 3. Initial solutions
-    for _ in range(hms):
-        temp_sol = ['s']
-        temp_p = precedence.copy()
-        temp_v = v.copy()
-        temp_q = q.copy()
-        for k in range(nops):
-            cs = np.where(temp_q == 1)[0]  # the candidate set
-            op_ind = np.random.choice(cs)
-            op = new_ind2op[op_ind]  # the selected operation
-            temp_p[op_ind] = 0
-            temp_v[op_ind] = 0
-            temp_u = cal_precedence(temp_p)
-            temp_q = temp_u * temp_v
-            temp_sol.append(op)
-        temp_sol.append('d')
-        sols.append(temp_sol)
-        obj, plan = cal_objective(temp_sol, specifications)
-        objs.append(obj)
-        plans.append(plan)
-    gbest = min(objs)  # the global best
-    gbest_plan = plans[objs.index(gbest)].copy()  # the global best plan
-    gworst = max(objs)  # the global worst
-    FE += hms
-    conFE = FE  # the convergence function evaluation
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'ISLHS', specifications, checkpoint_interval)
+    keys = ('sols', 'objs', 'plans', 'gbest', 'gbest_plan', 'gworst', 'FE', 'conFE')
+    state = checkpointer.load(*keys) if resume else None
+    if state is None:
+        sols = FPP_warmstart.initial_sequences(init, specifications, new_operations, hms)
+        for _ in range(hms - len(sols)):
+            temp_sol = ['s']
+            temp_p = precedence.copy()
+            temp_v = v.copy()
+            temp_q = q.copy()
+            for k in range(nops):
+                cs = np.where(temp_q == 1)[0]  # the candidate set
+                op_ind = np.random.choice(cs)
+                op = new_ind2op[op_ind]  # the selected operation
+                temp_p[op_ind] = 0
+                temp_v[op_ind] = 0
+                temp_u = cal_precedence(temp_p)
+                temp_q = temp_u * temp_v
+                temp_sol.append(op)
+            temp_sol.append('d')
+            sols.append(temp_sol)
+        for temp_sol in sols:
+            obj, plan = cal_objective(temp_sol, specifications)
+            objs.append(obj)
+            plans.append(plan)
+        gbest = min(objs)  # the global best
+        gbest_plan = plans[objs.index(gbest)].copy()  # the global best plan
+        gworst = max(objs)  # the global worst
+        FE += hms
+        conFE = FE  # the convergence function evaluation
+    else:
+        sols, objs, plans, gbest, gbest_plan, gworst, FE, conFE = state
+    stopped = False  # whether the callback has stopped the search
+    if callback is not None:
+        stopped = callback(gbest, gbest_plan[1:-1], FE, time.perf_counter() - start)
 
     # Step 4. Optimization
-    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=hms) as pbar:
-        while FE <= maxFE:
+    lower_bound = specifications.get('lower_bound', -float('inf'))  # the search stops once the lower bound is reached
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE and gbest > lower_bound and not stopped:
+            if checkpointer.due():
+                checkpointer.save(sols=sols, objs=objs, plans=plans, gbest=gbest, gbest_plan=gbest_plan, gworst=gworst,
+                                  FE=FE, conFE=conFE)
+            if callback is not None and callback(None, None, FE, time.perf_counter() - start):
+                break
 
             # Step 4.1. Generate a new harmony
             co = None  # the current operation
@@ -258,6 +251,8 @@ def main(hms, maxFE, specifications):
                 gbest = temp_obj
                 gbest_plan = temp_plan.copy()
                 conFE = FE
+                if callback is not None and callback(gbest, gbest_plan[1:-1], FE, time.perf_counter() - start):
+                    stopped = True
 
     # Step 5. Output
     return gbest, gbest_plan[1:-1], conFE
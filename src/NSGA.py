@@ -0,0 +1,116 @@
+# Non-dominated sorting genetic algorithm (NSGA-II) for the bi-objective (cost and time) FPP on the operators of HEA
+# Reference: Deb K, Pratap A, Agarwal S, et al. A fast and elitist multiobjective genetic algorithm: NSGA-II[J]. IEEE Transactions on Evolutionary Computation, 2002, 6(2): 182-197.
+import numpy as np
+from tqdm import tqdm
+import FPP_checkpoint
+import FPP_pareto
+import FPP_warmstart
+import HEA
+
+
+def update_archive(archive, sols, objs):
+    # add the solutions to the archive of non-dominated solutions
+    for sol, obj in zip(sols, objs):
+        archive.add(obj[0].item(), obj[1].item(), sol)
+
+
+def environmental_selection(pops, objs, keys, npop):
+    # environmental selection: the best npop distinct solutions by front and crowding distance (duplicates only fill a
+    # population with too few of them)
+    first = {}
+    for i, key in enumerate(keys):
+        first.setdefault(key, i)
+    unique = np.fromiter(first.values(), dtype=np.int64, count=len(first))
+    unique_objs = np.array(objs)[unique]
+    ranks = FPP_pareto.non_dominated_sort(unique_objs)
+    crowding = FPP_pareto.crowding_distance(unique_objs, ranks)
+    selected = unique[np.lexsort((-crowding, ranks))]
+    if len(selected) < npop:
+        selected = np.concatenate((selected, np.setdiff1d(np.arange(len(keys)), unique)))
+    selected = selected[: npop].tolist()
+    return [pops[i] for i in selected], [objs[i] for i in selected], [keys[i] for i in selected]
+
+
+def main(npop, maxFE, pc, pm, T0, alpha, specifications, checkpoint=None, checkpoint_interval=60, resume=False, init=None):
+    """
+    The main function.
+    :param npop: population size (default = 200)
+    :param maxFE: the maximum function evaluations (default = 1000 * the number of operations)
+    :param pc: crossover probability (default = 0.8)
+    :param pm: mutation probability (default = 0.1)
+    :param T0: the initial temperature for simulated annealing, relative to the objective ranges (default = 1)
+    :param alpha: cooling rate (default = 0.99)
+    :param specifications: the specifications of the bi-objective FPP (see FPP_pareto.combine_specifications)
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param init: the initial process plans (e.g., the best plans of the cost and time cases), which seed the population
+        after repair for each objective (None: a random population)
+    :return: the Pareto front: the (cost, time, process plan) of each non-dominated plan found, by ascending cost
+    """
+    operations = specifications['operations']
+    alternatives = specifications['alternatives']
+    op2ind = specifications['op2ind']
+    for r in range(len(alternatives)):
+        alternatives[r] = list(alternatives[r])
+
+    # Step 1. Initialization
+    closure_pairs = HEA.transitive_closure(operations)  # transitive closure pairs
+    nops = len(operations)  # the number of operations
+    precedence = np.zeros((nops, nops))
+    for op1 in operations:
+        for op2 in operations:
+            if op1 in operations[op2].prior:
+                precedence[op2ind[op1], op2ind[op2]] = 1
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'NSGA', specifications, checkpoint_interval)
+    state = checkpointer.load('sols', 'objs', 'keys', 'archive', 'FE', 'temperature') if resume else None
+    if state is None:
+        sols = []  # each initial plan is repaired for the cost case and for the time case
+        for objective_specifications in specifications['objectives']:
+            sols += [HEA.encode_plan(plan, objective_specifications)
+                     for plan in FPP_warmstart.initial_plans(init, objective_specifications, npop // 2)]
+        sols += HEA.initialization_population(npop - len(sols), nops, precedence, specifications)  # solutions
+        objs = [HEA.cal_objective(sol, specifications) for sol in sols]  # the (cost, time) objectives
+        keys = [HEA.solution_key(sol) for sol in sols]  # the chromosome keys
+        FE = npop  # the number of function evaluations
+        archive = FPP_pareto.ParetoArchive()  # the non-dominated solutions found so far
+        update_archive(archive, sols, objs)
+        temperature = T0  # temperature
+    else:
+        sols, objs, keys, archive, FE, temperature = state
+
+    # Step 2. Optimization
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE:
+            if checkpointer.due():
+                checkpointer.save(sols=sols, objs=objs, keys=keys, archive=archive, FE=FE, temperature=temperature)
+            members = dict(zip(keys, objs))  # the offspring identical to a current solution are not re-evaluated
+            # the simulated annealing of each solution minimizes a random weighted sum of the objectives (relative to
+            # the objective ranges of the population)
+            weights = np.random.random(len(sols))
+            scale = np.ptp(objs, axis=0)
+            scale[scale == 0] = 1
+
+            def scalarize(i, obj):
+                return weights[i] * obj[0] / scale[0] + (1 - weights[i]) * obj[1] / scale[1]
+
+            sols, objs, keys, SA_evals = HEA.SA_operator(sols, objs, keys, members, temperature, closure_pairs,
+                                                         specifications, scalarize)
+            objs = [obj.round(6) for obj in objs]  # the rounding errors of the delta evaluation are removed
+            update_archive(archive, sols, objs)
+            ranks = FPP_pareto.non_dominated_sort(objs)
+            crowding = FPP_pareto.crowding_distance(objs, ranks)
+            fitness = list(zip(ranks.tolist(), (-crowding).tolist()))  # the front first, then the crowding distance
+            new_sols, new_objs, new_keys, GA_evals = HEA.GA_operator(sols, objs, members, pc, pm, closure_pairs,
+                                                                     specifications, fitness)
+            new_objs = [obj.round(6) for obj in new_objs]
+            update_archive(archive, new_sols, new_objs)
+            sols, objs, keys = environmental_selection(sols + new_sols, objs + new_objs, keys + new_keys, npop)
+            FE += SA_evals + GA_evals
+            pbar.update(SA_evals + GA_evals)
+            temperature *= alpha
+            if not SA_evals + GA_evals:
+                break  # the offspring only revisit the current solutions
+
+    # Step 3. Output
+    return [(cost, time, HEA.decode_solution(sol, specifications)) for cost, time, sol in archive.front()]
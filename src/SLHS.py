@@ -1,41 +1,30 @@
 # Sequence learning harmony search (SLHS)
 # Reference: Luo K. A sequence learning harmony search algorithm for the flexible process planning problem[J]. International Journal of Production Research, 2022, 60(10): 3182-3200.
+import time
 import numpy as np
 from tqdm import tqdm
+import FPP_checkpoint
+import FPP_warmstart
 
 
 def cal_objective(sol, specifications):
     # calculate the objective value
-    objective = specifications['type']['objective']
-    indices = specifications['indices']
+    states = specifications['states']
+    changeover = specifications['changeover']
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
 
     obj = 0
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-        for i in range(len(sol) - 1):
-            o1, m1, t1, d1 = sol[i].split('&')
-            _, m2, t2, d2 = sol[i + 1].split('&')
-            if m1 != m2:
-                obj += mcc
-            if m1 != m2 or t1 != t2:
-                obj += tcc
-            if m1 != m2 or d1 != d2:
-                obj += scc
-            obj += indices[o1][sol[i]]
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
-        for i in range(len(sol) - 1):
-            o1, m1, t1, d1 = sol[i].split('&')
-            _, m2, t2, d2 = sol[i + 1].split('&')
-            if m1 != m2:
-                obj += mct[m1][m2]
-            if m1 != m2 or t1 != t2:
-                obj += tct
-            if m1 != m2 or d1 != d2:
-                obj += sct
-            obj += indices[o1][sol[i]]
-    o2 = sol[-1].split('&')[0]
-    obj += indices[o2][sol[-1]]
+    for i in range(len(sol) - 1):
+        _, m1, t1, d1, usage = states[sol[i]]
+        _, m2, t2, d2, _ = states[sol[i + 1]]
+        if m1 != m2:
+            obj += mc[m1][m2]
+        if m1 != m2 or t1 != t2:
+            obj += tc
+        if m1 != m2 or d1 != d2:
+            obj += sc
+        obj += usage
+    obj += states[sol[-1]][4]
     return obj
 
 
@@ -51,14 +40,22 @@ def cal_precedence(precedence):
     return p
 
 
-def main(hms, maxFE, specifications):
+def main(hms, maxFE, specifications, checkpoint=None, checkpoint_interval=60, resume=False, callback=None, init=None):
     """
     The main function.
     :param hms: harmony memory size (default = 10)
     :param maxFE: the maximum function evaluations (default = 1000 * the number of operations)
     :param specifications: the specifications of FPP
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param callback: called as callback(objective, plan, FE, elapsed time) with each new incumbent, and with
+        objective = plan = None at the start of each iteration; the search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case), which seed the harmony
+        memory after repair (None: a random harmony memory)
     :return:
     """
+    start = time.perf_counter()  # the start time of the solve
     operations = specifications['operations']
     alternatives = specifications['alternatives']
     alternative_operations = specifications['alternative_operations']
@@ -85,39 +82,54 @@ def main(hms, maxFE, specifications):
     q = u * v  # the qualification status
 
     # Step 2. Initial solutions
-    for _ in range(hms):
-        temp_sol = []
-        temp_p = precedence.copy()
-        temp_v = v.copy()
-        temp_q = q.copy()
-        for k in range(nops):
-            cs = np.where(temp_q == 1)[0]  # the candidate set
-            temp_op_ind = np.random.choice(cs)
-            temp_op = ind2op[temp_op_ind]  # the selected operation
-            temp_m = np.random.choice(operations[temp_op].machine)  # the selected machine
-            temp_t = np.random.choice(operations[temp_op].tool)  # the selected tool
-            temp_d = np.random.choice(operations[temp_op].direction)  # the selected direction
-            temp_p[temp_op_ind] = 0
-            temp_v[temp_op_ind] = 0
-            if temp_op in alternative_operations:
-                for alt in alternative_operations[temp_op]:
-                    alt_ind = op2ind[alt]
-                    temp_p[alt_ind] = 0
-                    temp_v[alt_ind] = 0
-            temp_u = cal_precedence(temp_p)
-            temp_q = temp_u * temp_v
-            temp_sol.append(temp_op + '&' + temp_m + '&' + temp_t + '&' + temp_d)
-        sols.append(temp_sol)
-        objs.append(cal_objective(temp_sol, specifications))
-    gbest = min(objs)  # the global best
-    gbest_sol = sols[objs.index(gbest)]  # the global best solution
-    gworst = max(objs)  # the global worst
-    FE += hms
-    conFE = 0  # the convergence function evaluation
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'SLHS', specifications, checkpoint_interval)
+    state = checkpointer.load('sols', 'objs', 'gbest', 'gbest_sol', 'gworst', 'FE', 'conFE') if resume else None
+    if state is None:
+        sols = FPP_warmstart.initial_plans(init, specifications, hms)
+        for _ in range(hms - len(sols)):
+            temp_sol = []
+            temp_p = precedence.copy()
+            temp_v = v.copy()
+            temp_q = q.copy()
+            for k in range(nops):
+                cs = np.where(temp_q == 1)[0]  # the candidate set
+                temp_op_ind = np.random.choice(cs)
+                temp_op = ind2op[temp_op_ind]  # the selected operation
+                temp_m = np.random.choice(operations[temp_op].machine)  # the selected machine
+                temp_t = np.random.choice(operations[temp_op].tool)  # the selected tool
+                temp_d = np.random.choice(operations[temp_op].direction)  # the selected direction
+                temp_p[temp_op_ind] = 0
+                temp_v[temp_op_ind] = 0
+                if temp_op in alternative_operations:
+                    for alt in alternative_operations[temp_op]:
+                        alt_ind = op2ind[alt]
+                        temp_p[alt_ind] = 0
+                        temp_v[alt_ind] = 0
+                temp_u = cal_precedence(temp_p)
+                temp_q = temp_u * temp_v
+                temp_sol.append(temp_op + '&' + temp_m + '&' + temp_t + '&' + temp_d)
+            sols.append(temp_sol)
+        objs = [cal_objective(sol, specifications) for sol in sols]
+        gbest = min(objs)  # the global best
+        gbest_sol = sols[objs.index(gbest)]  # the global best solution
+        gworst = max(objs)  # the global worst
+        FE += hms
+        conFE = 0  # the convergence function evaluation
+    else:
+        sols, objs, gbest, gbest_sol, gworst, FE, conFE = state
+    stopped = False  # whether the callback has stopped the search
+    if callback is not None:
+        stopped = callback(gbest, gbest_sol, FE, time.perf_counter() - start)
 
     # Step 3. Optimization
-    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=hms) as pbar:
-        while FE <= maxFE:
+    lower_bound = specifications.get('lower_bound', -float('inf'))  # the search stops once the lower bound is reached
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE and gbest > lower_bound and not stopped:
+            if checkpointer.due():
+                checkpointer.save(sols=sols, objs=objs, gbest=gbest, gbest_sol=gbest_sol, gworst=gworst, FE=FE,
+                                  conFE=conFE)
+            if callback is not None and callback(None, None, FE, time.perf_counter() - start):
+                break
 
             # Step 3.1. Generate a new harmony
             co = None  # the current operation
@@ -198,6 +210,8 @@ def main(hms, maxFE, specifications):
                 gbest = temp_obj
                 gbest_sol = temp_sol.copy()
                 conFE = FE
+                if callback is not None and callback(gbest, gbest_sol, FE, time.perf_counter() - start):
+                    stopped = True
 
     # Step 4. Output
     return gbest, gbest_sol, conFE
@@ -1,8 +1,14 @@
 # The two-stage variable neighbor search (TS-VNS) for the flexible process planning problem
 import copy
 import heapq
+import time
+from collections import OrderedDict
 import numpy as np
 from tqdm import tqdm
+import FPP_checkpoint
+import FPP_warmstart
+
+POLL_MOVES = 50  # the number of evaluated moves between two polls of the stop check in the local search
 
 
 def dijkstra(graph, source, target):
@@ -35,80 +41,197 @@ def dijkstra(graph, source, target):
     return distances[target], path
 
 
+def k_best_paths(graph, source, target, k):
+    # the k shortest paths of a directed acyclic graph (a DP keeping the k best labels of each vertex in topological
+    # order; each label is the length, the previous vertex, and the rank of the label extended at the previous vertex)
+    indegree = {vertex: 0 for vertex in graph}
+    for vertex in graph:
+        for neighbor in graph[vertex]:
+            indegree[neighbor] += 1
+    labels = {vertex: [] for vertex in graph}
+    labels[source] = [(0, None, None)]
+    ready = [source]
+    while ready:
+        vertex = ready.pop()
+        for neighbor, weight in graph[vertex].items():
+            candidates = [(length + weight, vertex, rank) for rank, (length, _, _) in enumerate(labels[vertex])]
+            labels[neighbor] = heapq.nsmallest(k, labels[neighbor] + candidates, key=lambda label: label[0])
+            indegree[neighbor] -= 1
+            if not indegree[neighbor]:
+                ready.append(neighbor)
+
+    paths = []
+    for length, vertex, rank in labels[target]:
+        path = [target]
+        while vertex is not None:
+            path.append(vertex)
+            _, vertex, rank = labels[vertex][rank]
+        path.reverse()
+        paths.append((length, path))
+    return paths
+
+
 def construct_graph(sol, specifications):
     # construct graph based on the solution to transform the selection of alternative operations and the allocation of manufacturing resources into the shortest path problem (cost)
     graph = {'s': {}, 'd': {}}
-    objective = specifications['type']['objective']
-    indices = specifications['indices']
-    alternative_operations = specifications['alternative_operations']
-
-    for state in indices[sol[1]]:
-        graph['s'][state] = indices[sol[1]][state]
-    if sol[1] in alternative_operations:
-        for op1 in alternative_operations[sol[1]]:
-            for state in indices[op1]:
-                graph['s'][state] = indices[op1][state]
-    if objective == 'cost':
-        mcc, tcc, scc = specifications['mcc'], specifications['tcc'], specifications['scc']
-        for i in range(1, len(sol) - 2):
-            op1, op2 = sol[i], sol[i + 1]
-            ops1, ops2 = [op1], [op2]
-            if op1 in alternative_operations:
-                ops1 += list(alternative_operations[op1])
-            if op2 in alternative_operations:
-                ops2 += list(alternative_operations[op2])
-            for op1 in ops1:
-                for state1 in indices[op1]:
-                    [_, m1, t1, d1] = state1.split('&')
-                    graph[state1] = {}
-                    for op2 in ops2:
-                        for state2 in indices[op2]:
-                            [_, m2, t2, d2] = state2.split('&')
-                            weight = indices[op2][state2]
-                            if m1 != m2:
-                                weight += mcc
-                            if m1 != m2 or t1 != t2:
-                                weight += tcc
-                            if m1 != m2 or d1 != d2:
-                                weight += scc
-                            graph[state1][state2] = weight
-    else:
-        mct, tct, sct = specifications['mct'], specifications['tct'], specifications['sct']
-        for i in range(1, len(sol) - 2):
-            op1, op2 = sol[i], sol[i + 1]
-            ops1, ops2 = [op1], [op2]
-            if op1 in alternative_operations:
-                ops1 += list(alternative_operations[op1])
-            if op2 in alternative_operations:
-                ops2 += list(alternative_operations[op2])
-            for op1 in ops1:
-                for state1 in indices[op1]:
-                    [_, m1, t1, d1] = state1.split('&')
-                    graph[state1] = {}
-                    for op2 in ops2:
-                        for state2 in indices[op2]:
-                            [_, m2, t2, d2] = state2.split('&')
-                            weight = indices[op2][state2]
-                            if m1 != m2:
-                                weight += mct[m1][m2]
-                            if m1 != m2 or t1 != t2:
-                                weight += tct
-                            if m1 != m2 or d1 != d2:
-                                weight += sct
-                            graph[state1][state2] = weight
-    for state in indices[sol[-2]]:
-        graph[state] = {'d': 0}
-    if sol[-2] in alternative_operations:
-        for op1 in alternative_operations[sol[-2]]:
-            for state in indices[op1]:
-                graph[state] = {'d': 0}
+    group_states = specifications['group_states']  # the non-dominated states of each operation and its alternatives
+
+    for state, _, _, _, usage in group_states[sol[1]]:
+        graph['s'][state] = usage
+    changeover = specifications['changeover']  # the dense changeover of both objectives
+    mc, tc, sc = changeover['machine'], changeover['tool'], changeover['setup']
+    for i in range(1, len(sol) - 2):
+        states2 = group_states[sol[i + 1]]
+        for state1, m1, t1, d1, _ in group_states[sol[i]]:
+            graph[state1] = {}
+            mc1 = mc[m1]
+            for state2, m2, t2, d2, weight in states2:
+                if m1 != m2:
+                    weight += mc1[m2]
+                if m1 != m2 or t1 != t2:
+                    weight += tc
+                if m1 != m2 or d1 != d2:
+                    weight += sc
+                graph[state1][state2] = weight
+    for state in group_states[sol[-2]]:
+        graph[state[0]] = {'d': 0}
     return graph
 
 
 def cal_objective(sol, specifications):
     # calculate the objective value of a given sequence of operations
+    cache = specifications.get('cache')  # the persistent evaluation cache (optional)
+    top_sequences = specifications.get('top_sequences')  # the best sequences evaluated by the search (optional)
+    result = cache.get(specifications['hash'], sol) if cache is not None else None
+    if result is None:
+        graph = construct_graph(sol, specifications)
+        result = dijkstra(graph, 's', 'd')
+        if cache is not None:
+            cache.put(specifications['hash'], sol, *result)
+    if top_sequences is not None:
+        top_sequences.add(sol, result[0])
+    return result
+
+
+def cal_k_objectives(sol, specifications, k):
+    # calculate the k best objective values and process plans of a given sequence of operations
     graph = construct_graph(sol, specifications)
-    return dijkstra(graph, 's', 'd')
+    return k_best_paths(graph, 's', 'd', k)
+
+
+class TopSequences:
+    # the k best distinct sequences evaluated by a search (a bounded heap, so the memory does not grow with the search)
+    def __init__(self, k):
+        self.k = k
+        self.heap = []  # the (-objective, sequence) of the kept sequences, the worst on top
+        self.kept = set()
+
+    def add(self, sol, obj):
+        # keep a sequence if it is among the k best
+        key = tuple(sol)
+        if key in self.kept:
+            return
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, (-obj, key))
+        elif obj < -self.heap[0][0]:
+            self.kept.discard(heapq.heapreplace(self.heap, (-obj, key))[1])
+        else:
+            return
+        self.kept.add(key)
+
+    def top_plans(self, specifications):
+        # the k best distinct plans of the kept sequences, where two plans are distinct if they assign different sets of
+        # (operation, machine, tool, direction) states: a reordering of the same states counts once, at its best order
+        # (a plan outside the k best plans of the k best sequences cannot be better than all of them)
+        plans = []
+        for _, key in self.heap:
+            plans += cal_k_objectives(list(key), specifications, self.k)
+        plans.sort(key=lambda item: item[0])
+        top = []
+        assignments = set()  # the state sets of the plans in top
+        for obj, plan in plans:
+            assignment = frozenset(plan[1: -1])
+            if assignment not in assignments:
+                assignments.add(assignment)
+                top.append((obj, plan[1: -1]))
+                if len(top) == self.k:
+                    break
+        return top
+
+
+class SequenceMemo:
+    # the bounded in-run memo of evaluated sequences, keyed by a position-aware (Zobrist) hash of the sequence
+    def __init__(self, ops, length, max_size, count_FE=True):
+        """
+        :param ops: the operations that may appear in a sequence (including 's' and 'd')
+        :param length: the length of a sequence
+        :param max_size: the maximum number of memorized sequences (the least recently used are dropped)
+        :param count_FE: whether a memo hit counts as a function evaluation
+        """
+        rng = np.random.default_rng(0)  # a separate generator, so the memo does not alter the search
+        self.keys = {op: rng.integers(1, 2 ** 63, length).tolist() for op in ops}  # the key of op at each position
+        self.max_size = max_size
+        self.count_FE = count_FE
+        self.memo = OrderedDict()
+
+    def hash(self, sol):
+        # the hash of a sequence
+        h = 0
+        for pos, op in enumerate(sol):
+            h ^= self.keys[op][pos]
+        return h
+
+    def rehash(self, h, sol, new_sol, start, end):
+        # the hash of new_sol, which differs from sol (with hash h) only in positions start to end
+        keys = self.keys
+        for pos in range(start, end + 1):
+            h ^= keys[sol[pos]][pos] ^ keys[new_sol[pos]][pos]
+        return h
+
+    def evaluate(self, sol, h, specifications):
+        # evaluate a sequence with hash h, answering repeat visits from the memo (return obj, plan, FE increment)
+        entry = self.memo.get(h)
+        if entry is not None and entry[0] == sol:
+            self.memo.move_to_end(h)
+            return entry[1], entry[2], int(self.count_FE)
+        obj, plan = cal_objective(sol, specifications)
+        self.memo[h] = (sol, obj, plan)
+        if len(self.memo) > self.max_size:
+            self.memo.popitem(last=False)
+        return obj, plan, 1
+
+
+class MoveRegistry:
+    # the registry of tried lpp-3-exchange moves, each move (four positions) packed into one integer
+    def __init__(self, length):
+        self.length = length  # the length of a sequence (the base of the packing)
+        self.moves = set()
+
+    def add(self, a, b, c, d):
+        # register a move and return whether it is new
+        length = self.length
+        key = ((a * length + b) * length + c) * length + d
+        if key in self.moves:
+            return False
+        self.moves.add(key)
+        return True
+
+
+class DontLookBits:
+    # the per-position don't-look bits of the forward and backward lpp-3-exchange neighbourhoods
+    def __init__(self, length):
+        self.forward = [False] * length  # forward[h]: no improving forward move starts at position h
+        self.backward = [False] * length  # backward[h]: no improving backward move ends before position h
+        self.sol = None  # the sequence that the bits refer to
+
+    def sync(self, sol):
+        # clear the bits around the positions where sol differs from the sequence that the bits refer to
+        if self.sol is not None and self.sol != sol:
+            changed = [pos for pos in range(len(sol)) if sol[pos] != self.sol[pos]]
+            for pos in range(max(changed[0] - 1, 0), min(changed[-1] + 2, len(sol))):
+                self.forward[pos] = False
+                self.backward[pos] = False
+        self.sol = sol
 
 
 def transitive_closure(ops):
@@ -170,15 +293,12 @@ def violate_constraint_backward(path_right, added_operation, closure_pairs):
     return False
 
 
-def f_lpp_3exchange(sol, obj, plan, closure_pairs, changing_positions, specifications):
-    # forward lexicographic path preserving 3-exchange
+def f_lpp_moves(sol, closure_pairs, dont_look=None):
+    # generate the forward lpp-3-exchange moves (h, start, mid, end): sol[start: mid] and sol[mid: end + 1] are exchanged
     n = len(sol) - 1
-    FE = 0  # the number of function evaluations
-    best_sol = sol  # the best solution
-    best_obj = obj  # the best objective
-    best_plan = plan  # the best plan
-
     for h in range(n - 2):
+        if dont_look and dont_look.forward[h]:
+            continue
         for i in range(h + 1, n - 1):
             path_left = sol[h + 1: i + 1]
             j = i + 1
@@ -186,28 +306,16 @@ def f_lpp_3exchange(sol, obj, plan, closure_pairs, changing_positions, specifica
                 if violate_constraint_forward(path_left, sol[j], closure_pairs):
                     j -= 1
                     break
-            path_right = sol[i + 1: j + 1]
-            if path_right and [h + 1, i, i + 1, j] not in changing_positions:
-                changing_positions.append([h + 1, i, i + 1, j])
-                new_sol = sol[: h + 1] + path_right + path_left + sol[j + 1:]
-                new_obj, new_plan = cal_objective(new_sol, specifications)
-                FE += 1
-                if new_obj < best_obj:
-                    best_sol = new_sol
-                    best_obj = new_obj
-                    best_plan = new_plan
-    return best_sol, best_obj, best_plan, FE, changing_positions
+            if j > i:
+                yield h, h + 1, i + 1, j
 
 
-def b_lpp_3exchange(sol, obj, plan, closure_pairs, changing_positions, specifications):
-    # backward lexicographic path preserving 3-exchange
+def b_lpp_moves(sol, closure_pairs, dont_look=None):
+    # generate the backward lpp-3-exchange moves (h, start, mid, end): sol[start: mid] and sol[mid: end + 1] are exchanged
     n = len(sol) - 1
-    FE = 0  # the number of function evaluations
-    best_sol = sol  # the best solution
-    best_obj = obj  # the best objective
-    best_plan = plan  # the best plan
-
     for h in range(n, 2, -1):
+        if dont_look and dont_look.backward[h]:
+            continue
         for i in range(h - 1, 1, -1):
             path_right = sol[i: h]
             j = i - 1
@@ -215,33 +323,90 @@ def b_lpp_3exchange(sol, obj, plan, closure_pairs, changing_positions, specifica
                 if violate_constraint_backward(path_right, sol[j], closure_pairs):
                     j += 1
                     break
-            path_left = sol[j: i]
-            if path_left and [j, i - 1, i, h - 1] not in changing_positions:
-                changing_positions.append([j, i - 1, i, h - 1])
-                new_sol = sol[: j] + path_right + path_left + sol[h:]
-                new_obj, new_plan = cal_objective(new_sol, specifications)
-                FE += 1
-                if new_obj < best_obj:
-                    best_sol = new_sol
-                    best_obj = new_obj
-                    best_plan = new_plan
+            if j < i:
+                yield h, j, i, h - 1
+
+
+def lpp_3exchange(sol, obj, plan, moves, changing_positions, specifications, memo=None, bits=None, strategy='best', sample_size=None,
+                  stop=None):
+    # evaluate the lpp-3-exchange moves of sol with the given strategy ('best', 'first', 'random-first', or 'sampled'),
+    # polling stop() every POLL_MOVES evaluated moves and returning the best move so far once it returns True
+    FE = 0  # the number of function evaluations
+    best_sol = sol  # the best solution
+    best_obj = obj  # the best objective
+    best_plan = plan  # the best plan
+    sol_hash = memo.hash(sol) if memo else None  # the hash of sol
+    if strategy == 'random-first':
+        moves = list(moves)
+        moves = [moves[k] for k in np.random.permutation(len(moves))]
+    elif strategy == 'sampled':
+        moves = list(moves)
+        moves = [moves[k] for k in np.random.choice(len(moves), min(sample_size, len(moves)), replace=False)]
+    improved = {}  # h -> whether a move of position h improves sol
+    evaluated = 0  # the number of evaluated moves
+
+    for h, start, mid, end in moves:
+        if not changing_positions.add(start, mid - 1, mid, end):
+            continue
+        if stop is not None and evaluated % POLL_MOVES == 0 and stop():
+            return best_sol, best_obj, best_plan, FE, changing_positions
+        evaluated += 1
+        new_sol = sol[: start] + sol[mid: end + 1] + sol[start: mid] + sol[end + 1:]
+        if memo:
+            new_hash = memo.rehash(sol_hash, sol, new_sol, start, end)
+            new_obj, new_plan, increment_FE = memo.evaluate(new_sol, new_hash, specifications)
+            FE += increment_FE
+        else:
+            new_obj, new_plan = cal_objective(new_sol, specifications)
+            FE += 1
+        improved[h] = improved.get(h, False) or new_obj < obj
+        if new_obj < best_obj:
+            best_sol = new_sol
+            best_obj = new_obj
+            best_plan = new_plan
+            if strategy in ('first', 'random-first'):
+                break
+    if bits is not None and strategy in ('best', 'first'):
+        for h in improved:
+            if not improved[h]:
+                bits[h] = True
     return best_sol, best_obj, best_plan, FE, changing_positions
 
 
-def local_search(sol, obj, plan, closure_pairs, specifications):
-    # local search
+def f_lpp_3exchange(sol, obj, plan, closure_pairs, changing_positions, specifications, memo=None, dont_look=None, strategy='best', sample_size=None,
+                    stop=None):
+    # forward lexicographic path preserving 3-exchange
+    if dont_look:
+        dont_look.sync(sol)
+    moves = f_lpp_moves(sol, closure_pairs, dont_look)
+    return lpp_3exchange(sol, obj, plan, moves, changing_positions, specifications, memo, dont_look.forward if dont_look else None, strategy, sample_size,
+                          stop)
+
+
+def b_lpp_3exchange(sol, obj, plan, closure_pairs, changing_positions, specifications, memo=None, dont_look=None, strategy='best', sample_size=None,
+                    stop=None):
+    # backward lexicographic path preserving 3-exchange
+    if dont_look:
+        dont_look.sync(sol)
+    moves = b_lpp_moves(sol, closure_pairs, dont_look)
+    return lpp_3exchange(sol, obj, plan, moves, changing_positions, specifications, memo, dont_look.backward if dont_look else None, strategy, sample_size,
+                          stop)
+
+
+def local_search(sol, obj, plan, closure_pairs, specifications, memo=None, dont_look=None, strategy='best', sample_size=None, stop=None):
+    # local search (stop() is polled inside the neighbourhoods, see lpp_3exchange)
     if np.random.random() < 0.5:
-        new_sol, new_obj, new_plan, increment_FE1, changing_positions = f_lpp_3exchange(sol, obj, plan, closure_pairs, [], specifications)
-        changing_positions = [] if new_obj < obj else changing_positions
-        new_sol, new_obj, new_plan, increment_FE2, _ = b_lpp_3exchange(new_sol, new_obj, new_plan, closure_pairs, changing_positions, specifications)
+        new_sol, new_obj, new_plan, increment_FE1, changing_positions = f_lpp_3exchange(sol, obj, plan, closure_pairs, MoveRegistry(len(sol)), specifications, memo, dont_look, strategy, sample_size, stop)
+        changing_positions = MoveRegistry(len(sol)) if new_obj < obj else changing_positions
+        new_sol, new_obj, new_plan, increment_FE2, _ = b_lpp_3exchange(new_sol, new_obj, new_plan, closure_pairs, changing_positions, specifications, memo, dont_look, strategy, sample_size, stop)
     else:
-        new_sol, new_obj, new_plan, increment_FE1, changing_positions = b_lpp_3exchange(sol, obj, plan, closure_pairs, [], specifications)
-        changing_positions = [] if new_obj < obj else changing_positions
-        new_sol, new_obj, new_plan, increment_FE2, _ = f_lpp_3exchange(new_sol, new_obj, new_plan, closure_pairs, changing_positions, specifications)
+        new_sol, new_obj, new_plan, increment_FE1, changing_positions = b_lpp_3exchange(sol, obj, plan, closure_pairs, MoveRegistry(len(sol)), specifications, memo, dont_look, strategy, sample_size, stop)
+        changing_positions = MoveRegistry(len(sol)) if new_obj < obj else changing_positions
+        new_sol, new_obj, new_plan, increment_FE2, _ = f_lpp_3exchange(new_sol, new_obj, new_plan, closure_pairs, changing_positions, specifications, memo, dont_look, strategy, sample_size, stop)
     return new_sol, new_obj, new_plan, increment_FE1 + increment_FE2
 
 
-def shaking(sol, k, closure_pairs, specifications):
+def shaking(sol, k, closure_pairs, specifications, memo=None):
     # shaking: apply lpp-3-exchange k times
     num = 0
     n = len(sol) - 1
@@ -271,17 +436,44 @@ def shaking(sol, k, closure_pairs, specifications):
             if path_left:
                 new_sol = new_sol[: j] + path_right + path_left + new_sol[h:]
                 num += 1
-    new_obj, new_plan = cal_objective(new_sol, specifications)
-    return new_sol, new_obj, new_plan
+    if memo:
+        new_obj, new_plan, increment_FE = memo.evaluate(new_sol, memo.hash(new_sol), specifications)
+    else:
+        new_obj, new_plan = cal_objective(new_sol, specifications)
+        increment_FE = 1
+    return new_sol, new_obj, new_plan, increment_FE
 
 
-def main(maxFE, specifications):
+def main(maxFE, specifications, memo_size=20000, memo_counts_FE=True, dont_look_bits=False, strategy='best', sample_size=100,
+         checkpoint=None, checkpoint_interval=60, resume=False, callback=None, init=None, top_k=None):
     """
     The main function.
     :param maxFE: the maximum function evaluations (default = 1000 * the number of operations)
     :param specifications: the specifications of FPP
-    :return:
+    :param memo_size: the maximum number of sequences in the in-run evaluation memo (0 disables the memo)
+    :param memo_counts_FE: whether answering a repeat visit from the memo counts as a function evaluation
+    :param dont_look_bits: whether to skip the positions whose neighbourhood has not changed since the last pass
+    :param strategy: the local search strategy, 'best' (best improvement, default), 'first' (first improvement),
+        'random-first' (first improvement in a random order), or 'sampled' (best of sample_size random moves)
+    :param sample_size: the number of sampled moves per neighbourhood of the 'sampled' strategy
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param checkpoint_interval: the minimum time between two checkpoints (seconds)
+    :param resume: whether to resume from the checkpoint file (if it exists)
+    :param callback: called as callback(objective, plan, FE, elapsed time) with each new incumbent, and with
+        objective = plan = None at the start of each iteration and every POLL_MOVES moves of the local search; the
+        search stops once it returns True
+    :param init: the initial process plans (e.g., the best plan before a change of the case); the search starts from the
+        best of them after repair (None: a random initial solution)
+    :param top_k: the number of best distinct process plans collected over all evaluated sequences (None: only the
+        best plan); the k best sequences are kept during the search and expanded by k-shortest paths at the end, and
+        plans are distinct if they assign different sets of states (see TopSequences.top_plans); the search does not
+        stop at the lower bound
+    :return: the best objective, the best process plan, the convergence FE, and the top_k (objective, process plan)
+        pairs if top_k
     """
+    start = time.perf_counter()  # the start time of the solve
+    if strategy not in ('best', 'first', 'random-first', 'sampled'):
+        raise ValueError('Invalid local search strategy.')
     # Step 1. Remove redundant alternative operations
     operations_to_keep = set()
     for alt in specifications['alternatives']:
@@ -308,47 +500,88 @@ def main(maxFE, specifications):
                 precedence[op1_ind, op2_ind] = 1
     FE = 0  # the number of function evaluations
     closure_pairs = transitive_closure(new_operations)  # transitive closure pairs
+    memo = SequenceMemo(['s', 'd'] + list(specifications['operations']), nops + 2, memo_size, memo_counts_FE) if memo_size else None
+    dont_look = DontLookBits(nops + 2) if dont_look_bits else None
 
     # Step 3. Initialize the first solution
-    sol = ['s']
-    p = cal_precedence(precedence)  # the precedence constraint satisfaction status
-    v = np.ones(nops)  # the selectable status
-    q = p * v  # the qualification status
-    for _ in range(nops):
-        cs = np.where(q == 1)[0]  # the candidate set
-        op_ind = np.random.choice(cs)
-        op = new_ind2op[op_ind]  # the selected operation
-        sol.append(op)
-        precedence[op_ind] = 0
-        v[op_ind] = 0
-        p = cal_precedence(precedence)
-        q = p * v
-    sol.append('d')
-    obj, plan = cal_objective(sol, specifications)  # the objective, process plan
-    FE += 1
-    best_sol = sol.copy()  # the best operation sequence
-    best_obj = obj  # the best objective
-    best_plan = plan.copy()  # the best plan
-    conFE = FE  # the convergence function evaluation
-    k = 1
+    checkpointer = FPP_checkpoint.Checkpointer(checkpoint, 'TS-VNS', specifications, checkpoint_interval)
+    keys = ('best_sol', 'best_obj', 'best_plan', 'FE', 'conFE', 'k', 'stall', 'memo', 'dont_look', 'top_sequences')
+    state = checkpointer.load(*keys) if resume else None
+    if state is None:
+        top_sequences = TopSequences(top_k) if top_k else None  # the k best sequences evaluated
+        specifications = dict(specifications, top_sequences=top_sequences)
+        sols = FPP_warmstart.initial_sequences(init, specifications, new_operations, len(init or []))
+        if not sols:
+            sol = ['s']
+            p = cal_precedence(precedence)  # the precedence constraint satisfaction status
+            v = np.ones(nops)  # the selectable status
+            q = p * v  # the qualification status
+            for _ in range(nops):
+                cs = np.where(q == 1)[0]  # the candidate set
+                op_ind = np.random.choice(cs)
+                op = new_ind2op[op_ind]  # the selected operation
+                sol.append(op)
+                precedence[op_ind] = 0
+                v[op_ind] = 0
+                p = cal_precedence(precedence)
+                q = p * v
+            sol.append('d')
+            sols.append(sol)
+        best_obj = float('inf')  # the best objective
+        for sol in sols:
+            obj, plan = cal_objective(sol, specifications)  # the objective, process plan
+            FE += 1
+            if obj < best_obj:
+                best_sol = sol.copy()  # the best operation sequence
+                best_obj = obj
+                best_plan = plan.copy()  # the best plan
+        conFE = FE  # the convergence function evaluation
+        k = 1
+        stall = 0  # the number of consecutive iterations answered entirely from the memo
+    else:
+        best_sol, best_obj, best_plan, FE, conFE, k, stall, memo, dont_look, top_sequences = state
+        specifications = dict(specifications, top_sequences=top_sequences)
+    stopped = False  # whether the callback has stopped the search
+    if callback is not None:
+        stopped = callback(best_obj, best_plan[1:-1], FE, time.perf_counter() - start)
+
+    def stop():
+        # poll the callback between and within the local search passes, keeping a True answer
+        nonlocal stopped
+        stopped = stopped or callback(None, None, FE, time.perf_counter() - start)
+        return stopped
 
     # Step 4. Optimization
-    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=1) as pbar:
-        while FE <= maxFE:
-            new_sol, new_obj, new_plan = shaking(best_sol, k, closure_pairs, specifications)
-            FE += k
-            new_sol, new_obj, new_plan, increment_FE = local_search(new_sol, new_obj, new_plan, closure_pairs, specifications)
-            FE += increment_FE
-            pbar.update(k + increment_FE)
+    # the search stops once the lower bound is reached, unless it collects the top_k plans (an optimal incumbent is only
+    # the first of them)
+    lower_bound = specifications.get('lower_bound', -float('inf')) if top_sequences is None else -float('inf')
+    with tqdm(total=maxFE, desc="Optimization Progress", unit="eval", initial=FE) as pbar:
+        while FE <= maxFE and best_obj > lower_bound and stall <= nops and not stopped:
+            if checkpointer.due():
+                checkpointer.save(best_sol=best_sol, best_obj=best_obj, best_plan=best_plan, FE=FE, conFE=conFE, k=k,
+                                  stall=stall, memo=memo, dont_look=dont_look, top_sequences=top_sequences)
+            if callback is not None and stop():
+                break
+            new_sol, new_obj, new_plan, increment_FE1 = shaking(best_sol, k, closure_pairs, specifications, memo)
+            increment_FE1 *= k
+            new_sol, new_obj, new_plan, increment_FE2 = local_search(new_sol, new_obj, new_plan, closure_pairs, specifications, memo, dont_look, strategy, sample_size,
+                                                                     stop if callback is not None else None)
+            FE += increment_FE1 + increment_FE2
+            pbar.update(increment_FE1 + increment_FE2)
+            stall = stall + 1 if increment_FE1 + increment_FE2 == 0 else 0
             if new_obj < best_obj:
                 best_sol = new_sol.copy()
                 best_obj = new_obj
                 best_plan = new_plan.copy()
                 conFE = FE
+                if callback is not None and callback(best_obj, best_plan[1:-1], FE, time.perf_counter() - start):
+                    stopped = True
                 k = 0
             else:
                 k = 1
 
     # Step 5. Output
     best_plan = best_plan[1:-1]
+    if top_sequences is not None:
+        return best_obj, best_plan, conFE, top_sequences.top_plans(specifications)
     return best_obj, best_plan, conFE
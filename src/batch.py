@@ -0,0 +1,224 @@
+# The batch entry point: solve a queue of part definitions streamed from a JSONL file
+# Each line of the input is a case description (the layout of the case files) with an optional "id". The parts are
+# compiled and solved by a pool of worker processes, at most max_in_flight of them are read ahead of the completed ones,
+# and each result is written (and flushed) as soon as it completes, so the memory stays flat however long the queue is.
+# With a result store, a part whose canonical fingerprint (FPP_fingerprint) has a stored result is answered at once, and
+# a part identical or isomorphic to a part in flight waits for its result, so only genuinely new parts are solved.
+import csv
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+FIELDS = ['id', 'algo', 'hash', 'fingerprint', 'reused', 'objective', 'plan', 'conFE', 'lower_bound', 'gap', 'runtime',
+          'error']
+
+
+def read_parts(path):
+    # stream the (id, case description, error) of each non-empty line of a JSONL file (the line number is the default
+    # id): a malformed line has no case description and reports its error instead
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                if not isinstance(data, dict):
+                    raise ValueError('A part must be a JSON object, not ' + type(data).__name__ + '.')
+            except ValueError as error:  # json.JSONDecodeError is a ValueError
+                yield line_no, None, repr(error)
+                continue
+            yield data.pop('id', line_no), data, None
+
+
+def init_worker():
+    # the progress bars of the solvers are disabled in the workers
+    os.environ['TQDM_DISABLE'] = '1'
+
+
+def solve_part(index, part_id, data, algo, bound=True, seed=None, compiled_dir=None):
+    # compile and solve a part, returning its result row (a failed part reports its error instead of its result)
+    import numpy as np
+    import FPP_bounds
+    import FPP_cases
+    from main import run_FPP
+
+    row = dict.fromkeys(FIELDS)
+    row.update(id=part_id, algo=algo, reused=False)
+    try:
+        if seed is not None:
+            np.random.seed(seed + index)
+        specifications = FPP_cases.load_specifications(data, compiled_dir=compiled_dir)
+        row['hash'] = specifications['hash']
+        result = run_FPP(algo, specifications, bound=bound)
+        row.update(objective=result['best_obj'], plan=result['best_sol'], conFE=result['conFE'],
+                   runtime=round(result['runtime'], 3))
+        if bound:
+            row['lower_bound'] = result['lower_bound']
+            row['gap'] = FPP_bounds.cal_gap(result['best_obj'], result['lower_bound'])
+    except Exception as error:
+        row['error'] = repr(error)
+    return json.loads(json.dumps(row, default=lambda value: value.tolist()))  # NumPy scalars -> Python numbers
+
+
+def reused_row(part_id, case_hash, algo, fingerprint, names, stored):
+    # the result row of a part answered by a stored result (the plan is renamed to the operations of the part)
+    import FPP_bounds
+    from FPP_fingerprint import translate_plan
+
+    obj, plan, lower_bound, _ = stored
+    row = dict.fromkeys(FIELDS)
+    row.update(id=part_id, algo=algo, hash=case_hash, fingerprint=fingerprint, reused=True, objective=obj,
+               plan=translate_plan(plan, {name: op for op, name in names.items()}), runtime=0.0)
+    if lower_bound is not None:
+        row['lower_bound'] = lower_bound
+        row['gap'] = FPP_bounds.cal_gap(obj, lower_bound)
+    return row
+
+
+class ResultWriter:
+    def __init__(self, path):
+        """
+        :param path: the path of the output file (JSONL, or CSV if it ends with .csv)
+        """
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.csv = None
+        if path.lower().endswith('.csv'):
+            self.csv = csv.DictWriter(self.file, fieldnames=FIELDS)
+            self.csv.writeheader()
+
+    def write(self, row):
+        # write a result row and flush it, so the completed results survive an interrupted batch
+        if self.csv is not None:
+            self.csv.writerow({key: json.dumps(value) if isinstance(value, list) else value
+                               for key, value in row.items()})
+        else:
+            self.file.write(json.dumps(row) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def batch_solve(input_path, output_path, algo='TS-VNS', workers=None, max_in_flight=None, bound=True, seed=None,
+                compiled_dir=None, store=None):
+    """
+    Solve the parts of a JSONL file across a pool of worker processes.
+    :param input_path: the JSONL file of part definitions (one case description per line, with an optional "id")
+    :param output_path: the output file of the results (JSONL, or CSV if it ends with .csv), in completion order
+    :param algo: the algorithm
+    :param workers: the number of worker processes (None: the number of CPUs)
+    :param max_in_flight: the maximum number of submitted but uncompleted parts (None: twice the number of workers)
+    :param bound: whether to compute the lower bound of each part
+    :param seed: the random seed (part i is solved with seed + i; None: unseeded)
+    :param compiled_dir: the folder of compiled artifacts (None: the parts are compiled in memory only)
+    :param store: the path of the SQLite result store (None: no store); a stored result is reused if it is optimal or
+        was found by the same algorithm
+    :return: the number of solved parts, the number of reused parts, and the number of failed parts
+    """
+    import FPP_cases
+    from FPP_fingerprint import cal_fingerprint, translate_plan
+
+    workers = workers or os.cpu_count()
+    max_in_flight = max_in_flight or 2 * workers
+    writer = ResultWriter(output_path)
+    results = None
+    if store:
+        import FPP_cache
+        results = FPP_cache.ResultStore(store)
+    counts = {'solved': 0, 'reused': 0, 'failed': 0, 'waiting': 0}
+    pending = {}  # the (fingerprint, canonical names) of the part of each future
+    waiting = {}  # the (id, hash, canonical names) of the parts waiting for the part in flight of each fingerprint
+
+    def emit(row):
+        writer.write(row)
+        if row['error'] is not None:
+            counts['failed'] += 1
+            print('Part ' + str(row['id']) + ' failed: ' + row['error'])
+        else:
+            counts['reused' if row['reused'] else 'solved'] += 1
+
+    def collect():
+        # write the results of the completed parts and of the parts waiting for them
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            fingerprint, names = pending.pop(future)
+            row = future.result()
+            row['fingerprint'] = fingerprint
+            emit(row)
+            if fingerprint is None:
+                continue
+            waiters = waiting.pop(fingerprint)
+            counts['waiting'] -= len(waiters)
+            if row['error'] is None:
+                optimal = row['lower_bound'] is not None and row['objective'] <= row['lower_bound']
+                stored = (row['objective'], translate_plan(row['plan'], names), row['lower_bound'], optimal)
+                results.put(fingerprint, algo, *stored)
+            for part_id, case_hash, part_names in waiters:
+                if row['error'] is None:
+                    emit(reused_row(part_id, case_hash, algo, fingerprint, part_names, stored))
+                else:
+                    emit(dict(row, id=part_id, hash=case_hash))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            try:
+                for index, (part_id, data, error) in enumerate(read_parts(input_path)):
+                    if error is not None:
+                        row = dict.fromkeys(FIELDS)
+                        row.update(id=part_id, algo=algo, reused=False, error=error)
+                        emit(row)
+                        continue
+                    while len(pending) + counts['waiting'] >= max_in_flight:
+                        collect()
+                    fingerprint, names = None, None
+                    if results is not None:
+                        try:
+                            fingerprint, names = cal_fingerprint(data)
+                        except Exception:
+                            pass  # an invalid part reports its error from the worker
+                    if fingerprint is not None:
+                        stored = results.get(fingerprint, algo)
+                        if stored is not None:
+                            emit(reused_row(part_id, FPP_cases.cal_case_hash(data), algo, fingerprint, names, stored))
+                            continue
+                        if fingerprint in waiting:
+                            waiting[fingerprint].append((part_id, FPP_cases.cal_case_hash(data), names))
+                            counts['waiting'] += 1
+                            continue
+                        waiting[fingerprint] = []
+                    future = executor.submit(solve_part, index, part_id, data, algo, bound, seed, compiled_dir)
+                    pending[future] = (fingerprint, names)
+            finally:
+                while pending:
+                    collect()  # the results of the parts in flight are written before any error propagates
+    finally:
+        writer.close()
+        if results is not None:
+            results.close()
+    return counts['solved'], counts['reused'], counts['failed']
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+    from main import ALGORITHMS
+
+    parser = argparse.ArgumentParser(description="Solve a queue of FPP part definitions")
+    parser.add_argument('input', type=str, help='JSONL file of part definitions (one case description per line)')
+    parser.add_argument('output', type=str, help='Output file of the results (JSONL, or CSV if it ends with .csv)')
+    parser.add_argument('--algo', type=str, default='TS-VNS', choices=list(ALGORITHMS), help='Algorithm to use')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: the CPUs)')
+    parser.add_argument('--max_in_flight', type=int, default=None,
+                        help='Maximum number of parts in flight (default: twice the workers)')
+    parser.add_argument('--no_bound', action='store_true', help='Do not compute the lower bounds (no early stop)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (part i uses seed + i)')
+    parser.add_argument('--compiled_dir', type=str, default=None, help='Folder where the compiled parts are kept')
+    parser.add_argument('--store', type=str, default=None,
+                        help='Path of the SQLite result store reused for identical or isomorphic parts')
+
+    args = parser.parse_args()
+    start = time.perf_counter()
+    nsolved, nreused, nfailed = batch_solve(args.input, args.output, args.algo, args.workers, args.max_in_flight,
+                                            not args.no_bound, args.seed, args.compiled_dir, args.store)
+    print(str(nsolved + nreused + nfailed) + ' parts in ' + format(time.perf_counter() - start, '.2f') + ' s: ' +
+          str(nsolved) + ' solved, ' + str(nreused) + ' reused, ' + str(nfailed) + ' failed')
@@ -0,0 +1,209 @@
+# The scaling benchmark: runtime and memory of each algorithm's evaluator versus the number of operations
+# The cases are synthetic (FPP_generator), so the precedence density is scaled to keep the average degree constant.
+import time
+import tracemalloc
+import numpy as np
+
+# the solution encoding used by the evaluator of each metaheuristic (the exact DP and BnB have no per-solution evaluator
+# and are not benchmarked)
+ENCODINGS = {
+    'ACO': 'states',
+    'FSDPSO': 'resources',
+    'ESGA': 'chromosomes',
+    'HEA': 'resources',
+    'SLHS': 'states',
+    'TS-VNS': 'sequence',
+    'IFSDPSO': 'sequence',
+    'IESGA': 'sequence',
+    'ISLHS': 'sequence',
+}
+
+
+def construct_sequence(specifications, cal_precedence):
+    # construct a random feasible operation sequence the way the algorithms initialize their solutions
+    operations = specifications['operations']
+    alternative_operations = specifications['alternative_operations']
+    op2ind = specifications['op2ind']
+    ind2op = specifications['ind2op']
+    nops_all = len(operations)
+    nops = nops_all - sum(len(alt) - 1 for alt in specifications['alternatives'])
+    precedence = np.zeros((nops_all, nops_all))
+    for op1 in operations:
+        for op2 in operations:
+            if op1 in operations[op2].prior:
+                precedence[op2ind[op1], op2ind[op2]] = 1
+    v = np.ones(nops_all)  # the selectable status
+    q = cal_precedence(precedence) * v  # the qualification status
+    sequence = []
+    for _ in range(nops):
+        cs = np.where(q == 1)[0]  # the candidate set
+        op_ind = np.random.choice(cs)
+        op = ind2op[op_ind]
+        precedence[op_ind] = 0
+        v[op_ind] = 0
+        for alt in alternative_operations.get(op, ()):
+            precedence[op2ind[alt]] = 0
+            v[op2ind[alt]] = 0
+        q = cal_precedence(precedence) * v
+        sequence.append(op)
+    return sequence
+
+
+def fast_precedence(precedence):
+    # the precedence constraint satisfaction status (vectorized, used once the original constructor is too slow)
+    return (np.asarray(precedence).sum(axis=0) == 0).astype(float)
+
+
+def encode(sequence, encoding, specifications):
+    # encode an operation sequence (with random resources) as a solution of the given encoding
+    operations = specifications['operations']
+    if encoding == 'sequence':
+        return ['s'] + sequence + ['d']
+    resources = {}
+    for op in operations:
+        operation = operations[op]
+        resources[op] = (np.random.choice(operation.machine), np.random.choice(operation.tool),
+                         np.random.choice(operation.direction))
+    if encoding == 'states':
+        return [op + '&' + '&'.join(resources[op]) for op in sequence]
+    if encoding == 'chromosomes':
+        return {
+            'operation': sequence,
+            'machine': [resources[op][0] for op in sequence],
+            'tool': [resources[op][1] for op in sequence],
+            'direction': [resources[op][2] for op in sequence],
+        }
+    # the resources are indexed by the operation indices, and the operation chromosome keeps every operation
+    chosen = set(sequence)
+    sol = {
+        'operation': sequence + [op for op in operations if op not in chosen],
+        'machine': [resources[op][0] for op in operations],
+        'tool': [resources[op][1] for op in operations],
+        'direction': [resources[op][2] for op in operations],
+        'or': [sorted(alt).index(next(op for op in alt if op in chosen)) for alt in specifications['alternatives']],
+    }
+    return sol
+
+
+def measure(func, min_time):
+    # the average runtime of func (repeated for at least min_time seconds) and the peak memory of a single call
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    repeats = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        repeats += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / repeats, peak
+
+
+def graph_size(sol, specifications, module):
+    # the number of vertices and edges of the graph constructed by a graph-based evaluator
+    graph = module.construct_graph(sol, specifications)
+    return len(graph), sum(len(edges) for edges in graph.values())
+
+
+def fit_exponent(sizes, values):
+    # fit values ~ c * sizes ^ k on a log-log scale and return k
+    points = [(n, v) for n, v in zip(sizes, values) if v is not None and v > 0]
+    if len(points) < 2:
+        return None
+    return float(np.polyfit(np.log([p[0] for p in points]), np.log([p[1] for p in points]), 1)[0])
+
+
+def scaling(algos, sizes, degree=3, nmachines=8, ntools=15, ndirections=6, objective='cost', seed=0, min_time=0.2,
+            time_limit=60):
+    """
+    Sweep the number of operations and measure each algorithm's evaluator.
+    :param algos: the algorithms to measure (the metaheuristics of ENCODINGS)
+    :param sizes: the numbers of operations
+    :param degree: the average number of direct priors of an operation
+    :param nmachines: the number of machines
+    :param ntools: the number of tools
+    :param ndirections: the number of directions
+    :param objective: 'cost' or 'time'
+    :param seed: the random seed
+    :param min_time: the minimum measuring time of an evaluator (seconds)
+    :param time_limit: larger sizes are skipped for a measurement once it exceeds this time (seconds)
+    :return: the measurement rows and the fitted exponents
+    """
+    import FPP_cases
+    import FPP_generator
+    from main import load_algorithm
+
+    for algo in algos:
+        if algo not in ENCODINGS:
+            raise ValueError('The evaluator of ' + algo + ' cannot be benchmarked.')
+    modules = {algo: load_algorithm(algo) for algo in algos}
+    skipped = set()
+    rows = []
+    for nops in sizes:
+        np.random.seed(seed)
+        data = FPP_generator.generate_case(nops, nmachines, ntools, ndirections, density=min(1.0, 2 * degree / nops),
+                                           objective=objective, seed=seed)
+        specifications = FPP_cases.load_specifications(data, compiled_dir=None)
+        specifications['alternatives'] = [sorted(alt) for alt in specifications['alternatives']]
+        for algo in algos:
+            module = modules[algo]
+            row = {'algo': algo, 'nops': nops, 'construction': None, 'time_per_FE': None, 'peak_memory': None,
+                   'vertices': None, 'edges': None}
+            if (algo, 'construction') not in skipped:
+                start = time.perf_counter()
+                sequence = construct_sequence(specifications, module.cal_precedence)
+                row['construction'] = time.perf_counter() - start
+                if row['construction'] > time_limit:
+                    skipped.add((algo, 'construction'))
+            else:
+                sequence = construct_sequence(specifications, fast_precedence)
+            sol = encode(sequence, ENCODINGS[algo], specifications)
+            if (algo, 'evaluation') not in skipped:
+                row['time_per_FE'], row['peak_memory'] = measure(lambda: module.cal_objective(sol, specifications),
+                                                                 min_time)
+                if row['time_per_FE'] > time_limit:
+                    skipped.add((algo, 'evaluation'))
+            if hasattr(module, 'construct_graph'):
+                row['vertices'], row['edges'] = graph_size(sol, specifications, module)
+            rows.append(row)
+            print(', '.join(key + ': ' + str(value) for key, value in row.items()))
+
+    exponents = {}
+    for algo in algos:
+        algo_rows = [row for row in rows if row['algo'] == algo]
+        exponents[algo] = {
+            key: fit_exponent([row['nops'] for row in algo_rows], [row[key] for row in algo_rows])
+            for key in ('construction', 'time_per_FE', 'peak_memory', 'edges')
+        }
+    return rows, exponents
+
+
+if __name__ == '__main__':
+    import argparse
+    import csv
+
+    parser = argparse.ArgumentParser(description="Scaling benchmark of the FPP algorithms")
+    parser.add_argument('--algos', type=str, nargs='+', default=list(ENCODINGS), choices=list(ENCODINGS),
+                        help='Algorithms to measure')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 50, 100, 200, 400, 800],
+                        help='Numbers of operations')
+    parser.add_argument('--degree', type=float, default=3, help='Average number of direct priors of an operation')
+    parser.add_argument('--objective', type=str, default='cost', choices=['cost', 'time'], help='Objective')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--min_time', type=float, default=0.2, help='Minimum measuring time of an evaluator (s)')
+    parser.add_argument('--time_limit', type=float, default=60, help='Skip larger sizes once a measurement exceeds this (s)')
+    parser.add_argument('--output', type=str, default=None, help='CSV file of the measurements')
+
+    args = parser.parse_args()
+    rows, exponents = scaling(args.algos, args.sizes, degree=args.degree, objective=args.objective, seed=args.seed,
+                              min_time=args.min_time, time_limit=args.time_limit)
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    print('Fitted exponents (value ~ nops ^ k):')
+    for algo, fitted in exponents.items():
+        print(algo + ': ' + ', '.join(key + ' = ' + ('-' if k is None else format(k, '.2f')) for key, k in fitted.items()))
@@ -1,19 +1,63 @@
-import ACO
-import FSDPSO
-import ESGA
-import HEA
-import SLHS
-import TS_VNS
-import IFSDPSO
-import IESGA
-import ISLHS
-import FPP_cases
-
-
-def solve_FPP(algo='TS-VNS', case_idx=1):
-    specifications = FPP_cases.load_case(case_idx)
+import importlib
+import time
+
+# algorithm name -> module implementing it; modules are imported on first use
+ALGORITHMS = {
+    'ACO': 'ACO',
+    'FSDPSO': 'FSDPSO',
+    'ESGA': 'ESGA',
+    'HEA': 'HEA',
+    'SLHS': 'SLHS',
+    'TS-VNS': 'TS_VNS',
+    'IFSDPSO': 'IFSDPSO',
+    'IESGA': 'IESGA',
+    'ISLHS': 'ISLHS',
+    'DP': 'DP',
+    'BnB': 'BnB',
+}
+
+
+def load_algorithm(algo):
+    # import the module of the requested algorithm only
+    if algo not in ALGORITHMS:
+        raise ValueError("Invalid algorithm name.")
+    return importlib.import_module(ALGORITHMS[algo])
+
+
+def run_FPP(algo, specifications, cache=None, bound=True, checkpoint=None, resume=False, init=None, top_k=None):
+    """
+    Solve an FPP case with an algorithm.
+    :param algo: the algorithm
+    :param specifications: the specifications of FPP
+    :param cache: the path of the persistent evaluation cache (None: no cache)
+    :param bound: whether to compute the lower bound (the algorithms stop once their incumbent reaches it, except
+        when collecting the top_k plans)
+    :param checkpoint: the path of the checkpoint file of the metaheuristics (None: no checkpoints)
+    :param resume: whether to resume from the checkpoint file
+    :param init: the initial process plans (e.g., the best plan before a change of the case; not used by DP)
+    :param top_k: the number of best distinct process plans to collect, plans being distinct if they assign different
+        sets of (operation, machine, tool, direction) states (TS-VNS only; None: only the best plan)
+    :return: the result: the best objective, the best process plan, the convergence FE (None for the exact algorithms),
+        the runtime, the lower bound (if computed; the best objective if DP or BnB proved it optimal), the search
+        statistics of the exact algorithms, and the top_k (objective, process plan) pairs (if top_k)
+    """
+    if top_k and algo != 'TS-VNS':
+        raise ValueError('The top-k process plans are only collected by TS-VNS.')
+    module = load_algorithm(algo)
+    result = {}
+    exact = False  # whether the best objective is proven optimal by an exact algorithm
+    specifications = dict(specifications)  # the cache and the lower bound are added to a copy, not to the caller's
+    if cache:
+        # the persistent evaluation cache consulted by the graph-based evaluators (TS-VNS, IFSDPSO, IESGA, ISLHS)
+        import FPP_cache
+        specifications['cache'] = FPP_cache.EvaluationCache(cache)
+    if bound:
+        # the lower bound: the algorithms stop once their incumbent reaches it (a certificate of optimality)
+        import FPP_bounds
+        specifications['lower_bound'] = FPP_bounds.cal_lower_bound(specifications)
     maxFE = 1000 * len(specifications['operations'])
-    
+    start = time.perf_counter()
+
     if algo == 'ACO':
         """
         Ant colony optimization
@@ -31,8 +75,12 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - beta: heuristic importance (default = 2)
             - tau0: initial pheromone value (default = 100)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = ACO.main(npop=100, maxFE=maxFE, rho=0.1, W=100, alpha=1, beta=2, tau0=100, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(npop=100, maxFE=maxFE, rho=0.1, W=100, alpha=1, beta=2, tau0=100, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
 
     elif algo == 'FSDPSO':
         """
@@ -51,8 +99,12 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - k1: the first parameter in adaptive mutation probability (default = 0.5)
             - k2: the second parameter in adaptive mutation probability (default = 0.005)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = FSDPSO.main(npop=500, maxFE=maxFE, c1=2, c2=2, w=0.9, k1=0.5, k2=0.005, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(npop=500, maxFE=maxFE, c1=2, c2=2, w=0.9, k1=0.5, k2=0.005, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
 
     elif algo == 'ESGA':
         """
@@ -68,8 +120,12 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - pc: crossover probability (default = 0.8)
             - pm: mutation probability (default = 0.2)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = ESGA.main(npop=150, maxFE=maxFE, pc=0.8, pm=0.2, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(npop=150, maxFE=maxFE, pc=0.8, pm=0.2, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
         
     elif algo == 'HEA':
         """
@@ -87,8 +143,12 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - T0: the initial temperature for simulated annealing (default = 1000)
             - alpha: cooling rate (default = 0.99)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = HEA.main(npop=400, maxFE=maxFE, pc=0.8, pm=0.1, T0=1000, alpha=0.99, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(npop=400, maxFE=maxFE, pc=0.8, pm=0.1, T0=1000, alpha=0.99, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
     
     elif algo == 'SLHS':
         """
@@ -102,8 +162,12 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - hms: harmony memory size (default = 10)
             - maxFE: the maximum function evaluations (default = 1000 * the number of operations)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = SLHS.main(hms=10, maxFE=maxFE, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(hms=10, maxFE=maxFE, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
     
     elif algo == 'TS-VNS':
         """
@@ -112,8 +176,21 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
         Parameters:
             - maxFE: the maximum function evaluations (default = 1000 * the number of operations)
             - specifications: the specifications of FPP
+            - memo_size: the maximum number of sequences in the in-run evaluation memo (default = 20000)
+            - memo_counts_FE: whether a repeat visit answered by the memo counts as a function evaluation (default = True)
+            - dont_look_bits: whether local search skips positions whose neighbourhood has not changed (default = False)
+            - strategy: the local search strategy, 'best', 'first', 'random-first', or 'sampled' (default = 'best')
+            - sample_size: the number of sampled moves per neighbourhood of the 'sampled' strategy (default = 100)
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
+            - top_k: the number of best distinct process plans collected over the search (default = None, the best plan only)
         """
-        best_obj, best_sol, conFE = TS_VNS.main(maxFE=maxFE, specifications=specifications)
+        output = module.main(maxFE=maxFE, specifications=specifications, memo_size=20000, memo_counts_FE=True, dont_look_bits=False, strategy='best', sample_size=100, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init, top_k=top_k)
+        best_obj, best_sol, conFE = output[:3]
+        if top_k:
+            result['top_plans'] = output[3]
     
     elif algo == 'IFSDPSO':
         """
@@ -128,8 +205,12 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - k1: the first parameter in adaptive mutation probability (default = 0.5)
             - k2: the second parameter in adaptive mutation probability (default = 0.005)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = IFSDPSO.main(npop=500, maxFE=maxFE, c1=2, c2=2, w=0.9, k1=0.5, k2=0.005, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(npop=500, maxFE=maxFE, c1=2, c2=2, w=0.9, k1=0.5, k2=0.005, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
     
     elif algo == 'IESGA':
         """
@@ -139,8 +220,12 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - npop: population size (default = 150)
             - maxFE: the maximum function evaluations (default = 1000 * the number of operations)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = IESGA.main(npop=150, maxFE=maxFE, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(npop=150, maxFE=maxFE, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
         
     elif algo == 'ISLHS':
         """
@@ -150,24 +235,169 @@ def solve_FPP(algo='TS-VNS', case_idx=1):
             - hms: harmony memory size (default = 10)
             - maxFE: the maximum function evaluations (default = 1000 * the number of operations)
             - specifications: the specifications of FPP
+            - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+            - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+            - resume: whether to resume from the checkpoint file if it exists (default = False)
+            - init: the initial process plans, repaired to the case (default = None, random initial solutions)
         """
-        best_obj, best_sol, conFE = ISLHS.main(hms=10, maxFE=maxFE, specifications=specifications)
+        best_obj, best_sol, conFE = module.main(hms=10, maxFE=maxFE, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
 
-    else:
-        raise ValueError("Invalid algorithm name.")
-    
+    elif algo == 'DP':
+        """
+        Exact bitmask dynamic programming over the scheduled operations and the last resources (small cases)
+
+        Parameters:
+            - specifications: the specifications of FPP
+            - memory_limit: the memory budget of the stored DP layers in MB (default = 1024)
+        """
+        import tracemalloc
+        tracemalloc.start()
+        best_obj, best_sol, result['bitmasks'], exact = module.main(specifications=specifications, memory_limit=1024)
+        result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        conFE = None
+
+    elif algo == 'BnB':
+        """
+        Depth-first branch-and-bound over feasible prefixes with DP-evaluated partial costs (medium cases)
+
+        Parameters:
+            - specifications: the specifications of FPP
+            - incumbent_FE: the function evaluations of the TS-VNS run providing the initial upper bound (default = 100 * the number of operations)
+            - max_nodes: the maximum number of nodes (default = None, unlimited)
+            - time_limit: the maximum runtime in seconds (default = None, unlimited)
+            - max_dominance: the maximum number of prefixes stored for the dominance check (default = 1000000)
+            - init: the initial process plans starting the TS-VNS run, repaired to the case (default = None)
+        """
+        best_obj, best_sol, result['nodes'], exact = module.main(specifications=specifications, incumbent_FE=maxFE // 10, max_nodes=None, time_limit=None, max_dominance=1000000, init=init)
+        conFE = None
+
+    result.update(best_obj=best_obj, best_sol=best_sol, conFE=conFE, runtime=time.perf_counter() - start)
+    if cache:
+        specifications['cache'].close()
+    if bound:
+        # the optimum of an exact algorithm is its own certificate of optimality
+        result['lower_bound'] = best_obj if exact else specifications['lower_bound']
+    return result
+
+
+def solve_FPP(algo='TS-VNS', case_idx=1, cache=None, bound=True, checkpoint=None, resume=False, init=None, delta=None,
+              top_k=None):
+    import FPP_cases
+    import FPP_bounds
+    specifications = FPP_cases.load_case(case_idx, delta)
+    result = run_FPP(algo, specifications, cache, bound, checkpoint, resume, init, top_k)
+    best_obj = result['best_obj']
+
+    if 'bitmasks' in result:
+        print('The number of expanded bitmasks: ' + str(result['bitmasks']))
+        print('The runtime: ' + format(result['runtime'], '.2f') + ' s, the peak memory: ' + format(result['peak_memory'] / 1024 / 1024, '.1f') + ' MB')
+    if 'nodes' in result:
+        print('The number of explored nodes: ' + str(result['nodes']) + ' (' + format(result['nodes'] / result['runtime'], '.0f') + ' nodes/s)')
+        print('The runtime: ' + format(result['runtime'], '.2f') + ' s')
     print('The best objective: ' + str(best_obj))
-    print('The best process plan: ' + str(best_sol))
-    print('The convergence iteration: ' + str(conFE))
+    print('The best process plan: ' + str(result['best_sol']))
+    if result['conFE'] is not None:
+        print('The convergence iteration: ' + str(result['conFE']))
+    if 'top_plans' in result:
+        print('The ' + str(len(result['top_plans'])) + ' best process plans:')
+        for obj, plan in result['top_plans']:
+            print(str(obj) + ': ' + str(plan))
+    if bound:
+        lower_bound = result['lower_bound']
+        if best_obj <= lower_bound:
+            print('The lower bound: ' + str(lower_bound) + ' (the best objective is optimal)')
+        else:
+            print('The lower bound: ' + str(lower_bound) + ' (gap: ' + format(FPP_bounds.cal_gap(best_obj, lower_bound), '.2%') + ')')
+
+
+def solve_pareto(cost_idx=9, time_idx=10, checkpoint=None, resume=False, init=None):
+    """
+    Solve the cost and time cases of a part for both objectives (the Pareto front).
+    :param cost_idx: the index of the cost case
+    :param time_idx: the index of the time case of the same part
+    :param checkpoint: the path of the checkpoint file (None: no checkpoints)
+    :param resume: whether to resume from the checkpoint file
+    :param init: the initial process plans (in addition to the best plans of TS-VNS on each case)
+    :return: the (cost, time, process plan) of each non-dominated plan found, by ascending cost
+    """
+    import FPP_cases
+    import FPP_pareto
+    cost_specifications = FPP_cases.load_case(cost_idx)
+    time_specifications = FPP_cases.load_case(time_idx)
+    specifications = FPP_pareto.combine_specifications(cost_specifications, time_specifications)
+    maxFE = 1000 * len(specifications['operations'])
+    start = time.perf_counter()
+    init = list(init or [])
+    if not resume:
+        # the extremes of the front: the best plans of TS-VNS on each case (the first stage)
+        TS_VNS = load_algorithm('TS-VNS')
+        for objective_specifications in (cost_specifications, time_specifications):
+            init.append(TS_VNS.main(maxFE=maxFE // 10, specifications=objective_specifications)[1])
+
+    """
+    Non-dominated sorting genetic algorithm on the operators of HEA
+
+    Reference:
+        Deb K, Pratap A, Agarwal S, et al. A fast and elitist multiobjective genetic algorithm: NSGA-II[J]. IEEE
+        Transactions on Evolutionary Computation, 2002, 6(2): 182-197.
+
+    Parameters:
+        - npop: population size (default = 200)
+        - maxFE: the maximum function evaluations (default = 1000 * the number of operations)
+        - pc: crossover probability (default = 0.8)
+        - pm: mutation probability (default = 0.1)
+        - T0: the initial temperature for simulated annealing, relative to the objective ranges (default = 1)
+        - alpha: cooling rate (default = 0.99)
+        - specifications: the specifications of the bi-objective FPP
+        - checkpoint: the path of the checkpoint file (default = None, no checkpoints)
+        - checkpoint_interval: the minimum time between two checkpoints in seconds (default = 60)
+        - resume: whether to resume from the checkpoint file if it exists (default = False)
+        - init: the initial process plans, repaired for each objective (default = the best plans of TS-VNS)
+    """
+    import NSGA
+    front = NSGA.main(npop=200, maxFE=maxFE, pc=0.8, pm=0.1, T0=1, alpha=0.99, specifications=specifications, checkpoint=checkpoint, checkpoint_interval=60, resume=resume, init=init)
+
+    print('The Pareto front (' + str(len(front)) + ' plans, ' + format(time.perf_counter() - start, '.2f') + ' s):')
+    for cost, process_time, plan in front:
+        print('cost: ' + str(cost) + ', time: ' + str(process_time) + ', plan: ' + str(plan))
+    return front
 
 
 if __name__ == '__main__':
     import argparse
+    import json
 
     parser = argparse.ArgumentParser(description="Solve the flexible process planning problem")
-    parser.add_argument('--algo', type=str, default='TS-VNS', help='Algorithm to use')
+    parser.add_argument('--algo', type=str, default='TS-VNS', choices=list(ALGORITHMS), help='Algorithm to use')
     parser.add_argument('--case_idx', type=int, default=1, help='Case index to solve')
+    parser.add_argument('--cache', type=str, default=None, help='Path of the persistent evaluation cache (SQLite)')
+    parser.add_argument('--no_bound', action='store_true', help='Do not compute the lower bound (no early stop)')
+    parser.add_argument('--checkpoint', type=str, default=None, help='Path of the checkpoint file (metaheuristics only)')
+    parser.add_argument('--resume', action='store_true', help='Resume from the checkpoint file if it exists')
+    parser.add_argument('--init', type=str, default=None,
+                        help='JSON file of the initial process plan (or a list of plans) to warm-start from')
+    parser.add_argument('--delta', type=str, default=None,
+                        help='JSON file of the change of the case (removed machines/tools, changed costs)')
+    parser.add_argument('--top_k', type=int, default=None,
+                        help='Number of best process plans with distinct state assignments to report (TS-VNS only)')
+    parser.add_argument('--pareto', type=int, default=None,
+                        help='Time case of the part of --case_idx (a cost case): solve both objectives with NSGA')
 
     args = parser.parse_args()
-    print(f"Solving FPP case {args.case_idx} using the {args.algo} algorithm.")
-    solve_FPP(args.algo, args.case_idx)
+    init = delta = None
+    if args.init:
+        with open(args.init, encoding='utf-8') as f:
+            init = json.load(f)
+        if init and isinstance(init[0], str):
+            init = [init]  # a single plan
+    if args.delta:
+        with open(args.delta, encoding='utf-8') as f:
+            delta = json.load(f)
+    if args.pareto is not None:
+        print(f"Solving FPP cases {args.case_idx} (cost) and {args.pareto} (time) for the Pareto front.")
+        solve_pareto(args.case_idx, args.pareto, args.checkpoint, args.resume, init)
+    else:
+        print(f"Solving FPP case {args.case_idx} using the {args.algo} algorithm.")
+        solve_FPP(args.algo, args.case_idx, args.cache, not args.no_bound, args.checkpoint, args.resume, init, delta,
+                  args.top_k)
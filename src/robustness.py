@@ -0,0 +1,133 @@
+# The robustness of a process plan under the unavailability of machines and tools
+# For a fixed operation sequence, the resource assignment is the shortest path through the graph of TS-VNS
+# (construct_graph), whose layers are the states of consecutive operations. An availability scenario removes the states
+# on its unavailable machines and tools, so the shortest paths of a whole batch of scenarios are found at once by a
+# layered dynamic program over stacked arrays (one row per scenario). A scenario leaving an operation without any
+# available state is infeasible.
+import numpy as np
+from TS_VNS import construct_graph
+
+
+def graph_layers(sol, specifications):
+    # the states, (machine, tool) arrays, and edge weights from the previous layer of each layer of the graph of a
+    # sequence (the weights of the first layer are the usages, as from the source)
+    group_states = specifications['group_states']  # the non-dominated states of each operation and its alternatives
+    graph = construct_graph(sol, specifications)
+    layers = []
+    previous = ['s']
+    for op in sol[1: -1]:
+        states, m, t, _, _ = zip(*group_states[op])
+        weights = np.array([[graph[state1][state2] for state2 in states] for state1 in previous], dtype=float)
+        layers.append((list(states), np.array(m), np.array(t), weights))
+        previous = states
+    return layers
+
+
+def scenario_masks(specifications, machines=(), tools=()):
+    # the availability masks of a scenario with the given unavailable machines and tools
+    machine_names = specifications['compiled']['machines'].tolist()
+    tool_names = specifications['compiled']['tools'].tolist()
+    return np.isin(machine_names, list(machines), invert=True), np.isin(tool_names, list(tools), invert=True)
+
+
+def single_failures(specifications):
+    # the scenarios of a single unavailable machine or tool: the names of the unavailable resources, and the machine and
+    # tool availability masks
+    machine_names = specifications['compiled']['machines'].tolist()
+    tool_names = specifications['compiled']['tools'].tolist()
+    names = machine_names + tool_names
+    available = ~np.eye(len(names), dtype=bool)
+    return names, available[:, :len(machine_names)], available[:, len(machine_names):]
+
+
+def random_scenarios(specifications, num, p):
+    # the scenarios where each machine and tool is unavailable with probability p (the machine and tool masks)
+    nmachines = len(specifications['compiled']['machines'])
+    ntools = len(specifications['compiled']['tools'])
+    return np.random.random((num, nmachines)) >= p, np.random.random((num, ntools)) >= p
+
+
+def evaluate_scenarios(sol, specifications, machine_available, tool_available, return_plans=False, chunk=10000000):
+    """
+    Evaluate an operation sequence under a batch of availability scenarios.
+    :param sol: the operation sequence ('s', operations, 'd', as in TS-VNS)
+    :param specifications: the specifications of FPP
+    :param machine_available: the machine availability masks (one row per scenario, one column per machine, in the
+        order of specifications['compiled']['machines'])
+    :param tool_available: the tool availability masks (one row per scenario, one column per tool)
+    :param return_plans: whether to return the process plan of each scenario
+    :param chunk: the maximum number of elements of a batched layer relaxation
+    :return: the objective of each scenario (inf if infeasible), the infeasibility flags, and the process plans (None
+        for an infeasible scenario) if return_plans
+    """
+    machine_available = np.atleast_2d(np.asarray(machine_available, dtype=bool))
+    tool_available = np.atleast_2d(np.asarray(tool_available, dtype=bool))
+    nscenarios = len(machine_available)
+    costs = np.zeros((nscenarios, 1))  # the shortest path to each state of the current layer (the source first)
+    pointers = []  # the back pointers of each layer
+    for states, m, t, weights in graph_layers(sol, specifications):
+        available = machine_available[:, m] & tool_available[:, t]
+        new_costs = np.empty((nscenarios, len(states)))
+        new_pointers = np.empty((nscenarios, len(states)), dtype=np.int64)
+        rows = max(1, chunk // weights.size)
+        for start in range(0, nscenarios, rows):
+            block = slice(start, start + rows)
+            total = costs[block, :, None] + weights
+            new_pointers[block] = total.argmin(axis=1)
+            new_costs[block] = np.take_along_axis(total, new_pointers[block][:, None, :], axis=1)[:, 0]
+        new_costs[~available] = np.inf  # the states on unavailable resources
+        costs = new_costs
+        pointers.append((states, new_pointers))
+
+    idx = costs.argmin(axis=1)
+    objs = costs[np.arange(nscenarios), idx]
+    infeasible = np.isinf(objs)
+    if not return_plans:
+        return objs, infeasible
+    plan_idx = []
+    for states, new_pointers in reversed(pointers):
+        plan_idx.append([states[i] for i in idx])
+        idx = new_pointers[np.arange(nscenarios), idx]
+    plans = [None if infeasible[k] else [layer[k] for layer in reversed(plan_idx)] for k in range(nscenarios)]
+    return objs, infeasible, plans
+
+
+if __name__ == '__main__':
+    import argparse
+    import json
+    import FPP_cases
+
+    parser = argparse.ArgumentParser(description="Robustness of an FPP plan under unavailable machines and tools")
+    parser.add_argument('--case_idx', type=int, default=1, help='Case index')
+    parser.add_argument('--plan', type=str, default=None,
+                        help='JSON file of the process plan whose sequence is evaluated (default: the plan of TS-VNS)')
+    parser.add_argument('--scenarios', type=int, default=10000, help='Number of random scenarios')
+    parser.add_argument('--p', type=float, default=0.1, help='Probability that each machine or tool is unavailable')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed')
+
+    args = parser.parse_args()
+    if args.seed is not None:
+        np.random.seed(args.seed)
+    specifications = FPP_cases.load_case(args.case_idx)
+    if args.plan:
+        with open(args.plan, encoding='utf-8') as f:
+            plan = json.load(f)
+    else:
+        import TS_VNS
+        _, plan, _ = TS_VNS.main(1000 * len(specifications['operations']), specifications)
+    sol = ['s'] + [state.split('&')[0] for state in plan] + ['d']  # the states of each operation cover its group
+    base_obj = evaluate_scenarios(sol, specifications, *scenario_masks(specifications))[0][0]
+    print('The objective with all resources available: ' + str(base_obj))
+
+    names, machine_available, tool_available = single_failures(specifications)
+    objs, infeasible = evaluate_scenarios(sol, specifications, machine_available, tool_available)
+    print('A single unavailable resource:')
+    for name, obj, flag in zip(names, objs, infeasible):
+        print(name + ': ' + ('infeasible' if flag else str(obj.item()) + ' (+' + format(obj - base_obj, '.6g') + ')'))
+
+    machine_available, tool_available = random_scenarios(specifications, args.scenarios, args.p)
+    objs, infeasible = evaluate_scenarios(sol, specifications, machine_available, tool_available)
+    feasible = objs[~infeasible]
+    print(str(args.scenarios) + ' random scenarios (p = ' + str(args.p) + '): ' + format(infeasible.mean(), '.2%') +
+          ' infeasible' + ('' if not feasible.size else ', objective mean ' + format(feasible.mean(), '.6g') +
+                           ', 95th percentile ' + format(np.percentile(feasible, 95), '.6g')))
@@ -0,0 +1,160 @@
+# The sensitivity sweep over the changeover parameters
+# For a fixed operation sequence, the resource assignment of TS-VNS is a shortest path through the states of consecutive
+# positions, whose edge weights are linear in the changeover parameters (the machine, tool, and setup change costs of
+# cost cases, or the tool and setup change times of time cases). A set of candidate sequences is evaluated over a whole
+# grid of parameters at once: each layer of the path is relaxed by a min-plus product batched over the grid points, and
+# the best plan of each grid point is recovered from the back pointers.
+import itertools
+import numpy as np
+
+PARAMETERS = {'cost': ('mcc', 'tcc', 'scc'), 'time': ('tct', 'sct')}  # the swept parameters of each objective
+
+
+def parameter_grid(values):
+    # the grid of all combinations of the parameter values (one row per grid point)
+    return np.array(list(itertools.product(*values)), dtype=float)
+
+
+def with_parameters(specifications, point):
+    # the specifications with the changeover parameters of a grid point (without the cache and the lower bound, which
+    # belong to the original parameters)
+    names = PARAMETERS[specifications['type']['objective']]
+    result = {key: value for key, value in specifications.items() if key not in ('cache', 'lower_bound')}
+    result.update(zip(names, point))
+    changeover = dict(specifications['changeover'])
+    if specifications['type']['objective'] == 'cost':
+        mcc, changeover['tool'], changeover['setup'] = point
+        machine = specifications['changeover']['machine']
+        changeover['machine'] = [[0 if i == j else mcc for j in range(len(machine))] for i in range(len(machine))]
+    else:
+        changeover['tool'], changeover['setup'] = point
+    result['changeover'] = changeover
+    return result
+
+
+def sequence_layers(sol, specifications):
+    # the states of each position of a sequence ('s', operations, 'd') and their machine, tool, direction, usage arrays
+    group_states = specifications['group_states']  # the non-dominated states of each operation and its alternatives
+    layers = []
+    for op in sol[1: -1]:
+        states, m, t, d, usage = zip(*group_states[op])
+        layers.append((list(states), np.array(m), np.array(t), np.array(d), np.array(usage, dtype=float)))
+    return layers
+
+
+def sweep_sequence(sol, specifications, grid, chunk=10000000):
+    """
+    Evaluate an operation sequence at every point of a parameter grid.
+    :param sol: the operation sequence ('s', operations, 'd', as in TS-VNS)
+    :param specifications: the specifications of FPP
+    :param grid: the parameter grid (one row per grid point, one column per parameter of PARAMETERS)
+    :param chunk: the maximum number of elements of a batched min-plus product
+    :return: the objective and the process plan of the sequence at each grid point
+    """
+    cost_case = specifications['type']['objective'] == 'cost'
+    machine = np.array(specifications['changeover']['machine'], dtype=float)
+    layers = sequence_layers(sol, specifications)
+    npoints = len(grid)
+    costs = np.tile(layers[0][4], (npoints, 1))  # the cheapest path to each state of the current position
+    pointers = []  # the back pointers of each position
+    for (_, m1, t1, d1, _), (states, m2, t2, d2, usage) in zip(layers[:-1], layers[1:]):
+        m_change = m1[:, None] != m2[None, :]
+        events = [m_change | (t1[:, None] != t2[None, :]), m_change | (d1[:, None] != d2[None, :])]  # tool, setup
+        base = usage[None, :] + (0 if cost_case else machine[m1[:, None], m2[None, :]])
+        if cost_case:
+            events.insert(0, m_change)
+        events = np.array(events, dtype=float)  # one indicator matrix per parameter
+        new_costs = np.empty((npoints, len(states)))
+        new_pointers = np.empty((npoints, len(states)), dtype=np.int64)
+        rows = max(1, chunk // events[0].size)
+        for start in range(0, npoints, rows):
+            block = slice(start, start + rows)
+            # the min-plus product of the costs and the edge weights at each grid point of the block
+            total = costs[block, :, None] + base + np.tensordot(grid[block], events, axes=1)
+            new_pointers[block] = total.argmin(axis=1)
+            new_costs[block] = np.take_along_axis(total, new_pointers[block][:, None, :], axis=1)[:, 0]
+        costs = new_costs
+        pointers.append(new_pointers)
+
+    # recover the plan of each grid point
+    idx = costs.argmin(axis=1)
+    objs = costs[np.arange(npoints), idx]
+    plan_idx = [idx]
+    for new_pointers in reversed(pointers):
+        idx = new_pointers[np.arange(npoints), idx]
+        plan_idx.append(idx)
+    plan_idx.reverse()
+    plans = [[layers[k][0][plan_idx[k][g]] for k in range(len(layers))] for g in range(npoints)]
+    return objs, plans
+
+
+def candidate_sequences(specifications, grid, nsolve=5, maxFE=None):
+    # the best sequences found by TS-VNS at nsolve grid points spread over the grid
+    import TS_VNS
+    if maxFE is None:
+        maxFE = 1000 * len(specifications['operations'])
+    sequences = []
+    for g in np.unique(np.linspace(0, len(grid) - 1, min(nsolve, len(grid))).round().astype(int)):
+        _, plan, _ = TS_VNS.main(maxFE, with_parameters(specifications, grid[g].tolist()))
+        sequence = ['s'] + [state.split('&')[0] for state in plan] + ['d']
+        if sequence not in sequences:
+            sequences.append(sequence)
+    return sequences
+
+
+def sensitivity_sweep(specifications, grid, sequences=None, nsolve=5, maxFE=None):
+    """
+    Find the best plan of the candidate sequences at every point of a parameter grid.
+    :param specifications: the specifications of FPP
+    :param grid: the parameter grid (one row per grid point, one column per parameter of PARAMETERS)
+    :param sequences: the candidate operation sequences (None: the sequences found by TS-VNS at nsolve grid points)
+    :param nsolve: the number of grid points solved by TS-VNS for the candidate sequences
+    :param maxFE: the maximum function evaluations of each TS-VNS run (None: 1000 * the number of operations)
+    :return: the best objective, the index of its candidate sequence, and its process plan at each grid point, and the
+        candidate sequences
+    """
+    if sequences is None:
+        sequences = candidate_sequences(specifications, grid, nsolve, maxFE)
+    results = [sweep_sequence(sol, specifications, grid) for sol in sequences]
+    objs = np.array([sequence_objs for sequence_objs, _ in results])
+    best = objs.argmin(axis=0)
+    best_objs = objs[best, np.arange(len(grid))]
+    best_plans = [results[best[g]][1][g] for g in range(len(grid))]
+    return best_objs, best, best_plans, sequences
+
+
+if __name__ == '__main__':
+    import argparse
+    import csv
+    import json
+    import FPP_cases
+
+    parser = argparse.ArgumentParser(description="Sensitivity sweep of the FPP plans over the changeover parameters")
+    parser.add_argument('--case_idx', type=int, default=1, help='Case index to sweep')
+    for name in PARAMETERS['cost'] + PARAMETERS['time']:
+        parser.add_argument('--' + name, type=float, nargs='+', default=None,
+                            help='Values of ' + name + ' (default: the value of the case)')
+    parser.add_argument('--solves', type=int, default=5, help='Number of grid points solved for candidate sequences')
+    parser.add_argument('--output', type=str, default=None, help='CSV file of the best plan at each grid point')
+
+    args = parser.parse_args()
+    specifications = FPP_cases.load_case(args.case_idx)
+    names = PARAMETERS[specifications['type']['objective']]
+    values = [getattr(args, name) or [specifications[name]] for name in names]
+    grid = parameter_grid(values)
+    best_objs, best, best_plans, sequences = sensitivity_sweep(specifications, grid, nsolve=args.solves)
+    print('Swept ' + str(len(grid)) + ' grid points with ' + str(len(sequences)) + ' candidate sequences: ' +
+          str(len({tuple(plan) for plan in best_plans})) + ' distinct best plans.')
+    rows = []
+    for g in range(len(grid)):
+        row = dict(zip(names, grid[g].tolist()))
+        row.update(objective=best_objs[g].item(), sequence=best[g].item(), plan=json.dumps(best_plans[g]))
+        rows.append(row)
+    if args.output:
+        with open(args.output, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        for row in rows:
+            print(', '.join(key + ': ' + str(value) for key, value in row.items()))